@@ -1,8 +1,4 @@
 """BST specific challenges."""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from data_structures.bst import BinarySearchTree
 from challenges.challenge_manager import Challenge
 
@@ -16,6 +12,31 @@ class BuildBalancedBSTChallenge(Challenge):
     # TODO: add step-by-step visualization showing how the tree is built
     # currently just shows final result
 
+    SORTED_ARRAY = (1, 2, 3, 4, 5, 6, 7)
+
+    SOLUTION_STEPS = """Solution:
+1. Use the middle element of sorted array as root
+2. Recursively build left subtree from left half
+3. Recursively build right subtree from right half
+
+For array [1,2,3,4,5,6,7]:
+- Middle = 4 (root)
+- Left half [1,2,3]: middle = 2 (left child of 4)
+  - Left of 2: 1
+  - Right of 2: 3
+- Right half [5,6,7]: middle = 6 (right child of 4)
+  - Left of 6: 5
+  - Right of 6: 7
+
+Result: Balanced tree with height = 3
+        4
+       / \\
+      2   6
+     / \\ / \\
+    1  3 5  7
+
+Use: BinarySearchTree.build_balanced_from_sorted([1,2,3,4,5,6,7])"""
+
     def __init__(self):
         """Initialize balanced BST challenge."""
         super().__init__(
@@ -24,7 +45,6 @@ class BuildBalancedBSTChallenge(Challenge):
             goal="Create a balanced tree with minimal height",
             hint="Use build_balanced_from_sorted() static method with the sorted array."
         )
-        self.sorted_array = [1, 2, 3, 4, 5, 6, 7]
 
     def setup(self) -> BinarySearchTree:
         """
@@ -45,9 +65,8 @@ class BuildBalancedBSTChallenge(Challenge):
         Returns:
             True if BST is balanced with correct elements
         """
-        # Check if all elements are present
-        inorder = bst.inorder_traversal()
-        if sorted(inorder) != self.sorted_array:
+        # Check if all elements are present (inorder of a BST is already sorted)
+        if tuple(bst.inorder_traversal()) != self.SORTED_ARRAY:
             return False
 
         # Check if tree is balanced (height difference check)
@@ -71,18 +90,13 @@ class BuildBalancedBSTChallenge(Challenge):
         Returns:
             True if balanced
         """
-        def get_height(n):
-            if n is None:
-                return 0
-            left_height = get_height(n.left)
-            right_height = get_height(n.right)
-            if left_height == -1 or right_height == -1:
-                return -1
-            if abs(left_height - right_height) > 1:
-                return -1
-            return max(left_height, right_height) + 1
-
-        return get_height(node) != -1
+        # Heights are cached on each TreeNode, so no subtree is re-measured
+        if node is None:
+            return True
+        height = BinarySearchTree._height
+        if abs(height(node.left) - height(node.right)) > 1:
+            return False
+        return self._is_balanced(node.left) and self._is_balanced(node.right)
 
     def get_solution_steps(self) -> str:
         """
@@ -91,25 +105,4 @@ class BuildBalancedBSTChallenge(Challenge):
         Returns:
             Solution steps
         """
-        return """Solution:
-1. Use the middle element of sorted array as root
-2. Recursively build left subtree from left half
-3. Recursively build right subtree from right half
-
-For array [1,2,3,4,5,6,7]:
-- Middle = 4 (root)
-- Left half [1,2,3]: middle = 2 (left child of 4)
-  - Left of 2: 1
-  - Right of 2: 3
-- Right half [5,6,7]: middle = 6 (right child of 4)
-  - Left of 6: 5
-  - Right of 6: 7
-
-Result: Balanced tree with height = 3
-        4
-       / \\
-      2   6
-     / \\ / \\
-    1  3 5  7
-
-Use: BinarySearchTree.build_balanced_from_sorted([1,2,3,4,5,6,7])"""
+        return self.SOLUTION_STEPS
@@ -1,8 +1,15 @@
 """Challenge manager - coordinates challenge mode across data structures."""
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Sequence
 from abc import ABC, abstractmethod
 
 
+# Data structure types that challenges can be registered for
+DS_TYPES = ('stack', 'queue', 'linked_list', 'bst')
+
+# Shared result for unknown data structure types
+_EMPTY: tuple = ()
+
+
 class Challenge(ABC):
     """
     Abstract base class for all challenges.
@@ -75,14 +82,10 @@ class ChallengeManager:
 
     def __init__(self):
         """Initialize challenge manager."""
-        self.challenges: Dict[str, list] = {
-            'stack': [],
-            'queue': [],
-            'linked_list': [],
-            'bst': []
-        }
+        self.challenges: Dict[str, list] = {ds_type: [] for ds_type in DS_TYPES}
         self.active_challenge: Optional[Challenge] = None
         self.ds_type: Optional[str] = None
+        self._active_info: Optional[Dict[str, str]] = None
 
     def register_challenge(self, ds_type: str, challenge: Challenge) -> None:
         """
@@ -91,11 +94,13 @@ class ChallengeManager:
         Args:
             ds_type: Data structure type ('stack', 'queue', 'linked_list', 'bst')
             challenge: Challenge instance
+
+        Raises:
+            KeyError: If ds_type is not one of DS_TYPES
         """
-        if ds_type in self.challenges:
-            self.challenges[ds_type].append(challenge)
+        self.challenges[ds_type].append(challenge)
 
-    def get_challenges(self, ds_type: str) -> list:
+    def get_challenges(self, ds_type: str) -> Sequence[Challenge]:
         """
         Get all challenges for a data structure type.
 
@@ -103,9 +108,9 @@ class ChallengeManager:
             ds_type: Data structure type
 
         Returns:
-            List of challenges
+            List of challenges (empty for unknown types)
         """
-        return self.challenges.get(ds_type, [])
+        return self.challenges.get(ds_type, _EMPTY)
 
     def start_challenge(self, ds_type: str, challenge_index: int) -> Optional[Any]:
         """
@@ -122,6 +127,7 @@ class ChallengeManager:
         if 0 <= challenge_index < len(challenges):
             self.active_challenge = challenges[challenge_index]
             self.ds_type = ds_type
+            self._active_info = None
             return self.active_challenge.setup()
         return None
 
@@ -146,14 +152,17 @@ class ChallengeManager:
         Returns:
             Dictionary with challenge info, or None if no active challenge
         """
-        if self.active_challenge:
-            return {
+        if self.active_challenge is None:
+            return None
+        # The info is fixed while a challenge is active, so build it once
+        if self._active_info is None:
+            self._active_info = {
                 'name': self.active_challenge.name,
                 'description': self.active_challenge.description,
                 'goal': self.active_challenge.goal,
                 'hint': self.active_challenge.hint
             }
-        return None
+        return self._active_info
 
     def get_solution(self) -> Optional[str]:
         """
@@ -170,6 +179,7 @@ class ChallengeManager:
         """End the current challenge."""
         self.active_challenge = None
         self.ds_type = None
+        self._active_info = None
 
     def is_challenge_active(self) -> bool:
         """Check if a challenge is currently active."""
@@ -1,8 +1,4 @@
 """Linked List specific challenges."""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from data_structures.linked_list import LinkedList
 from challenges.challenge_manager import Challenge
 
@@ -14,13 +10,29 @@ class FindMiddleNodeChallenge(Challenge):
     Goal: Use the slow/fast pointer technique to find middle element efficiently.
     """
 
+    SOLUTION_STEPS = """Solution:
+1. Use two pointers: slow and fast
+2. Initialize both to head
+3. Move slow pointer one step at a time
+4. Move fast pointer two steps at a time
+5. When fast reaches the end, slow is at middle
+
+For list [1,2,3,4,5]:
+- Step 1: slow=1, fast=1
+- Step 2: slow=2, fast=3
+- Step 3: slow=3, fast=5
+- Fast reached end, slow is at middle (3)
+
+This technique requires only one pass through the list!
+Time: O(n), Space: O(1)"""
+
     def __init__(self):
         """Initialize find middle node challenge."""
         super().__init__(
             name="Find Middle Node",
             description="Find the middle element of the list [1,2,3,4,5] using one pass (slow/fast pointers)",
             goal="Identify the middle element (should be 3)",
-            hint="Use the find_middle() method which implements the slow/fast pointer technique."
+            hint="Use the find_middle_two_pointer() method which implements the slow/fast pointer technique."
         )
         self.found_middle = None
 
@@ -46,7 +58,7 @@ class FindMiddleNodeChallenge(Challenge):
         Returns:
             True if middle element is 3
         """
-        middle = linked_list.find_middle()
+        middle = linked_list.find_middle_two_pointer()
         self.found_middle = middle
         return middle == 3
 
@@ -57,18 +69,4 @@ class FindMiddleNodeChallenge(Challenge):
         Returns:
             Solution steps
         """
-        return """Solution:
-1. Use two pointers: slow and fast
-2. Initialize both to head
-3. Move slow pointer one step at a time
-4. Move fast pointer two steps at a time
-5. When fast reaches the end, slow is at middle
-
-For list [1,2,3,4,5]:
-- Step 1: slow=1, fast=1
-- Step 2: slow=2, fast=3
-- Step 3: slow=3, fast=5
-- Fast reached end, slow is at middle (3)
-
-This technique requires only one pass through the list!
-Time: O(n), Space: O(1)"""
+        return self.SOLUTION_STEPS
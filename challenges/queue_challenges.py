@@ -1,8 +1,4 @@
 """Queue-specific challenges."""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from data_structures.queue import Queue, QueueFromStacks
 from challenges.challenge_manager import Challenge
 
@@ -14,6 +10,21 @@ class QueueFromStacksChallenge(Challenge):
     Goal: Understand how FIFO behavior can be achieved using two LIFO structures.
     """
 
+    EXPECTED_SEQUENCE = (1, 2, 3)
+
+    SOLUTION_STEPS = """Solution:
+1. Enqueue 1, 2, 3 using the enqueue method
+   - All values go into stack1
+2. Dequeue the first element:
+   - Transfer all from stack1 to stack2 (reversing order)
+   - Pop from stack2 (returns 1)
+3. Continue dequeuing:
+   - Elements come from stack2 in correct FIFO order
+   - Returns 2, then 3
+
+Key insight: Moving elements between stacks reverses their order,
+achieving FIFO behavior from LIFO structures."""
+
     def __init__(self):
         """Initialize queue from stacks challenge."""
         super().__init__(
@@ -22,7 +33,6 @@ class QueueFromStacksChallenge(Challenge):
             goal="Dequeue operations should return elements in FIFO order: 1, 2, 3",
             hint="The QueueFromStacks class uses stack1 for enqueue and stack2 for dequeue."
         )
-        self.expected_sequence = [1, 2, 3]
 
     def setup(self) -> QueueFromStacks:
         """
@@ -51,7 +61,7 @@ class QueueFromStacksChallenge(Challenge):
         """
         dequeue_history = queue.get_dequeue_history()
         is_empty = queue.is_empty()
-        correct_sequence = dequeue_history == self.expected_sequence
+        correct_sequence = tuple(dequeue_history) == self.EXPECTED_SEQUENCE
 
         return is_empty and correct_sequence
 
@@ -62,15 +72,4 @@ class QueueFromStacksChallenge(Challenge):
         Returns:
             Solution steps
         """
-        return """Solution:
-1. Enqueue 1, 2, 3 using the enqueue method
-   - All values go into stack1
-2. Dequeue the first element:
-   - Transfer all from stack1 to stack2 (reversing order)
-   - Pop from stack2 (returns 1)
-3. Continue dequeuing:
-   - Elements come from stack2 in correct FIFO order
-   - Returns 2, then 3
-
-Key insight: Moving elements between stacks reverses their order,
-achieving FIFO behavior from LIFO structures."""
+        return self.SOLUTION_STEPS
@@ -1,8 +1,4 @@
 """Stack-specific challenges."""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from data_structures.stack import Stack
 from challenges.challenge_manager import Challenge
 
@@ -15,13 +11,24 @@ class ReverseStackChallenge(Challenge):
           reverse it to [5, 4, 3, 2, 1] using the recursive method.
     """
 
+    SOLUTION_STEPS = """Solution:
+1. Call reverse_recursive_demo() on the stack (the 'Reverse Stack'
+   button gives the same result with an in-place O(n) reverse)
+2. The recursive algorithm works by:
+   - Popping each element
+   - Recursively reversing the remaining stack
+   - Inserting the popped element at the bottom
+3. This demonstrates recursion with a call stack visualization
+
+Expected result: Stack transforms from [1,2,3,4,5] to [5,4,3,2,1]"""
+
     def __init__(self):
         """Initialize reverse stack challenge."""
         super().__init__(
             name="Reverse the Stack",
             description="Reverse a stack using recursion. Initial stack: [1, 2, 3, 4, 5] (bottom to top)",
             goal="The stack should become [5, 4, 3, 2, 1] (bottom to top)",
-            hint="Use the reverse_recursive() method on the stack instance."
+            hint="Use the reverse_recursive_demo() method on the stack instance."
         )
 
     def setup(self) -> Stack:
@@ -57,12 +64,4 @@ class ReverseStackChallenge(Challenge):
         Returns:
             Solution steps
         """
-        return """Solution:
-1. Click 'Reverse Stack' button (or call reverse_recursive() method)
-2. The recursive algorithm works by:
-   - Popping each element
-   - Recursively reversing the remaining stack
-   - Inserting the popped element at the bottom
-3. This demonstrates recursion with a call stack visualization
-
-Expected result: Stack transforms from [1,2,3,4,5] to [5,4,3,2,1]"""
+        return self.SOLUTION_STEPS
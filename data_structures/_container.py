@@ -0,0 +1,105 @@
+"""Shared base for the item-backed Stack and Queue."""
+
+
+class _ItemContainer:
+    """
+    Bookkeeping shared by Stack and Queue.
+    Subclasses keep their items in self.items (built with ITEMS_TYPE) and
+    keep self._size in step with every push/pop.
+    """
+
+    ITEMS_TYPE = list
+
+    def __init__(self):
+        """Initialize an empty container."""
+        self.items = self.ITEMS_TYPE()
+        self._size = 0
+
+    def extend(self, items):
+        """Add every value in items, in order, with a single call."""
+        try:
+            self.items.extend(items)
+        finally:
+            # Keep the size right even if items raised partway through
+            self._size = len(self.items)
+
+    def is_empty(self):
+        """Check if the container is empty."""
+        return self._size == 0
+
+    def size(self):
+        """Return the number of items in the container."""
+        return self._size
+
+    def clear(self):
+        """Remove all items from the container."""
+        self.items.clear()
+        self._size = 0
+
+    def __iter__(self):
+        """Iterate over the items (in storage order) without copying them."""
+        return iter(self.items)
+
+    def to_list(self):
+        """Return a copy of the items as a list (in storage order)."""
+        return list(self.items)
+
+    def get_state(self, deep=False):
+        """
+        Get the current state for serialization.
+        Items are shallow-copied unless deep=True (only needed for mutable items).
+        """
+        items = list(self.items)
+        if deep:
+            # Only the deep path needs the copy module, so import it lazily
+            from copy import deepcopy
+            items = deepcopy(items)
+        return {"items": items}
+
+    def set_state(self, state, deep=False):
+        """
+        Restore the container from a saved state.
+        Items are shallow-copied unless deep=True.
+        """
+        items = state["items"]
+        if deep:
+            from copy import deepcopy
+            items = deepcopy(items)
+        self.items = self.ITEMS_TYPE(items)
+        self._size = len(self.items)
+
+    def __str__(self):
+        """String representation of the container."""
+        return f"{type(self).__name__}({list(self.items)})"
+
+    def __repr__(self):
+        """Detailed representation of the container."""
+        return f"{type(self).__name__}(items={list(self.items)})"
+
+
+# The queue_numba module once imported, False if unavailable, None if not
+# tried yet; importing numba is slow, so only int workloads pay for it
+_numba_containers = None
+
+
+def _load_numba_containers(dtype):
+    """
+    Return the queue_numba module if dtype is a signed int dtype and numba
+    imports, else None (callers then fall back to the Python classes).
+    """
+    global _numba_containers
+    if dtype is None:
+        return None
+    if _numba_containers is None:
+        try:
+            from . import queue_numba
+        except ImportError:  # numba/numpy are optional
+            _numba_containers = False
+        else:
+            _numba_containers = queue_numba
+    if not _numba_containers:
+        return None
+    import numpy as np
+    if dtype is not int and not np.issubdtype(np.dtype(dtype), np.signedinteger):
+        return None
+    return _numba_containers
@@ -1,17 +1,25 @@
 """Binary Search Tree data structure implementation."""
 import copy
+import itertools
+from collections import deque
+
+# Shared across trees, so a (version, ...) key never matches a different tree
+_versions = itertools.count()
 
 
 class TreeNode:
     """
     Node for binary search tree.    """
 
+    __slots__ = ('data', 'left', 'right', 'height')
+
     def __init__(self, data):
         """
         Initialize a tree node with data.        """
         self.data = data
         self.left = None
         self.right = None
+        self.height = 1
 
     def __str__(self):
         """String representation of the node."""
@@ -24,12 +32,18 @@ class TreeNode:
 
 class BinarySearchTree:
     """
-    Binary Search Tree data structure.    """
+    Binary Search Tree data structure.
+    Self-balancing (AVL): every insert/delete rebalances with rotations,
+    so the tree height stays O(log n).    """
 
     def __init__(self):
         """Initialize an empty binary search tree."""
         self.root = None
         self.size_count: int = 0
+        # Preorder snapshot for get_state, dropped on every mutation
+        self._state_cache = None
+        # Changes on every mutation; callers can key caches on it
+        self.version = next(_versions)
 
     def insert(self, data):
         """
@@ -37,134 +51,238 @@ class BinarySearchTree:
         if self.root is None:
             self.root = TreeNode(data)
             self.size_count += 1
-        else:
-            self._insert_recursive(self.root, data)
-
-    def _insert_recursive(self, node, data):
-        """
-        Recursively insert a value into the tree.        """
-        if data < node.data:
-            if node.left is None:
-                node.left = TreeNode(data)
-                self.size_count += 1
-            else:
-                self._insert_recursive(node.left, data)
-        elif data > node.data:
-            if node.right is None:
-                node.right = TreeNode(data)
-                self.size_count += 1
+            self._touch()
+            return
+
+        # Walk down iteratively, remembering the path for rebalancing
+        path = []
+        node = self.root
+        push = path.append
+        while node is not None:
+            push(node)
+            value = node.data
+            if data < value:
+                node = node.left
+            elif data > value:
+                node = node.right
             else:
-                self._insert_recursive(node.right, data)
-        # If data == node.data, ignore (no duplicates)
+                # If data == node.data, ignore (no duplicates)
+                return
+
+        parent = path[-1]
+        if data < parent.data:
+            parent.left = TreeNode(data)
+        else:
+            parent.right = TreeNode(data)
+        self.size_count += 1
+        self._touch()
+        self._retrace(path)
 
     def search(self, data):
         """
         Search for a value in the tree.
         """
-        return self._search_recursive(self.root, data)
+        node = self.root
+        while node is not None:
+            value = node.data
+            if data == value:
+                return True
+            node = node.right if data > value else node.left
+        return False
 
-    def _search_recursive(self, node, data):
+    def delete(self, data):
         """
-        Recursively search for a value.
+        Delete a value from the tree.
         """
+        # Find the node, keeping the path of ancestors
+        path = []
+        node = self.root
+        while node is not None and node.data != data:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+
         if node is None:
             return False
-        if data == node.data:
-            return True
-        elif data < node.data:
-            return self._search_recursive(node.left, data)
+
+        # Node with two children: copy the inorder successor up,
+        # then remove the successor node instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+
+        # Node now has at most one child: splice it out
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
         else:
-            return self._search_recursive(node.right, data)
+            path[-1].right = child
 
-    def delete(self, data):
+        self.size_count -= 1
+        self._touch()
+        self._retrace(path)
+        return True
+
+    def _retrace(self, path):
         """
-        Delete a value from the tree.
+        Rebalance each node on the path from the bottom up,
+        re-linking rotated subtrees into their parents.
         """
-        # TODO: could optimize this with iterative approach instead of recursive
-        # but recursion is clearer for understanding the algorithm
-        if not self.search(data):
-            return False
-        self.root = self._delete_recursive(self.root, data)
-        return True
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new_root = self._rebalance(node)
+            if new_root is node:
+                continue
+            if i == 0:
+                self.root = new_root
+            elif path[i - 1].left is node:
+                path[i - 1].left = new_root
+            else:
+                path[i - 1].right = new_root
 
-    def _delete_recursive(self, node, data):
+    @staticmethod
+    def _height(node):
+        """Return the cached height of a node (0 for None)."""
+        return node.height if node is not None else 0
+
+    def _update_height(self, node):
+        """Recompute a node's height from its children."""
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    def _balance_factor(self, node):
+        """Return height(left) - height(right) for a node."""
+        return self._height(node.left) - self._height(node.right)
+
+    def _rotate_left(self, node):
+        """Rotate a subtree left around its right child and return the new root."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        """Rotate a subtree right around its left child and return the new root."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rebalance(self, node):
         """
-        Recursively delete a value from the tree.            Updated node after deletion
+        Update a node's height and rotate if it is unbalanced.
+        Handles LL, RR, LR and RL cases, returning the new subtree root.
         """
-        if node is None:
-            return None
+        self._update_height(node)
+        balance = self._balance_factor(node)
 
-        if data < node.data:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._delete_recursive(node.right, data)
-        else:
-            # Node with only one child or no child
-            if node.left is None:
-                self.size_count -= 1
-                return node.right
-            elif node.right is None:
-                self.size_count -= 1
-                return node.left
-
-            # Node with two children: get inorder successor
-            min_larger_node = self._find_min(node.right)
-            node.data = min_larger_node.data
-            node.right = self._delete_recursive(node.right, min_larger_node.data)
+        if balance > 1:
+            # Left-Right case: rotate the left child first
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
 
-        return node
+        if balance < -1:
+            # Right-Left case: rotate the right child first
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
 
-    def _find_min(self, node):
-        """
-        Find the minimum value node in a subtree.            Node with minimum value
-        """
-        current = node
-        while current.left is not None:
-            current = current.left
-        return current
+        return node
 
     def inorder_traversal(self):
         """
         Perform inorder traversal (left, root, right).        """
         result = []
-        self._inorder_recursive(self.root, result)
+        stack = []
+        # Bind the hot list methods once instead of per node
+        append, push, pop = result.append, stack.append, stack.pop
+        node = self.root
+        while stack or node is not None:
+            # Go as far left as possible, then visit and step right
+            while node is not None:
+                push(node)
+                node = node.left
+            node = pop()
+            append(node.data)
+            node = node.right
         return result
 
-    def _inorder_recursive(self, node, result):
-        """Helper for inorder traversal."""
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.data)
-            self._inorder_recursive(node.right, result)
+    def inorder_morris(self):
+        """
+        Inorder traversal using Morris threading (O(1) extra space).
+        Temporarily links each left subtree's rightmost node back to its
+        inorder successor, then removes the link on the second visit.
+        """
+        result = []
+        current = self.root
+        while current is not None:
+            if current.left is None:
+                result.append(current.data)
+                current = current.right
+                continue
+
+            predecessor = current.left
+            while predecessor.right is not None and predecessor.right is not current:
+                predecessor = predecessor.right
+
+            if predecessor.right is None:
+                # First visit: thread back to current and go left
+                predecessor.right = current
+                current = current.left
+            else:
+                # Second visit: remove the thread, visit, go right
+                predecessor.right = None
+                result.append(current.data)
+                current = current.right
+        return result
 
     def preorder_traversal(self):
         """
         Perform preorder traversal (root, left, right).        """
         result = []
-        self._preorder_recursive(self.root, result)
+        if self.root is None:
+            return result
+        stack = [self.root]
+        append, push, pop = result.append, stack.append, stack.pop
+        while stack:
+            node = pop()
+            append(node.data)
+            # Push right first so left is visited first
+            if node.right is not None:
+                push(node.right)
+            if node.left is not None:
+                push(node.left)
         return result
 
-    def _preorder_recursive(self, node, result):
-        """Helper for preorder traversal."""
-        if node is not None:
-            result.append(node.data)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
-
     def postorder_traversal(self):
         """
         Perform postorder traversal (left, right, root).        """
+        # Visit root, right, left, then reverse to get left, right, root
         result = []
-        self._postorder_recursive(self.root, result)
+        if self.root is None:
+            return result
+        stack = [self.root]
+        append, push, pop = result.append, stack.append, stack.pop
+        while stack:
+            node = pop()
+            append(node.data)
+            if node.left is not None:
+                push(node.left)
+            if node.right is not None:
+                push(node.right)
+        result.reverse()
         return result
 
-    def _postorder_recursive(self, node, result):
-        """Helper for postorder traversal."""
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.data)
-
     def is_empty(self):
         """Check if the tree is empty."""
         return self.root is None
@@ -177,12 +295,21 @@ class BinarySearchTree:
         """Remove all nodes from the tree."""
         self.root = None
         self.size_count = 0
+        self._touch()
+
+    def _touch(self):
+        """Drop the cached state and take a fresh version after a mutation."""
+        self._state_cache = None
+        self.version = next(_versions)
 
     def get_state(self):
         """
         Get the current state for serialization.        """
+        if self._state_cache is None:
+            self._state_cache = self.preorder_traversal()
         return {
-            "items": self.preorder_traversal(),
+            # Copy so callers can't mutate the cached snapshot
+            "items": list(self._state_cache),
             "size": self.size_count
         }
 
@@ -190,8 +317,34 @@ class BinarySearchTree:
         """
         Restore the tree from a saved state.        """
         self.clear()
+        # Plain BST descent, no rotations: replaying the preorder this way
+        # rebuilds exactly the saved shape, which insert() would rebalance
+        nodes = []
         for item in state["items"]:
-            self.insert(item)
+            new = TreeNode(item)
+            if self.root is None:
+                self.root = new
+            else:
+                node = self.root
+                while True:
+                    if item < node.data:
+                        if node.left is None:
+                            node.left = new
+                            break
+                        node = node.left
+                    else:
+                        if node.right is None:
+                            node.right = new
+                            break
+                        node = node.right
+            nodes.append(new)
+
+        # Children follow their parent in preorder, so walking it backwards
+        # sets every child's height before its parent's
+        for node in reversed(nodes):
+            self._update_height(node)
+        self.size_count = len(nodes)
+        self._touch()
 
     @staticmethod
     def build_balanced_from_sorted(sorted_array) -> 'BinarySearchTree':
@@ -200,23 +353,37 @@ class BinarySearchTree:
         Used for challenge mode.            Balanced binary search tree
         """
         bst = BinarySearchTree()
-        bst.root = BinarySearchTree._build_balanced_recursive(sorted_array, 0, len(sorted_array) - 1)
-        bst.size_count = len(sorted_array)
-        return bst
+        n = len(sorted_array)
+        bst.size_count = n
+        if n == 0:
+            return bst
+
+        # Shape is fixed by n, so allocate every node up front
+        nodes = [TreeNode(value) for value in sorted_array]
+
+        # Breadth-first over (parent, side, start, end) ranges
+        ranges = deque([(None, None, 0, n - 1)])
+        while ranges:
+            parent, side, start, end = ranges.popleft()
+            if start > end:
+                continue
+
+            mid = (start + end) // 2
+            node = nodes[mid]
+            # Height of a balanced subtree over k items is k.bit_length()
+            node.height = (end - start + 1).bit_length()
+
+            if parent is None:
+                bst.root = node
+            elif side == 'left':
+                parent.left = node
+            else:
+                parent.right = node
 
-    @staticmethod
-    def _build_balanced_recursive(arr, start, end):
-        """
-        Recursively build balanced tree from sorted array.            Root node of the balanced subtree
-        """
-        if start > end:
-            return None
+            ranges.append((node, 'left', start, mid - 1))
+            ranges.append((node, 'right', mid + 1, end))
 
-        mid = (start + end) // 2
-        node = TreeNode(arr[mid])
-        node.left = BinarySearchTree._build_balanced_recursive(arr, start, mid - 1)
-        node.right = BinarySearchTree._build_balanced_recursive(arr, mid + 1, end)
-        return node
+        return bst
 
     def __str__(self):
         """String representation of the tree."""
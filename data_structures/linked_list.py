@@ -1,11 +1,14 @@
 """Singly Linked List data structure implementation."""
 import copy
+from array import array
 
 
 class Node:
     """
     Node for singly linked list.    """
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         """
         Initialize a node with data.        """
@@ -28,6 +31,7 @@ class LinkedList:
     def __init__(self):
         """Initialize an empty linked list."""
         self.head = None
+        self.tail = None
         self.size_count: int = 0
 
     def insert_at_head(self, data):
@@ -36,6 +40,8 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
         self.size_count += 1
 
     def insert_at_tail(self, data):
@@ -45,12 +51,29 @@ class LinkedList:
         if self.head is None:
             self.head = new_node
         else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
+            # O(1) append through the cached tail pointer
+            self.tail.next = new_node
+        self.tail = new_node
         self.size_count += 1
 
+    def extend(self, items):
+        """Append every value in items to the end of the list in one pass."""
+        tail = self.tail
+        count = 0
+        try:
+            for item in items:
+                node = Node(item)
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next = node
+                tail = node
+                count += 1
+        finally:
+            # Commit whatever was linked, even if items raised partway
+            self.tail = tail
+            self.size_count += count
+
     def insert_at_position(self, data, position):
         """
         Insert a new node at a specific position.
@@ -69,6 +92,8 @@ class LinkedList:
 
         new_node.next = current.next
         current.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
         self.size_count += 1
         return True
 
@@ -81,6 +106,8 @@ class LinkedList:
 
         if self.head.data == data:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.size_count -= 1
             return True
 
@@ -88,6 +115,8 @@ class LinkedList:
         while current.next is not None:
             if current.next.data == data:
                 current.next = current.next.next
+                if current.next is None:
+                    self.tail = current
                 self.size_count -= 1
                 return True
             current = current.next
@@ -103,6 +132,8 @@ class LinkedList:
 
         if position == 0:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self.size_count -= 1
             return True
 
@@ -112,6 +143,8 @@ class LinkedList:
 
         if current.next is not None:
             current.next = current.next.next
+            if current.next is None:
+                self.tail = current
             self.size_count -= 1
             return True
 
@@ -131,6 +164,19 @@ class LinkedList:
         return None
 
     def find_middle(self):
+        """
+        Find the middle element by walking size // 2 links.
+        """
+        if self.head is None:
+            return None
+
+        # size_count is maintained, so the middle index is known up front
+        current = self.head
+        for _ in range(self.size_count // 2):
+            current = current.next
+        return current.data
+
+    def find_middle_two_pointer(self):
         """
         Find the middle element using slow/fast pointer technique.
         Used for challenge mode.
@@ -159,8 +205,16 @@ class LinkedList:
     def clear(self):
         """Remove all nodes from the list."""
         self.head = None
+        self.tail = None
         self.size_count = 0
 
+    def __iter__(self):
+        """Yield each value from head to tail."""
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+
     def to_list(self):
         """
         Convert the linked list to a Python list.        """
@@ -183,8 +237,16 @@ class LinkedList:
         """
         Restore the list from a saved state.        """
         self.clear()
-        for item in state["items"]:
-            self.insert_at_tail(item)
+        # Build the chain back to front in a single pass
+        head = None
+        for item in reversed(state["items"]):
+            node = Node(item)
+            node.next = head
+            head = node
+            if self.tail is None:
+                self.tail = node
+        self.head = head
+        self.size_count = len(state["items"])
 
     def __str__(self):
         """String representation of the linked list."""
@@ -193,3 +255,252 @@ class LinkedList:
     def __repr__(self):
         """Detailed representation of the linked list."""
         return f"LinkedList(size={self.size_count}, items={self.to_list()})"
+
+
+class LinkedListFast:
+    """
+    Singly Linked List backed by parallel arrays instead of Node objects.
+    Same interface as LinkedList; the visualizer keeps using LinkedList.
+
+    Values live in self._data and links in self._next (index of the next
+    slot, -1 for the end). Slots freed by deletes go on a free list and
+    are reused by later inserts.
+    """
+
+    NIL = -1
+
+    def __init__(self):
+        """Initialize an empty linked list."""
+        self._data: list = []
+        self._next: array = array('i')
+        self._free: list = []
+        self.head_idx: int = self.NIL
+        self.tail_idx: int = self.NIL
+        self.size_count: int = 0
+
+    def _alloc(self, data, next_idx: int) -> int:
+        """Store a value in a free (or new) slot and return its index."""
+        if self._free:
+            idx = self._free.pop()
+            self._data[idx] = data
+            self._next[idx] = next_idx
+        else:
+            idx = len(self._data)
+            self._data.append(data)
+            self._next.append(next_idx)
+        return idx
+
+    def _release(self, idx: int) -> None:
+        """Return a slot to the free list."""
+        self._data[idx] = None
+        self._free.append(idx)
+
+    def _unlink_after(self, prev: int) -> None:
+        """Remove the slot following prev (or the head if prev is NIL)."""
+        if prev == self.NIL:
+            idx = self.head_idx
+            self.head_idx = self._next[idx]
+        else:
+            idx = self._next[prev]
+            self._next[prev] = self._next[idx]
+        if idx == self.tail_idx:
+            self.tail_idx = prev
+        self._release(idx)
+        self.size_count -= 1
+
+    def insert_at_head(self, data):
+        """Insert a new value at the beginning of the list."""
+        self.head_idx = self._alloc(data, self.head_idx)
+        if self.tail_idx == self.NIL:
+            self.tail_idx = self.head_idx
+        self.size_count += 1
+
+    def insert_at_tail(self, data):
+        """Insert a new value at the end of the list."""
+        idx = self._alloc(data, self.NIL)
+        if self.head_idx == self.NIL:
+            self.head_idx = idx
+        else:
+            self._next[self.tail_idx] = idx
+        self.tail_idx = idx
+        self.size_count += 1
+
+    def extend(self, items):
+        """Append every value in items to the end of the list in one pass."""
+        nxt = self._next
+        tail = self.tail_idx
+        count = 0
+        try:
+            for item in items:
+                idx = self._alloc(item, self.NIL)
+                if tail == self.NIL:
+                    self.head_idx = idx
+                else:
+                    nxt[tail] = idx
+                tail = idx
+                count += 1
+        finally:
+            # Commit whatever was linked, even if items raised partway
+            self.tail_idx = tail
+            self.size_count += count
+
+    def insert_at_position(self, data, position):
+        """
+        Insert a new value at a specific position.
+        """
+        if position < 0 or position > self.size_count:
+            return False
+
+        if position == 0:
+            self.insert_at_head(data)
+            return True
+
+        if position == self.size_count:
+            self.insert_at_tail(data)
+            return True
+
+        nxt = self._next
+        current = self.head_idx
+        for _ in range(position - 1):
+            current = nxt[current]
+
+        nxt[current] = self._alloc(data, nxt[current])
+        self.size_count += 1
+        return True
+
+    def delete(self, data):
+        """
+        Delete the first occurrence of a value.
+        """
+        values, nxt = self._data, self._next
+        prev = self.NIL
+        current = self.head_idx
+        while current != self.NIL:
+            if values[current] == data:
+                self._unlink_after(prev)
+                return True
+            prev = current
+            current = nxt[current]
+        return False
+
+    def delete_at_position(self, position):
+        """
+        Delete the value at a specific position.
+        """
+        if position < 0 or position >= self.size_count:
+            return False
+
+        nxt = self._next
+        prev = self.NIL
+        for _ in range(position):
+            prev = self.head_idx if prev == self.NIL else nxt[prev]
+        self._unlink_after(prev)
+        return True
+
+    def search(self, data):
+        """
+        Search for a value and return its position, or None if not found.
+        """
+        values, nxt = self._data, self._next
+        current = self.head_idx
+        position = 0
+        while current != self.NIL:
+            if values[current] == data:
+                return position
+            current = nxt[current]
+            position += 1
+        return None
+
+    def find_middle(self):
+        """
+        Find the middle element by walking size // 2 links.
+        """
+        if self.head_idx == self.NIL:
+            return None
+
+        nxt = self._next
+        current = self.head_idx
+        for _ in range(self.size_count // 2):
+            current = nxt[current]
+        return self._data[current]
+
+    def find_middle_two_pointer(self):
+        """
+        Find the middle element using slow/fast pointer technique.
+        """
+        if self.head_idx == self.NIL:
+            return None
+
+        nxt = self._next
+        slow = fast = self.head_idx
+        while fast != self.NIL and nxt[fast] != self.NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+        return self._data[slow]
+
+    def is_empty(self):
+        """Check if the list is empty."""
+        return self.head_idx == self.NIL
+
+    def size(self):
+        """Return the number of values in the list."""
+        return self.size_count
+
+    def clear(self):
+        """Remove all values from the list."""
+        self._data = []
+        self._next = array('i')
+        self._free = []
+        self.head_idx = self.NIL
+        self.tail_idx = self.NIL
+        self.size_count = 0
+
+    def __iter__(self):
+        """Yield each value from head to tail."""
+        values, nxt = self._data, self._next
+        current = self.head_idx
+        while current != self.NIL:
+            yield values[current]
+            current = nxt[current]
+
+    def to_list(self):
+        """
+        Convert the linked list to a Python list.        """
+        values, nxt = self._data, self._next
+        result = []
+        current = self.head_idx
+        while current != self.NIL:
+            result.append(values[current])
+            current = nxt[current]
+        return result
+
+    def get_state(self):
+        """
+        Get the current state for serialization.        """
+        return {
+            "items": self.to_list(),
+            "size": self.size_count
+        }
+
+    def set_state(self, state):
+        """
+        Restore the list from a saved state.        """
+        # Rebuild as a compact, in-order layout: slot i links to slot i + 1
+        items = list(state["items"])
+        n = len(items)
+        self._data = items
+        self._next = array('i', range(1, n + 1))
+        self._free = []
+        if n:
+            self._next[-1] = self.NIL
+        self.head_idx = 0 if n else self.NIL
+        self.tail_idx = n - 1 if n else self.NIL
+        self.size_count = n
+
+    def __str__(self):
+        """String representation of the linked list."""
+        return f"LinkedListFast({' -> '.join(str(x) for x in self.to_list())})"
+
+    def __repr__(self):
+        """Detailed representation of the linked list."""
+        return f"LinkedListFast(size={self.size_count}, items={self.to_list()})"
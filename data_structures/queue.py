@@ -1,71 +1,65 @@
 """Queue data structure implementation."""
-import copy
+from collections import deque
 
+from ._container import _ItemContainer, _load_numba_containers
 
-class Queue:
+
+class Queue(_ItemContainer):
     """
     Queue data structure with FIFO (First In First Out) behavior."""
 
-    def __init__(self):
-        """Initialize an empty queue."""
-        self.items = []
+    ITEMS_TYPE = deque
 
     def enqueue(self, item):
         """
         Add an item to the rear of the queue."""
         self.items.append(item)
+        self._size += 1
 
     def dequeue(self):
         """
         Remove and return the front item from the queue.
 
         """
-        if self.is_empty():
+        if self._size == 0:
             return None
-        return self.items.pop(0)
+        self._size -= 1
+        return self.items.popleft()
 
     def front(self):
         """
         Return the front item without removing it.
 
         """
-        if self.is_empty():
+        if self._size == 0:
             return None
         return self.items[0]
 
-    def is_empty(self):
-        """Check if the queue is empty."""
-        return len(self.items) == 0
-
-    def size(self):
-        """Return the number of items in the queue."""
-        return len(self.items)
-
-    def clear(self):
-        """Remove all items from the queue."""
-        self.items.clear()
-
-    def to_list(self):
-        """Return a copy of the queue as a list (front to rear)."""
-        return copy.copy(self.items)
-
-    def get_state(self):
+    def remove_rear(self):
         """
-        Get the current state for serialization.        """
-        return {"items": copy.deepcopy(self.items)}
-
-    def set_state(self, state):
+        Remove and return the most recently enqueued item (undo of enqueue).
         """
-        Restore the queue from a saved state.        """
-        self.items = copy.deepcopy(state["items"])
+        if self._size == 0:
+            return None
+        self._size -= 1
+        return self.items.pop()
 
-    def __str__(self):
-        """String representation of the queue."""
-        return f"Queue({self.items})"
+    def push_front(self, item):
+        """
+        Put an item back at the front of the queue (undo of dequeue)."""
+        self.items.appendleft(item)
+        self._size += 1
 
-    def __repr__(self):
-        """Detailed representation of the queue."""
-        return f"Queue(items={self.items})"
+    def drain(self):
+        """
+        Dequeue and yield items front to rear until the queue is empty.
+        Unlike a dequeue() loop, stored None values are yielded normally.
+        """
+        items = self.items
+        popleft = items.popleft
+        while items:
+            self._size -= 1
+            yield popleft()
 
 
 class QueueFromStacks:
@@ -79,29 +73,48 @@ class QueueFromStacks:
         self.stack1 = []  # For enqueue
         self.stack2 = []  # For dequeue
         self.dequeue_history = []  # Track dequeue operations
+        self._size = 0
 
     def enqueue(self, item):
         """Add item to queue using stack operations."""
         self.stack1.append(item)
+        self._size += 1
 
     def dequeue(self):
         """Remove and return front item using stack operations."""
-        if not self.stack2:
-            while self.stack1:
-                self.stack2.append(self.stack1.pop())
-        if not self.stack2:
+        if self._size == 0:
             return None
+        if not self.stack2:
+            # Same as popping every item of stack1 onto stack2, done in C
+            self.stack2.extend(reversed(self.stack1))
+            self.stack1.clear()
+        self._size -= 1
         result = self.stack2.pop()
         self.dequeue_history.append(result)
         return result
 
     def is_empty(self):
         """Check if queue is empty."""
-        return len(self.stack1) == 0 and len(self.stack2) == 0
+        return self._size == 0
 
     def size(self):
         """Return number of items in queue."""
-        return len(self.stack1) + len(self.stack2)
+        return self._size
+
+    def get_state(self):
+        """Get both stacks and the dequeue history for undo snapshots."""
+        return {
+            "stack1": list(self.stack1),
+            "stack2": list(self.stack2),
+            "dequeue_history": list(self.dequeue_history),
+        }
+
+    def set_state(self, state):
+        """Restore both stacks and the dequeue history from a snapshot."""
+        self.stack1 = list(state["stack1"])
+        self.stack2 = list(state["stack2"])
+        self.dequeue_history = list(state["dequeue_history"])
+        self._size = len(self.stack1) + len(self.stack2)
 
     def clear_history(self):
         """Clear dequeue history (for challenge reset)."""
@@ -110,3 +123,14 @@ class QueueFromStacks:
     def get_dequeue_history(self):
         """Get the history of dequeued values."""
         return self.dequeue_history.copy()
+
+
+def make_queue(dtype=None):
+    """
+    Create a Queue, or a NumbaQueue when the workload declares a signed int
+    dtype (e.g. int or numpy.int64) and numba is installed.
+    """
+    numba_containers = _load_numba_containers(dtype)
+    if numba_containers is None:
+        return Queue()
+    return numba_containers.NumbaQueue()
@@ -0,0 +1,139 @@
+"""Numba-compiled Stack and Queue for integer workloads.
+
+Optional: requires numba and numpy (pip install numba). The pure-Python
+Stack and Queue stay the default; use these when every item is an int64
+and push/pop speed matters more than storing arbitrary objects.
+"""
+import numpy as np
+from numba import int64
+from numba.experimental import jitclass
+
+
+_stack_spec = [
+    ('buf', int64[:]),
+    ('top', int64),
+]
+
+_queue_spec = [
+    ('buf', int64[:]),
+    ('head', int64),
+    ('tail', int64),
+    ('count', int64),
+    ('cap', int64),
+]
+
+
+@jitclass(_stack_spec)
+class NumbaStack:
+    """Stack of int64 values backed by a growable NumPy array."""
+
+    def __init__(self, capacity=16):
+        """Initialize an empty stack with room for capacity items."""
+        self.buf = np.empty(max(capacity, 1), dtype=np.int64)
+        self.top = 0
+
+    def push(self, item):
+        """Push an item onto the stack, doubling the buffer when full."""
+        if self.top == self.buf.shape[0]:
+            new_buf = np.empty(self.buf.shape[0] * 2, dtype=np.int64)
+            new_buf[:self.top] = self.buf
+            self.buf = new_buf
+        self.buf[self.top] = item
+        self.top += 1
+
+    def pop(self):
+        """Remove and return the top item, or None if empty."""
+        if self.top == 0:
+            return None
+        self.top -= 1
+        return self.buf[self.top]
+
+    def peek(self):
+        """Return the top item without removing it, or None if empty."""
+        if self.top == 0:
+            return None
+        return self.buf[self.top - 1]
+
+    def is_empty(self):
+        """Check if the stack is empty."""
+        return self.top == 0
+
+    def size(self):
+        """Return the number of items in the stack."""
+        return self.top
+
+    def clear(self):
+        """Remove all items from the stack."""
+        self.top = 0
+
+    def to_array(self):
+        """Return a copy of the items as an array (bottom to top)."""
+        return self.buf[:self.top].copy()
+
+
+@jitclass(_queue_spec)
+class NumbaQueue:
+    """FIFO queue of int64 values backed by a growable ring buffer."""
+
+    def __init__(self, capacity=16):
+        """Initialize an empty queue with room for capacity items."""
+        self.cap = max(capacity, 1)
+        self.buf = np.empty(self.cap, dtype=np.int64)
+        self.head = 0
+        self.tail = 0
+        self.count = 0
+
+    def _grow(self):
+        """Double the buffer, unwrapping items so the front is at index 0."""
+        new_buf = np.empty(self.cap * 2, dtype=np.int64)
+        first = self.cap - self.head
+        new_buf[:first] = self.buf[self.head:]
+        new_buf[first:self.count] = self.buf[:self.head]
+        self.buf = new_buf
+        self.head = 0
+        self.tail = self.count
+        self.cap *= 2
+
+    def enqueue(self, item):
+        """Add an item to the rear of the queue."""
+        if self.count == self.cap:
+            self._grow()
+        self.buf[self.tail] = item
+        self.tail = (self.tail + 1) % self.cap
+        self.count += 1
+
+    def dequeue(self):
+        """Remove and return the front item, or None if empty."""
+        if self.count == 0:
+            return None
+        item = self.buf[self.head]
+        self.head = (self.head + 1) % self.cap
+        self.count -= 1
+        return item
+
+    def front(self):
+        """Return the front item without removing it, or None if empty."""
+        if self.count == 0:
+            return None
+        return self.buf[self.head]
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self.count == 0
+
+    def size(self):
+        """Return the number of items in the queue."""
+        return self.count
+
+    def clear(self):
+        """Remove all items from the queue."""
+        self.head = 0
+        self.tail = 0
+        self.count = 0
+
+    def to_array(self):
+        """Return a copy of the items as an array (front to rear)."""
+        out = np.empty(self.count, dtype=np.int64)
+        for i in range(self.count):
+            out[i] = self.buf[(self.head + i) % self.cap]
+        return out
@@ -1,59 +1,48 @@
 """Stack data structure implementation."""
-import copy
+from array import array
+from functools import partial
 
+from ._container import _ItemContainer, _load_numba_containers
 
-class Stack:
-    """Basic stack using a list."""
 
-    def __init__(self):
-        """Initialize an empty stack."""
-        self.items = []
+class Stack(_ItemContainer):
+    """Basic stack using a list."""
 
     def push(self, item):
         """Push an item onto the stack."""
         self.items.append(item)
+        self._size += 1
 
     def pop(self):
         """Remove and return the top item."""
-        if self.is_empty():
+        if self._size == 0:
             return None
+        self._size -= 1
         return self.items.pop()
 
     def peek(self):
         """Return the top item without removing it."""
-        if self.is_empty():
+        if self._size == 0:
             return None
         return self.items[-1]
 
-    def is_empty(self):
-        """Check if the stack is empty."""
-        return len(self.items) == 0
-
-    def size(self):
-        """Return the number of items in the stack."""
-        return len(self.items)
-
-    def clear(self):
-        """Remove all items from the stack."""
-        self.items.clear()
-
-    def to_list(self):
-        """Return a copy of the stack as a list."""
-        return copy.copy(self.items)
-
-    def get_state(self):
-        """Get the current state for serialization."""
-        return {"items": copy.deepcopy(self.items)}
-
-    def set_state(self, state):
-        """Restore the stack from a saved state."""
-        self.items = copy.deepcopy(state["items"])
+    def drain(self):
+        """Pop and yield items top to bottom until the stack is empty."""
+        items = self.items
+        pop = items.pop
+        while items:
+            self._size -= 1
+            yield pop()
 
     def reverse_recursive(self):
-        """Reverse the stack using recursion."""
+        """Reverse the stack in place (O(n), no recursion depth limit)."""
+        self.items.reverse()
+
+    def reverse_recursive_demo(self):
+        """Reverse the stack using recursion (O(n^2), for teaching)."""
         if not self.is_empty():
             temp = self.pop()
-            self.reverse_recursive()
+            self.reverse_recursive_demo()
             self._insert_at_bottom(temp)
 
     def _insert_at_bottom(self, item):
@@ -65,10 +54,32 @@ class Stack:
             self._insert_at_bottom(item)
             self.push(temp)
 
-    def __str__(self):
-        """String representation of the stack."""
-        return f"Stack({self.items})"
 
-    def __repr__(self):
-        """Detailed representation of the stack."""
-        return f"Stack(items={self.items})"
+class IntStack(Stack):
+    """
+    Stack of machine integers backed by array('q').
+    Stores each item in 8 bytes instead of a full int object, which pays off
+    for large int-only workloads; push/pop are a little slower than Stack's.
+    Pushing a non-int (or one outside the int64 range) raises TypeError or
+    OverflowError.
+    """
+
+    TYPECODE = 'q'
+    ITEMS_TYPE = partial(array, TYPECODE)
+
+    def clear(self):
+        """Remove all items from the stack."""
+        # array has no clear() method
+        del self.items[:]
+        self._size = 0
+
+
+def make_stack(dtype=None):
+    """
+    Create a Stack, or a NumbaStack when the workload declares a signed int
+    dtype (e.g. int or numpy.int64) and numba is installed.
+    """
+    numba_containers = _load_numba_containers(dtype)
+    if numba_containers is None:
+        return Stack()
+    return numba_containers.NumbaStack()
@@ -5,3 +5,28 @@ from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_structures.linked_list import LinkedList  # noqa: E402
+from data_structures.queue import Queue  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def state_123():
+    """Canonical [1, 2, 3] state dict, shared read-only by every test."""
+    return {"items": [1, 2, 3], "size": 3}
+
+
+@pytest.fixture
+def ll123(state_123):
+    """Fresh [1, 2, 3] LinkedList restored from the shared state."""
+    ll = LinkedList()
+    ll.set_state(state_123)
+    return ll
+
+
+@pytest.fixture
+def queue123(state_123):
+    """Fresh [1, 2, 3] Queue restored from the shared state."""
+    queue = Queue()
+    queue.set_state(state_123)
+    return queue
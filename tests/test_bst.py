@@ -3,6 +3,29 @@ import pytest
 from data_structures.bst import BinarySearchTree, TreeNode
 
 
+SEVEN_VALUES = (5, 3, 7, 2, 4, 6, 8)
+
+
+def _build_seven():
+    """Build the full three-level tree shared by several tests."""
+    bst = BinarySearchTree()
+    for val in SEVEN_VALUES:
+        bst.insert(val)
+    return bst
+
+
+@pytest.fixture
+def bst7():
+    """Fresh seven-node tree for tests that mutate it."""
+    return _build_seven()
+
+
+@pytest.fixture(scope="class")
+def shared_bst7():
+    """Seven-node tree built once per class, for read-only tests."""
+    return _build_seven()
+
+
 class TestTreeNodeBasics:
     """Test TreeNode class."""
 
@@ -13,6 +36,12 @@ class TestTreeNodeBasics:
         assert node.left is None
         assert node.right is None
 
+    def test_tree_node_uses_slots(self):
+        """Test that tree nodes carry no per-instance __dict__."""
+        node = TreeNode(5)
+        assert node.height == 1
+        assert not hasattr(node, '__dict__')
+
     def test_tree_node_str_representation(self):
         """Test tree node string representation."""
         node = TreeNode(42)
@@ -82,33 +111,17 @@ class TestBSTSearchOperations:
         bst = BinarySearchTree()
         assert bst.search(5) is False
 
-    def test_search_existing_root(self):
-        """Test searching for root value."""
-        bst = BinarySearchTree()
-        bst.insert(5)
-        assert bst.search(5) is True
-
-    def test_search_existing_left_child(self):
-        """Test searching for value in left subtree."""
-        bst = BinarySearchTree()
-        bst.insert(5)
-        bst.insert(3)
-        assert bst.search(3) is True
-
-    def test_search_existing_right_child(self):
-        """Test searching for value in right subtree."""
-        bst = BinarySearchTree()
-        bst.insert(5)
-        bst.insert(7)
-        assert bst.search(7) is True
-
-    def test_search_nonexistent_value(self):
-        """Test searching for nonexistent value."""
-        bst = BinarySearchTree()
-        bst.insert(5)
-        bst.insert(3)
-        bst.insert(7)
-        assert bst.search(10) is False
+    @pytest.mark.parametrize("value, expected", [
+        (5, True),    # root
+        (3, True),    # left child
+        (7, True),    # right child
+        (2, True),    # leaf
+        (10, False),  # missing, larger than all
+        (0, False),   # missing, smaller than all
+    ])
+    def test_search_shared_tree(self, shared_bst7, value, expected):
+        """Test searching root, children, leaves and missing values."""
+        assert shared_bst7.search(value) is expected
 
     def test_search_in_complex_tree(self):
         """Test searching in more complex tree."""
@@ -167,12 +180,9 @@ class TestBSTDeleteOperations:
         assert bst.search(4) is True
         assert bst.size() == 2
 
-    def test_delete_node_with_two_children(self):
+    def test_delete_node_with_two_children(self, bst7):
         """Test deleting node with two children."""
-        bst = BinarySearchTree()
-        values = [5, 3, 7, 2, 4, 6, 8]
-        for val in values:
-            bst.insert(val)
+        bst = bst7
         assert bst.delete(3) is True
         assert bst.search(3) is False
         # Tree should still maintain BST property
@@ -190,18 +200,29 @@ class TestBSTDeleteOperations:
         assert bst.search(5) is False
         assert bst.size() == 2
 
-    def test_delete_maintains_bst_property(self):
+    def test_delete_maintains_bst_property(self, bst7):
         """Test that BST property is maintained after deletion."""
-        bst = BinarySearchTree()
-        values = [5, 3, 7, 2, 4, 6, 8]
-        for val in values:
-            bst.insert(val)
+        bst = bst7
         bst.delete(5)
         bst.delete(3)
         # Inorder should still be sorted
         inorder = bst.inorder_traversal()
         assert inorder == sorted(inorder)
 
+    def test_delete_does_not_search_first(self):
+        """Test that delete finds the node in the same walk it removes it."""
+        bst = BinarySearchTree()
+        for val in [5, 3, 7]:
+            bst.insert(val)
+
+        def fail(_):
+            pytest.fail("delete should not do a separate search pass")
+
+        bst.search = fail
+        assert bst.delete(3) is True
+        assert bst.delete(42) is False
+        assert bst.inorder_traversal() == [5, 7]
+
 
 class TestBSTTraversals:
     """Test tree traversal operations."""
@@ -225,6 +246,21 @@ class TestBSTTraversals:
             bst.insert(val)
         assert bst.inorder_traversal() == [1, 3, 4, 5, 6, 7, 9]
 
+    def test_inorder_morris_matches_inorder(self):
+        """Test Morris traversal gives the same order and restores links."""
+        bst = BinarySearchTree()
+        values = [5, 3, 7, 1, 4, 6, 9]
+        for val in values:
+            bst.insert(val)
+        before = bst.preorder_traversal()
+        assert bst.inorder_morris() == [1, 3, 4, 5, 6, 7, 9]
+        # Threads must be removed, leaving the tree unchanged
+        assert bst.preorder_traversal() == before
+
+    def test_inorder_morris_empty_tree(self):
+        """Test Morris traversal of empty tree."""
+        assert BinarySearchTree().inorder_morris() == []
+
     def test_preorder_empty_tree(self):
         """Test preorder traversal of empty tree."""
         bst = BinarySearchTree()
@@ -312,6 +348,21 @@ class TestBSTBalancedBuild:
         assert bst.root.left is not None
         assert bst.root.right is not None
 
+    def test_build_balanced_sets_heights(self):
+        """Test that built tree has correct cached heights."""
+        bst = BinarySearchTree.build_balanced_from_sorted(list(range(10)))
+        assert bst.root.data == 4
+        assert bst.root.height == 4
+        assert bst.root.left.height == 3
+        assert bst.root.right.height == 3
+
+    def test_build_balanced_large_input(self):
+        """Test building a large tree without recursion."""
+        bst = BinarySearchTree.build_balanced_from_sorted(list(range(5000)))
+        assert bst.size() == 5000
+        assert bst.root.height == 13
+        assert bst.inorder_traversal() == list(range(5000))
+
 
 class TestBSTEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -368,6 +419,49 @@ class TestBSTStateManagement:
         assert state["size"] == 3
         assert len(state["items"]) == 3
 
+    def test_get_state_cache_invalidated_on_mutation(self):
+        """Test that cached state tracks inserts, deletes and clear."""
+        bst = BinarySearchTree()
+        for value in [5, 3, 7]:
+            bst.insert(value)
+        first = bst.get_state()
+        first["items"].append(99)
+        assert bst.get_state()["items"] == [5, 3, 7]
+
+        bst.insert(1)
+        assert bst.get_state()["items"] == [5, 3, 1, 7]
+        bst.delete(3)
+        assert sorted(bst.get_state()["items"]) == [1, 5, 7]
+        bst.clear()
+        assert bst.get_state() == {"items": [], "size": 0}
+
+    def test_set_state_keeps_exact_shape(self):
+        """Test that set_state restores an unbalanced preorder without rotating."""
+        bst = BinarySearchTree()
+        bst.set_state({"items": [3, 2, 1, 4], "size": 4})
+        assert bst.preorder_traversal() == [3, 2, 1, 4]
+        assert bst.size() == 4
+        assert bst.root.height == 3
+
+        restored = BinarySearchTree()
+        restored.set_state(bst.get_state())
+        assert restored.preorder_traversal() == [3, 2, 1, 4]
+
+    def test_version_changes_on_mutation(self):
+        """Test that version moves on every mutation and is unique per tree."""
+        bst = BinarySearchTree()
+        seen = {bst.version}
+        for mutate in (lambda: bst.insert(5), lambda: bst.insert(3),
+                       lambda: bst.delete(3), bst.clear):
+            mutate()
+            assert bst.version not in seen
+            seen.add(bst.version)
+        before = bst.version
+        bst.search(5)
+        bst.delete(42)
+        assert bst.version == before
+        assert BinarySearchTree().version not in seen
+
     def test_set_state_restore(self):
         """Test restoring tree from saved state."""
         bst = BinarySearchTree()
@@ -413,6 +507,20 @@ class TestBSTSizeTracking:
         bst.delete(7)
         assert bst.size() == 1
 
+    def test_size_after_two_child_deletes(self):
+        """Test that deleting two-child nodes decrements size exactly once."""
+        bst = BinarySearchTree()
+        values = [5, 3, 7, 2, 4, 6, 8]
+        for val in values:
+            bst.insert(val)
+        assert bst.delete(5) is True
+        assert bst.size() == 6
+        assert bst.delete(3) is True
+        assert bst.size() == 5
+        assert bst.delete(3) is False
+        assert bst.size() == 5
+        assert bst.size() == len(bst.inorder_traversal())
+
     def test_size_with_duplicate_insert_attempts(self):
         """Test that size doesn't increase on duplicate inserts."""
         bst = BinarySearchTree()
@@ -472,3 +580,80 @@ class TestBSTPropertyValidation:
         # Inorder should always be sorted (BST property)
         inorder = bst.inorder_traversal()
         assert inorder == sorted(inorder)
+
+
+class TestBSTBalancing:
+    """Test AVL self-balancing behaviour."""
+
+    def test_sorted_inserts_stay_balanced(self):
+        """Test that inserting sorted values does not degenerate into a chain."""
+        bst = BinarySearchTree()
+        for val in range(1, 8):
+            bst.insert(val)
+        assert bst.root.data == 4
+        assert bst.root.height == 3
+        assert bst.inorder_traversal() == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_left_right_rotation(self):
+        """Test the left-right double rotation case."""
+        bst = BinarySearchTree()
+        for val in (3, 1, 2):
+            bst.insert(val)
+        assert bst.root.data == 2
+        assert bst.root.left.data == 1
+        assert bst.root.right.data == 3
+
+    def test_right_left_rotation(self):
+        """Test the right-left double rotation case."""
+        bst = BinarySearchTree()
+        for val in (1, 3, 2):
+            bst.insert(val)
+        assert bst.root.data == 2
+        assert bst.preorder_traversal() == [2, 1, 3]
+
+    def test_delete_rebalances(self):
+        """Test that deletion triggers rebalancing."""
+        bst = BinarySearchTree()
+        for val in (2, 1, 3, 4):
+            bst.insert(val)
+        bst.delete(1)
+        assert bst.root.data == 3
+        assert bst.preorder_traversal() == [3, 2, 4]
+        assert bst.root.height == 2
+
+    def test_large_sorted_input_height_is_logarithmic(self):
+        """Test that height stays logarithmic for large sorted input."""
+        bst = BinarySearchTree()
+        insert = bst.insert
+        for val in range(2000):
+            insert(val)
+        assert bst.size() == 2000
+        # AVL height bound: ~1.44 * log2(n)
+        assert bst.root.height <= 16
+
+    def test_random_operations_keep_avl_invariant(self):
+        """Test heights and balance factors after mixed inserts and deletes."""
+        import random
+        rng = random.Random(46)
+        bst = BinarySearchTree()
+        reference = set()
+        for _ in range(500):
+            val = rng.randint(0, 100)
+            if rng.random() < 0.6:
+                bst.insert(val)
+                reference.add(val)
+            else:
+                assert bst.delete(val) is (val in reference)
+                reference.discard(val)
+
+        def check(node):
+            if node is None:
+                return 0
+            left, right = check(node.left), check(node.right)
+            assert abs(left - right) <= 1
+            assert node.height == 1 + max(left, right)
+            return node.height
+
+        check(bst.root)
+        assert bst.inorder_traversal() == sorted(reference)
+        assert bst.size() == len(reference)
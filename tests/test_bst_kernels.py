@@ -0,0 +1,47 @@
+"""Tests for the optional Numba BST layout kernel."""
+import pytest
+
+pytest.importorskip("numba")
+
+# First call of the kernel triggers a JIT compile
+pytestmark = pytest.mark.slow
+
+from data_structures.bst import BinarySearchTree
+from visuals._bst_kernels import layout_bst, tree_to_arrays
+
+
+def _layout(bst):
+    """Lay out bst with the visualizer's default geometry."""
+    nodes, left, right = tree_to_arrays(bst.root)
+    xs, ys, depths = layout_bst(left, right, 0, 400.0, 50.0, 60.0, 80.0)
+    return {node.data: (x, y, d) for node, x, y, d in
+            zip(nodes, xs.tolist(), ys.tolist(), depths.tolist())}
+
+
+class TestLayoutBst:
+    """Test layout_bst against the in-order layout rules."""
+
+    def test_three_node_tree(self):
+        """Test exact positions for a root with two children."""
+        bst = BinarySearchTree()
+        for value in (2, 1, 3):
+            bst.insert(value)
+        assert _layout(bst) == {
+            1: (310.0, 130.0, 1),
+            2: (370.0, 50.0, 0),
+            3: (430.0, 130.0, 1),
+        }
+
+    def test_x_follows_inorder_and_y_follows_depth(self):
+        """Test that x steps by spacing in sorted order and y by depth."""
+        import random
+        values = random.Random(3).sample(range(1000), 200)
+        bst = BinarySearchTree()
+        for value in values:
+            bst.insert(value)
+        layout = _layout(bst)
+        xs = [layout[v][0] for v in sorted(values)]
+        assert xs == [400.0 - 200 * 30.0 + i * 60.0 for i in range(200)]
+        assert layout[bst.root.data][2] == 0
+        for x, y, depth in layout.values():
+            assert y == 50.0 + depth * 80.0
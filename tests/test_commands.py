@@ -0,0 +1,132 @@
+"""Tests for the undo/redo command pattern."""
+from data_structures.stack import Stack
+from ui.commands import CommandHistory, DataStructureCommand
+
+
+class TestDataStructureCommand:
+    """Test command execution and undo."""
+
+    def test_commands_use_slots(self):
+        """Test that commands and history carry no per-instance __dict__."""
+        stack = Stack()
+        assert not hasattr(DataStructureCommand(stack, stack.clear), '__dict__')
+        assert not hasattr(CommandHistory(), '__dict__')
+
+    def test_undo_restores_snapshot(self):
+        """Test that a command without an inverse undoes via get/set_state."""
+        stack = Stack()
+        stack.extend([1, 2])
+        cmd = DataStructureCommand(stack, stack.clear, description="Clear")
+        cmd.execute()
+        assert stack.is_empty()
+        cmd.undo()
+        assert stack.to_list() == [1, 2]
+
+    def test_redo_with_closures_over_structure(self):
+        """Test undo/redo of commands built like DSTab's, closing over ds."""
+        ds = Stack()
+        ds.extend([1, 2])
+        history = CommandHistory()
+        pop = DataStructureCommand(
+            ds,
+            lambda: ds.pop(),
+            undo_operation=lambda: ds.push(pop.result),
+            description="Pop"
+        )
+        history.execute(pop)
+        history.execute(DataStructureCommand(ds, lambda: ds.clear(),
+                                             description="Clear all"))
+        assert ds.is_empty()
+        history.undo()
+        history.undo()
+        assert ds.to_list() == [1, 2]
+        history.redo()
+        history.redo()
+        assert ds.is_empty()
+        history.undo()
+        assert ds.to_list() == [1]
+
+    def test_inverse_skips_snapshot(self):
+        """Test that an explicit undo_operation is used instead of a snapshot."""
+        stack = Stack()
+        cmd = DataStructureCommand(
+            stack,
+            lambda: stack.push(5),
+            undo_operation=stack.pop,
+            description="Push 5"
+        )
+        cmd.execute()
+        assert cmd.prev_state is None
+        cmd.undo()
+        assert stack.is_empty()
+
+    def test_inverse_can_use_result(self):
+        """Test that an inverse can read the result of execute."""
+        stack = Stack()
+        stack.extend([1, 2])
+        cmd = DataStructureCommand(
+            stack,
+            stack.pop,
+            undo_operation=lambda: stack.push(cmd.result),
+            description="Pop"
+        )
+        assert cmd.execute() == 2
+        cmd.undo()
+        assert stack.to_list() == [1, 2]
+
+
+class TestCommandHistory:
+    """Test undo/redo bookkeeping."""
+
+    def _push(self, stack, value):
+        """Build a push command with an explicit inverse."""
+        return DataStructureCommand(
+            stack,
+            lambda: stack.push(value),
+            undo_operation=stack.pop,
+            description=f"Push {value}"
+        )
+
+    def test_undo_redo(self):
+        """Test undo and redo move through history."""
+        stack = Stack()
+        history = CommandHistory()
+        history.execute(self._push(stack, 1))
+        history.execute(self._push(stack, 2))
+        assert history.undo() is True
+        assert stack.to_list() == [1]
+        assert history.get_current_state() == "Push 1"
+        assert history.redo() is True
+        assert stack.to_list() == [1, 2]
+        assert history.redo() is False
+
+    def test_execute_discards_redo(self):
+        """Test that a new command after undo drops the redo branch."""
+        stack = Stack()
+        history = CommandHistory()
+        history.execute(self._push(stack, 1))
+        history.execute(self._push(stack, 2))
+        history.undo()
+        history.execute(self._push(stack, 3))
+        assert not history.can_redo()
+        assert history.get_history_size() == 2
+        assert stack.to_list() == [1, 3]
+
+    def test_max_history_trims_oldest(self):
+        """Test that history keeps only the newest max_history commands."""
+        stack = Stack()
+        history = CommandHistory(max_history=3)
+        for i in range(5):
+            history.execute(self._push(stack, i))
+        assert history.get_history_size() == 3
+        while history.undo():
+            pass
+        # The two oldest pushes can no longer be undone
+        assert stack.to_list() == [0, 1]
+
+    def test_empty_history(self):
+        """Test undo/redo and description on empty history."""
+        history = CommandHistory()
+        assert history.undo() is False
+        assert history.redo() is False
+        assert history.get_current_state() == "No operations"
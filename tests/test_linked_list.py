@@ -1,6 +1,13 @@
 """Comprehensive tests for Linked List data structure."""
 import pytest
-from data_structures.linked_list import LinkedList, Node
+from data_structures.linked_list import LinkedList, LinkedListFast, Node
+
+
+def _ll(*values):
+    """Build a LinkedList holding values through the bulk set_state path."""
+    ll = LinkedList()
+    ll.set_state({"items": list(values), "size": len(values)})
+    return ll
 
 
 class TestNodeBasics:
@@ -12,6 +19,11 @@ class TestNodeBasics:
         assert node.data == 5
         assert node.next is None
 
+    def test_node_uses_slots(self):
+        """Test that nodes carry no per-instance __dict__."""
+        node = Node(5)
+        assert not hasattr(node, '__dict__')
+
     def test_node_str_representation(self):
         """Test node string representation."""
         node = Node(42)
@@ -56,42 +68,22 @@ class TestLinkedListInsertOperations:
         ll.insert_at_tail(3)
         assert ll.to_list() == [1, 2, 3]
 
-    def test_insert_at_position_beginning(self):
-        """Test inserting at position 0."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        assert ll.insert_at_position(0, 0) is True
-        assert ll.to_list() == [0, 1, 2]
-
-    def test_insert_at_position_middle(self):
-        """Test inserting in the middle."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(3)
-        assert ll.insert_at_position(2, 1) is True
-        assert ll.to_list() == [1, 2, 3]
-
-    def test_insert_at_position_end(self):
-        """Test inserting at the end."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        assert ll.insert_at_position(3, 2) is True
-        assert ll.to_list() == [1, 2, 3]
-
-    def test_insert_at_position_invalid_negative(self):
-        """Test inserting at negative position."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        assert ll.insert_at_position(99, -1) is False
-        assert ll.to_list() == [1]
-
-    def test_insert_at_position_invalid_too_large(self):
-        """Test inserting at position beyond list size."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        assert ll.insert_at_position(99, 5) is False
+    @pytest.mark.parametrize("initial, value, position, expected", [
+        ([1, 2], 0, 0, [0, 1, 2]),  # beginning
+        ([1, 3], 2, 1, [1, 2, 3]),  # middle
+        ([1, 2], 3, 2, [1, 2, 3]),  # end
+    ])
+    def test_insert_at_position(self, initial, value, position, expected):
+        """Test inserting at the beginning, middle and end."""
+        ll = _ll(*initial)
+        assert ll.insert_at_position(value, position) is True
+        assert ll.to_list() == expected
+
+    @pytest.mark.parametrize("position", [-1, 5])
+    def test_insert_at_position_invalid(self, position):
+        """Test inserting at a negative or too-large position."""
+        ll = _ll(1)
+        assert ll.insert_at_position(99, position) is False
         assert ll.to_list() == [1]
 
 
@@ -103,89 +95,43 @@ class TestLinkedListDeleteOperations:
         ll = LinkedList()
         assert ll.delete(1) is False
 
-    def test_delete_head_element(self):
-        """Test deleting head element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.delete(1) is True
-        assert ll.to_list() == [2, 3]
-
-    def test_delete_middle_element(self):
-        """Test deleting middle element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.delete(2) is True
-        assert ll.to_list() == [1, 3]
-
-    def test_delete_tail_element(self):
-        """Test deleting tail element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.delete(3) is True
-        assert ll.to_list() == [1, 2]
+    @pytest.mark.parametrize("value, expected", [
+        (1, [2, 3]),  # head
+        (2, [1, 3]),  # middle
+        (3, [1, 2]),  # tail
+    ])
+    def test_delete_value(self, ll123, value, expected):
+        """Test deleting the head, middle and tail element."""
+        assert ll123.delete(value) is True
+        assert ll123.to_list() == expected
 
     def test_delete_nonexistent_element(self):
         """Test deleting element not in list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
+        ll = _ll(1, 2)
         assert ll.delete(99) is False
         assert ll.to_list() == [1, 2]
 
     def test_delete_only_first_occurrence(self):
         """Test that delete removes only first occurrence."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(1)
+        ll = _ll(1, 2, 1)
         assert ll.delete(1) is True
         assert ll.to_list() == [2, 1]
 
-    def test_delete_at_position_head(self):
-        """Test deleting at position 0."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.delete_at_position(0) is True
-        assert ll.to_list() == [2, 3]
-
-    def test_delete_at_position_middle(self):
-        """Test deleting at middle position."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.delete_at_position(1) is True
-        assert ll.to_list() == [1, 3]
-
-    def test_delete_at_position_tail(self):
-        """Test deleting at last position."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.delete_at_position(2) is True
-        assert ll.to_list() == [1, 2]
-
-    def test_delete_at_position_invalid_negative(self):
-        """Test deleting at negative position."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        assert ll.delete_at_position(-1) is False
-        assert ll.to_list() == [1]
-
-    def test_delete_at_position_invalid_too_large(self):
-        """Test deleting at position beyond list size."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        assert ll.delete_at_position(5) is False
+    @pytest.mark.parametrize("position, expected", [
+        (0, [2, 3]),  # head
+        (1, [1, 3]),  # middle
+        (2, [1, 2]),  # tail
+    ])
+    def test_delete_at_position(self, ll123, position, expected):
+        """Test deleting at the head, middle and last position."""
+        assert ll123.delete_at_position(position) is True
+        assert ll123.to_list() == expected
+
+    @pytest.mark.parametrize("position", [-1, 5])
+    def test_delete_at_position_invalid(self, position):
+        """Test deleting at a negative or too-large position."""
+        ll = _ll(1)
+        assert ll.delete_at_position(position) is False
         assert ll.to_list() == [1]
 
 
@@ -197,43 +143,19 @@ class TestLinkedListSearchOperations:
         ll = LinkedList()
         assert ll.search(1) is None
 
-    def test_search_found_at_head(self):
-        """Test searching for head element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.search(1) == 0
-
-    def test_search_found_at_middle(self):
-        """Test searching for middle element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.search(2) == 1
-
-    def test_search_found_at_tail(self):
-        """Test searching for tail element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.search(3) == 2
+    @pytest.mark.parametrize("value, position", [(1, 0), (2, 1), (3, 2)])
+    def test_search_found(self, ll123, value, position):
+        """Test searching for the head, middle and tail element."""
+        assert ll123.search(value) == position
 
     def test_search_not_found(self):
         """Test searching for nonexistent element."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
+        ll = _ll(1, 2)
         assert ll.search(99) is None
 
     def test_search_returns_first_occurrence(self):
         """Test search returns position of first occurrence."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(1)
+        ll = _ll(1, 2, 1)
         assert ll.search(1) == 0
 
 
@@ -245,44 +167,32 @@ class TestLinkedListFindMiddle:
         ll = LinkedList()
         assert ll.find_middle() is None
 
-    def test_find_middle_single_element(self):
-        """Test finding middle of single-element list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        assert ll.find_middle() == 1
-
-    def test_find_middle_two_elements(self):
-        """Test finding middle of two-element list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        assert ll.find_middle() == 2
-
-    def test_find_middle_odd_length(self):
-        """Test finding middle of odd-length list."""
-        ll = LinkedList()
-        for i in [1, 2, 3, 4, 5]:
-            ll.insert_at_tail(i)
-        assert ll.find_middle() == 3
-
-    def test_find_middle_even_length(self):
-        """Test finding middle of even-length list."""
-        ll = LinkedList()
-        for i in [1, 2, 3, 4]:
-            ll.insert_at_tail(i)
+    @pytest.mark.parametrize("items, expected", [
+        ([1], 1),
+        ([1, 2], 2),
+        ([1, 2, 3, 4, 5], 3),
         # For even length, slow pointer stops at second middle
-        assert ll.find_middle() == 3
+        ([1, 2, 3, 4], 3),
+    ])
+    def test_find_middle(self, items, expected):
+        """Test finding the middle of single, two, odd and even-length lists."""
+        assert _ll(*items).find_middle() == expected
 
     def test_find_middle_after_modifications(self):
         """Test find_middle after insertions and deletions."""
-        ll = LinkedList()
-        for i in [1, 2, 3, 4, 5]:
-            ll.insert_at_tail(i)
+        ll = _ll(1, 2, 3, 4, 5)
         ll.delete(1)
         ll.delete(5)
         # Now list is [2, 3, 4]
         assert ll.find_middle() == 3
 
+    def test_find_middle_two_pointer_matches_index_walk(self):
+        """Test that both middle-finding methods agree for many lengths."""
+        for length in range(9):
+            ll = LinkedList()
+            ll.extend(range(length))
+            assert ll.find_middle_two_pointer() == ll.find_middle()
+
 
 class TestLinkedListEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -309,15 +219,11 @@ class TestLinkedListEdgeCases:
         ll.clear()
         assert ll.is_empty()
 
-    def test_clear_populated_list(self):
+    def test_clear_populated_list(self, ll123):
         """Test clearing populated list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        ll.clear()
-        assert ll.is_empty()
-        assert ll.size() == 0
+        ll123.clear()
+        assert ll123.is_empty()
+        assert ll123.size() == 0
 
 
 class TestLinkedListUtilityMethods:
@@ -328,13 +234,14 @@ class TestLinkedListUtilityMethods:
         ll = LinkedList()
         assert ll.to_list() == []
 
-    def test_to_list_populated(self):
+    def test_to_list_populated(self, ll123):
         """Test converting populated list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert ll.to_list() == [1, 2, 3]
+        assert ll123.to_list() == [1, 2, 3]
+
+    def test_iter_matches_to_list(self, ll123):
+        """Test that iterating yields values head to tail."""
+        assert list(ll123) == ll123.to_list()
+        assert list(LinkedList()) == []
 
     def test_size_tracking(self):
         """Test that size is tracked correctly."""
@@ -347,6 +254,98 @@ class TestLinkedListUtilityMethods:
         ll.delete(1)
         assert ll.size() == 1
 
+    def test_extend_appends_in_order(self):
+        """Test that extend appends after existing nodes and keeps size and tail."""
+        ll = LinkedList()
+        ll.insert_at_tail(1)
+        ll.extend([2, 3])
+        ll.extend([])
+        assert ll.to_list() == [1, 2, 3]
+        assert ll.size() == 3
+        assert ll.tail.data == 3
+
+    def test_extend_empty_list(self):
+        """Test extend on an empty list sets head and tail."""
+        ll = LinkedList()
+        ll.extend(iter([4, 5]))
+        assert ll.head.data == 4
+        ll.insert_at_tail(6)
+        assert ll.to_list() == [4, 5, 6]
+
+    @pytest.mark.parametrize("cls", [LinkedList, LinkedListFast])
+    def test_extend_keeps_tail_when_items_raise(self, cls):
+        """Test that nodes linked before the iterable raised stay counted."""
+        def values():
+            yield 1
+            yield 2
+            raise ValueError("boom")
+
+        ll = cls()
+        ll.insert_at_tail(0)
+        with pytest.raises(ValueError):
+            ll.extend(values())
+        assert ll.size() == 3
+        ll.insert_at_tail(9)
+        assert ll.to_list() == [0, 1, 2, 9]
+
+
+class TestLinkedListTailPointer:
+    """Test that the cached tail pointer stays in sync."""
+
+    def test_tail_empty_list(self):
+        """Test that a new list has no tail."""
+        ll = LinkedList()
+        assert ll.tail is None
+
+    def test_tail_after_insert_at_head_into_empty(self):
+        """Test that the first head insert also sets the tail."""
+        ll = LinkedList()
+        ll.insert_at_head(1)
+        ll.insert_at_head(2)
+        assert ll.tail.data == 1
+
+    def test_tail_after_insert_at_tail(self):
+        """Test that insert_at_tail moves the tail."""
+        ll = LinkedList()
+        ll.insert_at_tail(1)
+        ll.insert_at_tail(2)
+        assert ll.tail.data == 2
+        assert ll.tail.next is None
+
+    def test_tail_after_insert_at_last_position(self):
+        """Test that inserting at position == size moves the tail."""
+        ll = _ll(1)
+        ll.insert_at_position(2, 1)
+        assert ll.tail.data == 2
+
+    def test_tail_after_delete_tail_value(self):
+        """Test that deleting the last value moves the tail back."""
+        ll = _ll(1, 2, 3)
+        ll.delete(3)
+        assert ll.tail.data == 2
+        ll.insert_at_tail(4)
+        assert ll.to_list() == [1, 2, 4]
+
+    def test_tail_after_delete_at_last_position(self):
+        """Test that delete_at_position on the tail moves the tail back."""
+        ll = _ll(1, 2, 3)
+        ll.delete_at_position(2)
+        assert ll.tail.data == 2
+
+    def test_tail_after_deleting_only_node(self):
+        """Test that removing the only node clears the tail."""
+        ll = _ll(1)
+        ll.delete(1)
+        assert ll.tail is None
+        ll.insert_at_tail(5)
+        assert ll.to_list() == [5]
+
+    def test_tail_after_clear(self):
+        """Test that clear resets the tail."""
+        ll = _ll(1)
+        ll.clear()
+        assert ll.tail is None
+
 
 class TestLinkedListStateManagement:
     """Test state serialization and restoration."""
@@ -357,28 +356,34 @@ class TestLinkedListStateManagement:
         state = ll.get_state()
         assert state == {"items": [], "size": 0}
 
-    def test_get_state_populated_list(self):
+    def test_get_state_populated_list(self, ll123):
         """Test getting state from populated list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        state = ll.get_state()
+        state = ll123.get_state()
         assert state == {"items": [1, 2, 3], "size": 3}
 
-    def test_set_state_restore(self):
+    def test_set_state_restore(self, ll123):
         """Test restoring list from saved state."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        state = ll.get_state()
+        state = ll123.get_state()
 
         # Create new list and restore
         new_ll = LinkedList()
         new_ll.set_state(state)
-        assert new_ll.size() == 3
-        assert new_ll.to_list() == [1, 2, 3]
+        assert new_ll.get_state() == state
+
+    def test_shared_state_is_not_mutated(self, ll123, state_123):
+        """Test that mutating a fixture list leaves the session state intact."""
+        ll123.delete(2)
+        ll123.insert_at_tail(9)
+        assert state_123 == {"items": [1, 2, 3], "size": 3}
+
+    def test_set_state_keeps_tail_usable(self):
+        """Test that a restored list can be appended to."""
+        ll = LinkedList()
+        ll.set_state({"items": [1, 2, 3], "size": 3})
+        assert ll.tail.data == 3
+        ll.insert_at_tail(4)
+        assert ll.to_list() == [1, 2, 3, 4]
+        assert ll.size() == 4
 
 
 class TestLinkedListDataTypes:
@@ -408,17 +413,87 @@ class TestLinkedListStringRepresentation:
         ll = LinkedList()
         assert str(ll) == "LinkedList()"
 
-    def test_str_populated_list(self):
+    def test_str_populated_list(self, ll123):
         """Test __str__ for populated list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
-        ll.insert_at_tail(3)
-        assert str(ll) == "LinkedList(1 -> 2 -> 3)"
+        assert str(ll123) == "LinkedList(1 -> 2 -> 3)"
 
     def test_repr_list(self):
         """Test __repr__ for list."""
-        ll = LinkedList()
-        ll.insert_at_tail(1)
-        ll.insert_at_tail(2)
+        ll = _ll(1, 2)
         assert repr(ll) == "LinkedList(size=2, items=[1, 2])"
+
+
+class TestLinkedListFast:
+    """Test the array-backed LinkedListFast against LinkedList."""
+
+    def test_basic_operations(self):
+        """Test inserts, deletes and queries on the fast list."""
+        ll = LinkedListFast()
+        assert ll.is_empty()
+        assert ll.find_middle() is None
+        ll.insert_at_tail(2)
+        ll.insert_at_head(1)
+        ll.insert_at_tail(4)
+        assert ll.insert_at_position(3, 2) is True
+        assert ll.to_list() == [1, 2, 3, 4]
+        assert ll.search(3) == 2
+        assert ll.find_middle() == 3
+        assert ll.delete(1) is True
+        assert ll.delete_at_position(2) is True
+        assert ll.to_list() == [2, 3]
+        assert ll.size() == 2
+
+    def test_freed_slots_are_reused(self):
+        """Test that deleted slots are recycled by later inserts."""
+        ll = LinkedListFast()
+        ll.extend(range(5))
+        ll.delete(2)
+        ll.insert_at_tail(9)
+        assert len(ll._data) == 5
+        assert ll.to_list() == [0, 1, 3, 4, 9]
+
+    def test_extend(self):
+        """Test bulk append on the fast list, reusing freed slots."""
+        ll = LinkedListFast()
+        ll.extend([1, 2, 3])
+        ll.delete(2)
+        ll.extend([4, 5])
+        assert ll.to_list() == [1, 3, 4, 5]
+        assert ll.size() == 4
+        assert len(ll._data) == 4
+        assert list(ll) == [1, 3, 4, 5]
+
+    def test_state_round_trip(self):
+        """Test get_state/set_state on the fast list."""
+        ll = LinkedListFast()
+        ll.set_state({"items": [1, 2, 3], "size": 3})
+        assert ll.get_state() == {"items": [1, 2, 3], "size": 3}
+        ll.insert_at_tail(4)
+        assert ll.to_list() == [1, 2, 3, 4]
+
+    def test_matches_linked_list_on_random_operations(self):
+        """Test that both implementations agree on a random workload."""
+        import random
+        rng = random.Random(7)
+        fast, ref = LinkedListFast(), LinkedList()
+        for _ in range(400):
+            op = rng.choice(['head', 'tail', 'pos', 'del', 'delpos'])
+            val = rng.randint(0, 20)
+            if op == 'head':
+                fast.insert_at_head(val)
+                ref.insert_at_head(val)
+            elif op == 'tail':
+                fast.insert_at_tail(val)
+                ref.insert_at_tail(val)
+            elif op == 'pos':
+                pos = rng.randint(-1, ref.size() + 1)
+                assert fast.insert_at_position(val, pos) == ref.insert_at_position(val, pos)
+            elif op == 'del':
+                assert fast.delete(val) == ref.delete(val)
+            else:
+                pos = rng.randint(-1, ref.size())
+                assert fast.delete_at_position(pos) == ref.delete_at_position(pos)
+            assert fast.to_list() == ref.to_list()
+            assert fast.find_middle() == ref.find_middle()
+            assert fast.find_middle_two_pointer() == ref.find_middle_two_pointer()
+            assert fast.size() == ref.size()
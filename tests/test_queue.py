@@ -1,6 +1,25 @@
 """Comprehensive tests for Queue data structure."""
 import pytest
-from data_structures.queue import Queue, QueueFromStacks
+from data_structures.queue import Queue, QueueFromStacks, make_queue
+
+
+def _run_ops(queue, ops):
+    """Apply ("enq", value) / ("deq", None) steps and return dequeued values."""
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    dequeued = []
+    for op, value in ops:
+        if op == "enq":
+            enqueue(value)
+        else:
+            dequeued.append(dequeue())
+    return dequeued
+
+
+def _queue(*values):
+    """Build a Queue holding values through the bulk set_state path."""
+    queue = Queue()
+    queue.set_state({"items": list(values)})
+    return queue
 
 
 class TestQueueBasicOperations:
@@ -35,16 +54,12 @@ class TestQueueBasicOperations:
         queue.enqueue(1)
         queue.enqueue(2)
         queue.enqueue(3)
-        assert queue.dequeue() == 1
-        assert queue.dequeue() == 2
-        assert queue.dequeue() == 3
+        assert [queue.dequeue() for _ in range(3)] == [1, 2, 3]
         assert queue.is_empty()
 
     def test_front_without_removal(self):
         """Test that front returns element without removing it."""
-        queue = Queue()
-        queue.enqueue(1)
-        queue.enqueue(2)
+        queue = _queue(1, 2)
         assert queue.front() == 1
         assert queue.size() == 2  # Size unchanged
         assert queue.front() == 1  # Still same element
@@ -100,38 +115,56 @@ class TestQueueUtilityMethods:
         queue.clear()
         assert queue.is_empty()
 
-    def test_clear_populated_queue(self):
+    def test_clear_populated_queue(self, queue123):
         """Test clearing a populated queue."""
-        queue = Queue()
-        queue.enqueue(1)
-        queue.enqueue(2)
-        queue.enqueue(3)
-        queue.clear()
-        assert queue.is_empty()
-        assert queue.size() == 0
+        queue123.clear()
+        assert queue123.is_empty()
+        assert queue123.size() == 0
 
     def test_to_list_empty_queue(self):
         """Test converting empty queue to list."""
         queue = Queue()
         assert queue.to_list() == []
 
-    def test_to_list_populated_queue(self):
+    def test_to_list_populated_queue(self, queue123):
         """Test converting populated queue to list (front to rear)."""
-        queue = Queue()
-        queue.enqueue(1)
-        queue.enqueue(2)
-        queue.enqueue(3)
-        assert queue.to_list() == [1, 2, 3]
+        assert queue123.to_list() == [1, 2, 3]
+
+    def test_iter_front_to_rear(self, queue123):
+        """Test that iterating yields items front to rear."""
+        assert list(queue123) == [1, 2, 3]
 
     def test_to_list_returns_copy(self):
         """Test that to_list returns a copy, not reference."""
-        queue = Queue()
-        queue.enqueue(1)
-        queue.enqueue(2)
+        queue = _queue(1, 2)
         lst = queue.to_list()
         lst.append(3)
         assert queue.size() == 2  # Queue unchanged
 
+    def test_drain_yields_all_items(self):
+        """Test that drain empties the queue, including stored None values."""
+        queue = Queue()
+        queue.enqueue(1)
+        queue.enqueue(None)
+        queue.enqueue(3)
+        assert list(queue.drain()) == [1, None, 3]
+        assert queue.is_empty()
+        assert queue.size() == 0
+
+    def test_remove_rear_undoes_enqueue(self, queue123):
+        """Test that remove_rear drops the last enqueued item."""
+        queue123.enqueue(4)
+        assert queue123.remove_rear() == 4
+        assert queue123.to_list() == [1, 2, 3]
+        assert queue123.size() == 3
+        assert Queue().remove_rear() is None
+
+    def test_push_front_undoes_dequeue(self, queue123):
+        """Test that push_front restores a dequeued item to the front."""
+        queue123.push_front(queue123.dequeue())
+        assert queue123.to_list() == [1, 2, 3]
+        assert queue123.size() == 3
+
 
 class TestQueueStateManagement:
     """Test state serialization and restoration."""
@@ -142,13 +175,9 @@ class TestQueueStateManagement:
         state = queue.get_state()
         assert state == {"items": []}
 
-    def test_get_state_populated_queue(self):
+    def test_get_state_populated_queue(self, queue123):
         """Test getting state from populated queue."""
-        queue = Queue()
-        queue.enqueue(1)
-        queue.enqueue(2)
-        queue.enqueue(3)
-        state = queue.get_state()
+        state = queue123.get_state()
         assert state == {"items": [1, 2, 3]}
 
     def test_set_state_restore(self):
@@ -161,15 +190,14 @@ class TestQueueStateManagement:
         # Create new queue and restore
         new_queue = Queue()
         new_queue.set_state(state)
+        assert new_queue.get_state() == state
         assert new_queue.size() == 2
-        assert new_queue.dequeue() == 1
-        assert new_queue.dequeue() == 2
 
     def test_state_independence(self):
-        """Test that state is deep copied (not referenced)."""
+        """Test that deep state is deep copied (not referenced)."""
         queue = Queue()
         queue.enqueue([1, 2, 3])
-        state = queue.get_state()
+        state = queue.get_state(deep=True)
 
         # Modify the state
         state["items"][0].append(4)
@@ -177,6 +205,21 @@ class TestQueueStateManagement:
         # Original queue should be unchanged
         assert queue.front() == [1, 2, 3]
 
+    def test_shallow_state_independent_list(self):
+        """Test that the default state copies the item list itself."""
+        queue = Queue()
+        queue.enqueue(1)
+        queue.enqueue(2)
+        state = queue.get_state()
+        state["items"].append(3)
+        assert queue.size() == 2
+
+        # Restored queue must not share the state's list either
+        new_queue = Queue()
+        new_queue.set_state(state)
+        state["items"].clear()
+        assert new_queue.size() == 3
+
 
 class TestQueueDataTypes:
     """Test queue with different data types."""
@@ -222,15 +265,12 @@ class TestQueueStringRepresentation:
 
     def test_str_populated_queue(self):
         """Test __str__ for populated queue."""
-        queue = Queue()
-        queue.enqueue(1)
-        queue.enqueue(2)
+        queue = _queue(1, 2)
         assert str(queue) == "Queue([1, 2])"
 
     def test_repr_queue(self):
         """Test __repr__ for queue."""
-        queue = Queue()
-        queue.enqueue(1)
+        queue = _queue(1)
         assert repr(queue) == "Queue(items=[1])"
 
 
@@ -257,9 +297,7 @@ class TestQueueFromStacks:
         queue.enqueue(1)
         queue.enqueue(2)
         queue.enqueue(3)
-        assert queue.dequeue() == 1
-        assert queue.dequeue() == 2
-        assert queue.dequeue() == 3
+        assert [queue.dequeue() for _ in range(3)] == [1, 2, 3]
         assert queue.is_empty()
 
     def test_queue_from_stacks_dequeue_empty(self):
@@ -270,13 +308,9 @@ class TestQueueFromStacks:
     def test_queue_from_stacks_mixed_operations(self):
         """Test mixed enqueue/dequeue operations."""
         queue = QueueFromStacks()
-        queue.enqueue(1)
-        queue.enqueue(2)
-        assert queue.dequeue() == 1
-        queue.enqueue(3)
-        queue.enqueue(4)
-        assert queue.dequeue() == 2
-        assert queue.dequeue() == 3
+        ops = [("enq", 1), ("enq", 2), ("deq", None),
+               ("enq", 3), ("enq", 4), ("deq", None), ("deq", None)]
+        assert _run_ops(queue, ops) == [1, 2, 3]
         assert queue.size() == 1
 
     def test_queue_from_stacks_size_tracking(self):
@@ -291,27 +325,20 @@ class TestQueueFromStacks:
         queue.enqueue(4)
         assert queue.size() == 3
 
+    @pytest.mark.slow
     def test_queue_from_stacks_stack_transfer(self):
         """Test that items transfer between stacks correctly."""
         queue = QueueFromStacks()
-        # Add items
-        queue.enqueue(1)
-        queue.enqueue(2)
-        queue.enqueue(3)
-
-        # First dequeue triggers transfer from stack1 to stack2
-        assert queue.dequeue() == 1
-
-        # Add more items to stack1
-        queue.enqueue(4)
-        queue.enqueue(5)
-
-        # Continue dequeueing - should get from stack2 first
-        assert queue.dequeue() == 2
-        assert queue.dequeue() == 3
-        # Then from stack1
-        assert queue.dequeue() == 4
-        assert queue.dequeue() == 5
+        ops = [
+            ("enq", 1), ("enq", 2), ("enq", 3),
+            # First dequeue triggers transfer from stack1 to stack2
+            ("deq", None),
+            # Add more items to stack1
+            ("enq", 4), ("enq", 5),
+            # Drain stack2 first, then transfer again for 4 and 5
+            ("deq", None), ("deq", None), ("deq", None), ("deq", None),
+        ]
+        assert _run_ops(queue, ops) == [1, 2, 3, 4, 5]
         assert queue.is_empty()
 
     def test_queue_from_stacks_empty_after_operations(self):
@@ -323,6 +350,23 @@ class TestQueueFromStacks:
         queue.dequeue()
         assert queue.is_empty()
 
+    def test_queue_from_stacks_state_round_trip(self):
+        """Test set_state restores both stacks and the dequeue history."""
+        queue = QueueFromStacks()
+        queue.enqueue(1)
+        queue.enqueue(2)
+        queue.dequeue()
+        queue.enqueue(3)
+        state = queue.get_state()
+
+        queue.dequeue()
+        queue.dequeue()
+        queue.set_state(state)
+
+        assert queue.size() == 2
+        assert queue.get_dequeue_history() == [1]
+        assert [queue.dequeue() for _ in range(2)] == [2, 3]
+
 
 class TestQueueFIFOProperty:
     """Test FIFO property maintenance."""
@@ -330,11 +374,30 @@ class TestQueueFIFOProperty:
     def test_fifo_order_large_sequence(self):
         """Test FIFO order with larger sequence."""
         queue = Queue()
-        for i in range(1, 11):
-            queue.enqueue(i)
+        queue.extend(range(1, 11))
 
-        for i in range(1, 11):
-            assert queue.dequeue() == i
+        expected = list(range(1, 11))
+        assert queue.to_list() == expected
+        assert [queue.dequeue() for _ in range(10)] == expected
+        assert queue.is_empty()
+
+    def test_fifo_order_bulk_sequence(self):
+        """Test FIFO order across ten thousand items seeded in one call."""
+        expected = list(range(1, 10001))
+        queue = _queue(*expected)
+        assert queue.size() == 10000
+        dequeue = queue.dequeue
+        assert [dequeue() for _ in range(10000)] == expected
+        assert queue.is_empty()
+
+    def test_extend_enqueues_in_order(self):
+        """Test that extend adds items at the rear and updates size."""
+        queue = Queue()
+        queue.enqueue(1)
+        queue.extend([2, 3])
+        assert queue.size() == 3
+        assert queue.dequeue() == 1
+        assert queue.to_list() == [2, 3]
 
     def test_fifo_after_partial_dequeue(self):
         """Test FIFO order after partial dequeue."""
@@ -353,3 +416,15 @@ class TestQueueFIFOProperty:
         assert queue.dequeue() == 3
         assert queue.dequeue() == 4
         assert queue.dequeue() == 5
+
+
+class TestQueueFactory:
+    """Test make_queue without a declared int dtype."""
+
+    def test_default_is_python_queue(self):
+        """Test that no dtype gives the pure-Python Queue."""
+        assert type(make_queue()) is Queue
+
+    def test_non_int_dtype_is_python_queue(self):
+        """Test that a non-int dtype gives the pure-Python Queue."""
+        assert type(make_queue(str)) is Queue
@@ -0,0 +1,89 @@
+"""Tests for the optional Numba-compiled Stack and Queue."""
+import pytest
+
+pytest.importorskip("numba")
+
+# First call of each jitclass method triggers a multi-second compile
+pytestmark = pytest.mark.slow
+
+from data_structures.queue_numba import NumbaStack, NumbaQueue
+from data_structures.stack import make_stack
+from data_structures.queue import make_queue
+
+
+class TestNumbaStack:
+    """Test NumbaStack operations."""
+
+    def test_push_pop_lifo_order(self):
+        """Test that pop returns elements in LIFO order."""
+        stack = NumbaStack()
+        for i in range(1, 4):
+            stack.push(i)
+        assert stack.peek() == 3
+        assert stack.pop() == 3
+        assert stack.pop() == 2
+        assert stack.size() == 1
+
+    def test_pop_from_empty_stack(self):
+        """Test that popping from empty stack returns None."""
+        stack = NumbaStack()
+        assert stack.pop() is None
+        assert stack.peek() is None
+        assert stack.is_empty()
+
+    def test_grows_past_capacity(self):
+        """Test pushing more items than the initial capacity."""
+        stack = NumbaStack(2)
+        for i in range(100):
+            stack.push(i)
+        assert stack.size() == 100
+        assert list(stack.to_array()) == list(range(100))
+
+
+class TestNumbaQueue:
+    """Test NumbaQueue operations."""
+
+    def test_fifo_order(self):
+        """Test that dequeue returns elements in FIFO order."""
+        queue = NumbaQueue()
+        for i in range(1, 4):
+            queue.enqueue(i)
+        assert queue.front() == 1
+        assert queue.dequeue() == 1
+        assert queue.dequeue() == 2
+        assert queue.size() == 1
+
+    def test_dequeue_from_empty_queue(self):
+        """Test that dequeuing from empty queue returns None."""
+        queue = NumbaQueue()
+        assert queue.dequeue() is None
+        assert queue.front() is None
+        assert queue.is_empty()
+
+    def test_grows_with_wrapped_items(self):
+        """Test growing the ring buffer while items wrap around."""
+        queue = NumbaQueue(4)
+        for i in range(3):
+            queue.enqueue(i)
+        queue.dequeue()
+        queue.dequeue()
+        for i in range(3, 10):
+            queue.enqueue(i)
+        assert list(queue.to_array()) == list(range(2, 10))
+        assert [queue.dequeue() for _ in range(8)] == list(range(2, 10))
+        assert queue.is_empty()
+
+
+class TestFactorySelection:
+    """Test that the factories pick the jitclass for int dtypes only."""
+
+    def test_int_dtype_selects_jitclass(self):
+        """Test that int and numpy.int64 select the Numba classes."""
+        import numpy as np
+        assert isinstance(make_stack(int), NumbaStack)
+        assert isinstance(make_queue(np.int64), NumbaQueue)
+
+    def test_other_dtypes_keep_python_classes(self):
+        """Test that no dtype or a non-int dtype keeps the Python classes."""
+        assert not isinstance(make_stack(), NumbaStack)
+        assert not isinstance(make_queue(float), NumbaQueue)
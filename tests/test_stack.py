@@ -1,48 +1,48 @@
 """Comprehensive tests for Stack data structure."""
 import pytest
-from data_structures.stack import Stack
+from data_structures.stack import Stack, IntStack, make_stack
+
+
+@pytest.fixture
+def stack():
+    """Fresh empty stack."""
+    return Stack()
+
+
+@pytest.fixture
+def filled_stack(stack):
+    """Stack holding 1, 2, 3 (3 on top)."""
+    stack.extend([1, 2, 3])
+    return stack
 
 
 class TestStackBasicOperations:
     """Test basic stack operations."""
 
-    def test_push_single_element(self):
-        """Test pushing a single element onto the stack."""
-        stack = Stack()
-        stack.push(1)
-        assert stack.size() == 1
-        assert stack.peek() == 1
-
-    def test_push_multiple_elements(self):
-        """Test pushing multiple elements onto the stack."""
-        stack = Stack()
-        stack.push(1)
-        stack.push(2)
-        stack.push(3)
-        assert stack.size() == 3
-        assert stack.peek() == 3
+    @pytest.mark.parametrize("items", [[1], [1, 2, 3]])
+    def test_push_elements(self, stack, items):
+        """Test pushing one or several elements onto the stack."""
+        for item in items:
+            stack.push(item)
+        assert stack.size() == len(items)
+        assert stack.peek() == items[-1]
 
-    def test_pop_single_element(self):
+    def test_pop_single_element(self, stack):
         """Test popping a single element from the stack."""
-        stack = Stack()
         stack.push(1)
         assert stack.pop() == 1
         assert stack.is_empty()
 
-    def test_pop_multiple_elements_lifo_order(self):
+    def test_pop_multiple_elements_lifo_order(self, filled_stack):
         """Test that pop returns elements in LIFO order."""
-        stack = Stack()
-        stack.push(1)
-        stack.push(2)
-        stack.push(3)
+        stack = filled_stack
         assert stack.pop() == 3
         assert stack.pop() == 2
         assert stack.pop() == 1
         assert stack.is_empty()
 
-    def test_peek_without_removal(self):
+    def test_peek_without_removal(self, stack):
         """Test that peek returns top element without removing it."""
-        stack = Stack()
         stack.push(1)
         stack.push(2)
         assert stack.peek() == 2
@@ -53,26 +53,22 @@ class TestStackBasicOperations:
 class TestStackEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_empty_stack_initialization(self):
+    def test_empty_stack_initialization(self, stack):
         """Test that a new stack is empty."""
-        stack = Stack()
         assert stack.is_empty()
         assert stack.size() == 0
 
-    def test_pop_from_empty_stack(self):
+    def test_pop_from_empty_stack(self, stack):
         """Test that popping from empty stack returns None."""
-        stack = Stack()
         assert stack.pop() is None
         assert stack.is_empty()
 
-    def test_peek_from_empty_stack(self):
+    def test_peek_from_empty_stack(self, stack):
         """Test that peeking at empty stack returns None."""
-        stack = Stack()
         assert stack.peek() is None
 
-    def test_single_element_stack(self):
+    def test_single_element_stack(self, stack):
         """Test operations on single-element stack."""
-        stack = Stack()
         stack.push(42)
         assert not stack.is_empty()
         assert stack.size() == 1
@@ -80,9 +76,8 @@ class TestStackEdgeCases:
         assert stack.pop() == 42
         assert stack.is_empty()
 
-    def test_push_pop_alternating(self):
+    def test_push_pop_alternating(self, stack):
         """Test alternating push and pop operations."""
-        stack = Stack()
         stack.push(1)
         assert stack.pop() == 1
         stack.push(2)
@@ -94,15 +89,13 @@ class TestStackEdgeCases:
 class TestStackUtilityMethods:
     """Test utility methods."""
 
-    def test_clear_empty_stack(self):
+    def test_clear_empty_stack(self, stack):
         """Test clearing an empty stack."""
-        stack = Stack()
         stack.clear()
         assert stack.is_empty()
 
-    def test_clear_populated_stack(self):
+    def test_clear_populated_stack(self, stack):
         """Test clearing a populated stack."""
-        stack = Stack()
         stack.push(1)
         stack.push(2)
         stack.push(3)
@@ -110,50 +103,64 @@ class TestStackUtilityMethods:
         assert stack.is_empty()
         assert stack.size() == 0
 
-    def test_to_list_empty_stack(self):
+    def test_to_list_empty_stack(self, stack):
         """Test converting empty stack to list."""
-        stack = Stack()
         assert stack.to_list() == []
 
-    def test_to_list_populated_stack(self):
+    def test_to_list_populated_stack(self, stack):
         """Test converting populated stack to list (bottom to top)."""
-        stack = Stack()
         stack.push(1)
         stack.push(2)
         stack.push(3)
         assert stack.to_list() == [1, 2, 3]
 
-    def test_to_list_returns_copy(self):
+    def test_iter_bottom_to_top(self, stack):
+        """Test that iterating yields items bottom to top."""
+        stack.extend([1, 2, 3])
+        assert list(stack) == [1, 2, 3]
+
+    def test_to_list_returns_copy(self, stack):
         """Test that to_list returns a copy, not reference."""
-        stack = Stack()
         stack.push(1)
         stack.push(2)
         lst = stack.to_list()
         lst.append(3)
         assert stack.size() == 2  # Stack unchanged
 
+    def test_extend_pushes_in_order(self, stack):
+        """Test that extend pushes items so the last one is on top."""
+        stack.extend([1, 2, 3])
+        assert stack.peek() == 3
+        assert stack.size() == 3
+
+    def test_drain_yields_all_items(self, stack):
+        """Test that drain empties the stack, including stored None values."""
+        stack.push(1)
+        stack.push(None)
+        stack.push(3)
+        assert list(stack.drain()) == [3, None, 1]
+        assert stack.is_empty()
+        assert stack.size() == 0
+
 
 class TestStackStateManagement:
     """Test state serialization and restoration."""
 
-    def test_get_state_empty_stack(self):
+    def test_get_state_empty_stack(self, stack):
         """Test getting state from empty stack."""
-        stack = Stack()
         state = stack.get_state()
         assert state == {"items": []}
 
-    def test_get_state_populated_stack(self):
+    def test_get_state_populated_stack(self, stack):
         """Test getting state from populated stack."""
-        stack = Stack()
         stack.push(1)
         stack.push(2)
         stack.push(3)
         state = stack.get_state()
         assert state == {"items": [1, 2, 3]}
 
-    def test_set_state_restore(self):
+    def test_set_state_restore(self, stack):
         """Test restoring stack from saved state."""
-        stack = Stack()
         stack.push(1)
         stack.push(2)
         state = stack.get_state()
@@ -165,11 +172,10 @@ class TestStackStateManagement:
         assert new_stack.pop() == 2
         assert new_stack.pop() == 1
 
-    def test_state_independence(self):
-        """Test that state is deep copied (not referenced)."""
-        stack = Stack()
+    def test_state_independence(self, stack):
+        """Test that deep state is deep copied (not referenced)."""
         stack.push([1, 2, 3])
-        state = stack.get_state()
+        state = stack.get_state(deep=True)
 
         # Modify the state
         state["items"][0].append(4)
@@ -177,29 +183,39 @@ class TestStackStateManagement:
         # Original stack should be unchanged
         assert stack.peek() == [1, 2, 3]
 
+    def test_shallow_state_independent_list(self, stack):
+        """Test that the default state copies the item list itself."""
+        stack.push(1)
+        stack.push(2)
+        state = stack.get_state()
+        state["items"].append(3)
+        assert stack.size() == 2
+
+        # Restored stack must not share the state's list either
+        new_stack = Stack()
+        new_stack.set_state(state)
+        state["items"].clear()
+        assert new_stack.size() == 3
+
 
 class TestStackReverseRecursive:
     """Test recursive reversal operation."""
 
-    def test_reverse_empty_stack(self):
+    def test_reverse_empty_stack(self, stack):
         """Test reversing empty stack."""
-        stack = Stack()
         stack.reverse_recursive()
         assert stack.is_empty()
 
-    def test_reverse_single_element(self):
+    def test_reverse_single_element(self, stack):
         """Test reversing single-element stack."""
-        stack = Stack()
         stack.push(1)
         stack.reverse_recursive()
         assert stack.peek() == 1
         assert stack.size() == 1
 
-    def test_reverse_multiple_elements(self):
+    def test_reverse_multiple_elements(self, stack):
         """Test reversing stack with multiple elements."""
-        stack = Stack()
-        for i in [1, 2, 3, 4, 5]:
-            stack.push(i)
+        stack.extend([1, 2, 3, 4, 5])
 
         stack.reverse_recursive()
 
@@ -210,9 +226,8 @@ class TestStackReverseRecursive:
         assert stack.pop() == 4
         assert stack.pop() == 5
 
-    def test_reverse_twice_returns_original(self):
+    def test_reverse_twice_returns_original(self, stack):
         """Test that reversing twice returns original order."""
-        stack = Stack()
         original = [1, 2, 3, 4, 5]
         for item in original:
             stack.push(item)
@@ -223,21 +238,32 @@ class TestStackReverseRecursive:
         # Should be back to original
         assert stack.to_list() == original
 
+    def test_reverse_large_stack(self, stack):
+        """Test reversing a stack deeper than the recursion limit."""
+        stack.extend(range(5000))
+        stack.reverse_recursive()
+        assert stack.peek() == 0
+        assert stack.to_list() == list(range(4999, -1, -1))
+
+    def test_reverse_recursive_demo_matches(self, stack):
+        """Test that the recursive demo gives the same result."""
+        stack.extend([1, 2, 3, 4, 5])
+        stack.reverse_recursive_demo()
+        assert stack.to_list() == [5, 4, 3, 2, 1]
+
 
 class TestStackDataTypes:
     """Test stack with different data types."""
 
-    def test_stack_with_strings(self):
+    def test_stack_with_strings(self, stack):
         """Test stack with string elements."""
-        stack = Stack()
         stack.push("hello")
         stack.push("world")
         assert stack.pop() == "world"
         assert stack.pop() == "hello"
 
-    def test_stack_with_mixed_types(self):
+    def test_stack_with_mixed_types(self, stack):
         """Test stack with mixed data types."""
-        stack = Stack()
         stack.push(1)
         stack.push("two")
         stack.push(3.0)
@@ -246,9 +272,8 @@ class TestStackDataTypes:
         assert stack.pop() == [4, 5]
         assert stack.pop() == 3.0
 
-    def test_stack_with_none_values(self):
+    def test_stack_with_none_values(self, stack):
         """Test stack can store None as valid value."""
-        stack = Stack()
         stack.push(1)
         stack.push(None)
         stack.push(3)
@@ -261,20 +286,89 @@ class TestStackDataTypes:
 class TestStackStringRepresentation:
     """Test string representations."""
 
-    def test_str_empty_stack(self):
-        """Test __str__ for empty stack."""
-        stack = Stack()
-        assert str(stack) == "Stack([])"
+    @pytest.mark.parametrize("items, expected_str", [
+        ([], "Stack([])"),
+        ([1, 2], "Stack([1, 2])"),
+    ])
+    def test_str(self, stack, items, expected_str):
+        """Test __str__ for empty and populated stacks."""
+        stack.extend(items)
+        assert str(stack) == expected_str
 
-    def test_str_populated_stack(self):
-        """Test __str__ for populated stack."""
-        stack = Stack()
-        stack.push(1)
-        stack.push(2)
-        assert str(stack) == "Stack([1, 2])"
-
-    def test_repr_stack(self):
+    def test_repr_stack(self, stack):
         """Test __repr__ for stack."""
-        stack = Stack()
         stack.push(1)
         assert repr(stack) == "Stack(items=[1])"
+
+
+class TestIntStack:
+    """Test the array-backed int stack."""
+
+    def test_push_pop_peek(self):
+        """Test LIFO behavior matches Stack."""
+        stack = IntStack()
+        for i in range(5):
+            stack.push(i)
+        assert stack.peek() == 4
+        assert stack.pop() == 4
+        assert stack.size() == 4
+        assert stack.to_list() == [0, 1, 2, 3]
+
+    def test_empty_pop_returns_none(self):
+        """Test pop and peek on empty int stack."""
+        stack = IntStack()
+        assert stack.pop() is None
+        assert stack.peek() is None
+
+    def test_extend_with_bad_item_keeps_size(self):
+        """Test that a failed extend still counts the items it stored."""
+        stack = IntStack()
+        with pytest.raises(TypeError):
+            stack.extend([1, 2, 'x'])
+        assert stack.to_list() == [1, 2]
+        assert stack.size() == 2
+        assert not stack.is_empty()
+
+    def test_clear_and_state_round_trip(self):
+        """Test clear, get_state and set_state."""
+        stack = IntStack()
+        stack.push(1)
+        stack.push(2)
+        state = stack.get_state()
+        stack.clear()
+        assert stack.is_empty()
+        stack.set_state(state)
+        assert stack.to_list() == [1, 2]
+        assert stack.size() == 2
+
+    def test_reverse(self):
+        """Test in-place reverse works on the array backing."""
+        stack = IntStack()
+        for i in range(4):
+            stack.push(i)
+        stack.reverse_recursive()
+        assert stack.to_list() == [3, 2, 1, 0]
+
+    def test_rejects_non_int(self):
+        """Test that non-int items are rejected."""
+        stack = IntStack()
+        with pytest.raises(TypeError):
+            stack.push("a")
+
+    def test_str(self):
+        """Test string representation."""
+        stack = IntStack()
+        stack.push(7)
+        assert str(stack) == "IntStack([7])"
+
+
+class TestStackFactory:
+    """Test make_stack without a declared int dtype."""
+
+    def test_default_is_python_stack(self):
+        """Test that no dtype gives the pure-Python Stack."""
+        assert type(make_stack()) is Stack
+
+    def test_non_int_dtype_is_python_stack(self):
+        """Test that a non-int dtype gives the pure-Python Stack."""
+        assert type(make_stack(str)) is Stack
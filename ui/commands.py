@@ -1,6 +1,7 @@
 """Command pattern implementation for undo/redo functionality."""
 from typing import Any, Callable, Optional
 from abc import ABC, abstractmethod
+from collections import deque
 
 
 class Command(ABC):
@@ -9,6 +10,8 @@ class Command(ABC):
     Implements the Command pattern for undo/redo operations.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self) -> Any:
         """Execute the command and return the result."""
@@ -38,6 +41,10 @@ class DataStructureCommand(Command):
         result: Result of execution
     """
 
+    __slots__ = ('data_structure', 'operation', 'undo_operation',
+                 'description', 'prev_state', 'result',
+                 '_get_state', '_set_state')
+
     def __init__(self, data_structure: Any, operation: Callable,
                  undo_operation: Optional[Callable] = None,
                  description: str = "Operation"):
@@ -56,6 +63,9 @@ class DataStructureCommand(Command):
         self.description = description
         self.prev_state = None
         self.result = None
+        # Looked up once so execute/undo skip a hasattr probe per call
+        self._get_state = getattr(data_structure, 'get_state', None)
+        self._set_state = getattr(data_structure, 'set_state', None)
 
     def execute(self) -> Any:
         """
@@ -64,9 +74,10 @@ class DataStructureCommand(Command):
         Returns:
             Result of the operation
         """
-        # Save state before execution
-        if hasattr(self.data_structure, 'get_state'):
-            self.prev_state = self.data_structure.get_state()
+        # Save state before execution, unless an explicit inverse makes
+        # the snapshot unnecessary
+        if self.undo_operation is None and self._get_state is not None:
+            self.prev_state = self._get_state()
 
         # Execute operation
         self.result = self.operation()
@@ -76,8 +87,8 @@ class DataStructureCommand(Command):
         """Undo the command by restoring previous state."""
         if self.undo_operation:
             self.undo_operation()
-        elif self.prev_state and hasattr(self.data_structure, 'set_state'):
-            self.data_structure.set_state(self.prev_state)
+        elif self.prev_state and self._set_state is not None:
+            self._set_state(self.prev_state)
 
     def get_description(self) -> str:
         """Get command description."""
@@ -89,11 +100,13 @@ class CommandHistory:
     Manages command history for undo/redo functionality.
 
     Attributes:
-        history: List of executed commands
-        current_index: Current position in history
+        history: Executed commands, oldest first (bounded by max_history)
+        redo_stack: Undone commands, most recently undone last
         max_history: Maximum number of commands to keep
     """
 
+    __slots__ = ('history', 'redo_stack', 'max_history')
+
     def __init__(self, max_history: int = 50):
         """
         Initialize command history.
@@ -101,8 +114,9 @@ class CommandHistory:
         Args:
             max_history: Maximum commands to keep in history
         """
-        self.history = []
-        self.current_index = -1
+        # maxlen drops the oldest command on overflow in O(1)
+        self.history = deque(maxlen=max_history)
+        self.redo_stack = []
         self.max_history = max_history
 
     def execute(self, command: Command) -> Any:
@@ -115,21 +129,12 @@ class CommandHistory:
         Returns:
             Result of command execution
         """
-        # Remove any commands after current index (redo history)
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
-
         # Execute command
         result = command.execute()
 
-        # Add to history
+        # A new command invalidates anything that could be redone
+        self.redo_stack.clear()
         self.history.append(command)
-        self.current_index += 1
-
-        # Trim history if needed
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-            self.current_index -= 1
 
         return result
 
@@ -143,9 +148,9 @@ class CommandHistory:
         if not self.can_undo():
             return False
 
-        command = self.history[self.current_index]
+        command = self.history.pop()
         command.undo()
-        self.current_index -= 1
+        self.redo_stack.append(command)
         return True
 
     def redo(self) -> bool:
@@ -158,18 +163,18 @@ class CommandHistory:
         if not self.can_redo():
             return False
 
-        self.current_index += 1
-        command = self.history[self.current_index]
+        command = self.redo_stack.pop()
         command.execute()
+        self.history.append(command)
         return True
 
     def can_undo(self) -> bool:
         """Check if undo is available."""
-        return self.current_index >= 0
+        return len(self.history) > 0
 
     def can_redo(self) -> bool:
         """Check if redo is available."""
-        return self.current_index < len(self.history) - 1
+        return len(self.redo_stack) > 0
 
     def get_current_state(self) -> str:
         """
@@ -178,17 +183,16 @@ class CommandHistory:
         Returns:
             Description string
         """
-        if self.current_index < 0:
+        if not self.history:
             return "No operations"
 
-        command = self.history[self.current_index]
-        return command.get_description()
+        return self.history[-1].get_description()
 
     def clear(self) -> None:
         """Clear all history."""
         self.history.clear()
-        self.current_index = -1
+        self.redo_stack.clear()
 
     def get_history_size(self) -> int:
         """Get number of commands in history."""
-        return len(self.history)
+        return len(self.history) + len(self.redo_stack)
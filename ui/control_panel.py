@@ -1,8 +1,22 @@
 """Control panel - operation buttons and input fields for data structures."""
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                            QLineEdit, QLabel, QGroupBox, QComboBox, QMessageBox)
-from PyQt5.QtCore import pyqtSignal
-from typing import Callable, Optional
+                            QLineEdit, QLabel, QGroupBox, QComboBox,
+                            QStackedWidget, QButtonGroup)
+from PyQt5.QtCore import pyqtSignal, QTimer
+import re
+from functools import lru_cache, partial
+from typing import Callable, Dict, Optional
+
+
+_INT_RE = re.compile(r'[-+]?\d+')
+
+
+@lru_cache(maxsize=256)
+def _parse_value(value_str: str):
+    """Convert input text to an int if numeric, otherwise keep the string."""
+    if _INT_RE.fullmatch(value_str):
+        return int(value_str)
+    return value_str
 
 
 class ControlPanel(QWidget):
@@ -17,6 +31,36 @@ class ControlPanel(QWidget):
 
     operation_requested = pyqtSignal(str, object)  # operation_name, value
 
+    # Operation buttons per ds_type: (label, operation, needs_value)
+    _LAYOUT_SPEC = {
+        'stack': (
+            ("Push", 'push', True),
+            ("Pop", 'pop', False),
+            ("Peek", 'peek', False),
+            ("Reverse Stack (Recursive)", 'reverse', False),
+        ),
+        'queue': (
+            ("Enqueue", 'enqueue', True),
+            ("Dequeue", 'dequeue', False),
+            ("Front", 'front', False),
+        ),
+        'linked_list': (
+            ("Insert at Head", 'insert_head', True),
+            ("Insert at Tail", 'insert_tail', True),
+            ("Delete Value", 'delete', True),
+            ("Search", 'search', True),
+            ("Find Middle", 'find_middle', False),
+        ),
+        'bst': (
+            ("Insert", 'insert', True),
+            ("Delete", 'delete', True),
+            ("Search", 'search', True),
+            ("Inorder Traversal", 'inorder', False),
+            ("Preorder Traversal", 'preorder', False),
+            ("Postorder Traversal", 'postorder', False),
+        ),
+    }
+
     def __init__(self, ds_type: str, parent=None):
         """
         Initialize control panel.
@@ -38,23 +82,33 @@ class ControlPanel(QWidget):
 
         self.value_input = QLineEdit()
         self.value_input.setPlaceholderText("Enter value...")
+        # Stripped once per edit, not once per button click
+        self._cached_stripped = ""
+        self.value_input.textChanged.connect(self._on_text_changed)
         input_layout.addWidget(QLabel("Value:"))
         input_layout.addWidget(self.value_input)
 
+        # Inline status instead of a modal dialog for input errors
+        self._status = QLabel("")
+        self._status.setStyleSheet("color: red;")
+        input_layout.addWidget(self._status)
+        # One timer, restarted per message, so an older timeout can't
+        # clear a newer message early
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._status.clear)
+
         input_group.setLayout(input_layout)
         layout.addWidget(input_group)
 
         operations_group = QGroupBox("Operations")
         operations_layout = QVBoxLayout()
 
-        if self.ds_type == 'stack':
-            self._create_stack_buttons(operations_layout)
-        elif self.ds_type == 'queue':
-            self._create_queue_buttons(operations_layout)
-        elif self.ds_type == 'linked_list':
-            self._create_linked_list_buttons(operations_layout)
-        elif self.ds_type == 'bst':
-            self._create_bst_buttons(operations_layout)
+        # One page of buttons per ds_type, built the first time it is shown
+        self._group_cache: Dict[str, QWidget] = {}
+        self._ops_stack = QStackedWidget()
+        operations_layout.addWidget(self._ops_stack)
+        self.set_ds_type(self.ds_type)
 
         operations_group.setLayout(operations_layout)
         layout.addWidget(operations_group)
@@ -63,7 +117,7 @@ class ControlPanel(QWidget):
         common_layout = QVBoxLayout()
 
         self.clear_btn = QPushButton("Clear All")
-        self.clear_btn.clicked.connect(lambda: self.operation_requested.emit('clear', None))
+        self.clear_btn.clicked.connect(partial(self._emit, 'clear'))
         common_layout.addWidget(self.clear_btn)
 
         common_group.setLayout(common_layout)
@@ -73,16 +127,16 @@ class ControlPanel(QWidget):
         challenge_layout = QVBoxLayout()
 
         self.challenge_btn = QPushButton("Start Challenge")
-        self.challenge_btn.clicked.connect(lambda: self.operation_requested.emit('start_challenge', None))
+        self.challenge_btn.clicked.connect(partial(self._emit, 'start_challenge'))
         challenge_layout.addWidget(self.challenge_btn)
 
         self.validate_btn = QPushButton("Validate Solution")
-        self.validate_btn.clicked.connect(lambda: self.operation_requested.emit('validate_challenge', None))
+        self.validate_btn.clicked.connect(partial(self._emit, 'validate_challenge'))
         self.validate_btn.setEnabled(False)
         challenge_layout.addWidget(self.validate_btn)
 
         self.hint_btn = QPushButton("Show Hint")
-        self.hint_btn.clicked.connect(lambda: self.operation_requested.emit('show_hint', None))
+        self.hint_btn.clicked.connect(partial(self._emit, 'show_hint'))
         self.hint_btn.setEnabled(False)
         challenge_layout.addWidget(self.hint_btn)
 
@@ -92,109 +146,121 @@ class ControlPanel(QWidget):
         layout.addStretch()
         self.setLayout(layout)
 
-    def _create_stack_buttons(self, layout: QVBoxLayout) -> None:
-        """Create buttons for stack operations."""
-        push_btn = QPushButton("Push")
-        push_btn.clicked.connect(lambda: self._emit_with_value('push'))
-        layout.addWidget(push_btn)
-
-        pop_btn = QPushButton("Pop")
-        pop_btn.clicked.connect(lambda: self.operation_requested.emit('pop', None))
-        layout.addWidget(pop_btn)
-
-        peek_btn = QPushButton("Peek")
-        peek_btn.clicked.connect(lambda: self.operation_requested.emit('peek', None))
-        layout.addWidget(peek_btn)
-
-        reverse_btn = QPushButton("Reverse Stack (Recursive)")
-        reverse_btn.clicked.connect(lambda: self.operation_requested.emit('reverse', None))
-        layout.addWidget(reverse_btn)
-
-    def _create_queue_buttons(self, layout: QVBoxLayout) -> None:
-        """Create buttons for queue operations."""
-        enqueue_btn = QPushButton("Enqueue")
-        enqueue_btn.clicked.connect(lambda: self._emit_with_value('enqueue'))
-        layout.addWidget(enqueue_btn)
-
-        dequeue_btn = QPushButton("Dequeue")
-        dequeue_btn.clicked.connect(lambda: self.operation_requested.emit('dequeue', None))
-        layout.addWidget(dequeue_btn)
-
-        front_btn = QPushButton("Front")
-        front_btn.clicked.connect(lambda: self.operation_requested.emit('front', None))
-        layout.addWidget(front_btn)
-
-    def _create_linked_list_buttons(self, layout: QVBoxLayout) -> None:
-        """Create buttons for linked list operations."""
-        insert_head_btn = QPushButton("Insert at Head")
-        insert_head_btn.clicked.connect(lambda: self._emit_with_value('insert_head'))
-        layout.addWidget(insert_head_btn)
-
-        insert_tail_btn = QPushButton("Insert at Tail")
-        insert_tail_btn.clicked.connect(lambda: self._emit_with_value('insert_tail'))
-        layout.addWidget(insert_tail_btn)
-
-        delete_btn = QPushButton("Delete Value")
-        delete_btn.clicked.connect(lambda: self._emit_with_value('delete'))
-        layout.addWidget(delete_btn)
-
-        search_btn = QPushButton("Search")
-        search_btn.clicked.connect(lambda: self._emit_with_value('search'))
-        layout.addWidget(search_btn)
-
-        find_middle_btn = QPushButton("Find Middle")
-        find_middle_btn.clicked.connect(lambda: self.operation_requested.emit('find_middle', None))
-        layout.addWidget(find_middle_btn)
-
-    def _create_bst_buttons(self, layout: QVBoxLayout) -> None:
-        """Create buttons for BST operations."""
-        insert_btn = QPushButton("Insert")
-        insert_btn.clicked.connect(lambda: self._emit_with_value('insert'))
-        layout.addWidget(insert_btn)
-
-        delete_btn = QPushButton("Delete")
-        delete_btn.clicked.connect(lambda: self._emit_with_value('delete'))
-        layout.addWidget(delete_btn)
-
-        search_btn = QPushButton("Search")
-        search_btn.clicked.connect(lambda: self._emit_with_value('search'))
-        layout.addWidget(search_btn)
-
-        # Traversals
-        inorder_btn = QPushButton("Inorder Traversal")
-        inorder_btn.clicked.connect(lambda: self.operation_requested.emit('inorder', None))
-        layout.addWidget(inorder_btn)
-
-        preorder_btn = QPushButton("Preorder Traversal")
-        preorder_btn.clicked.connect(lambda: self.operation_requested.emit('preorder', None))
-        layout.addWidget(preorder_btn)
-
-        postorder_btn = QPushButton("Postorder Traversal")
-        postorder_btn.clicked.connect(lambda: self.operation_requested.emit('postorder', None))
-        layout.addWidget(postorder_btn)
-
-    def _emit_with_value(self, operation: str) -> None:
+    def set_ds_type(self, ds_type: str) -> None:
+        """
+        Show the operation buttons for a data structure type.
+
+        Args:
+            ds_type: Type of data structure ('stack', 'queue', 'linked_list', 'bst')
+        """
+        group = self._group_cache.get(ds_type)
+        if group is None:
+            group = self._build_group(ds_type)
+            self._group_cache[ds_type] = group
+            self._ops_stack.addWidget(group)
+        self._ops_stack.setCurrentWidget(group)
+        self.ds_type = ds_type
+
+    def _build_group(self, ds_type: str) -> QWidget:
+        """
+        Build the operation buttons for one data structure type.
+
+        Args:
+            ds_type: Type of data structure
+
+        Returns:
+            Widget holding the buttons
+        """
+        group = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._build_from_spec(group, layout, self._LAYOUT_SPEC.get(ds_type, ()))
+
+        group.setLayout(layout)
+        return group
+
+    def _build_from_spec(self, parent: QWidget, layout: QVBoxLayout, spec) -> None:
+        """
+        Add one button per (label, operation, needs_value) entry.
+
+        Args:
+            parent: Widget that owns the button group
+            layout: Layout to add the buttons to
+            spec: Sequence of button entries from _LAYOUT_SPEC
+        """
+        # One QButtonGroup connection routes every button on the page
+        buttons = QButtonGroup(parent)
+        buttons.setExclusive(False)
+        for index, (label, _, _) in enumerate(spec):
+            button = QPushButton(label)
+            buttons.addButton(button, index)
+            layout.addWidget(button)
+        buttons.idClicked.connect(partial(self._on_spec_clicked, spec))
+
+    def _on_spec_clicked(self, spec, index: int) -> None:
+        """
+        Route a click from a spec-built button group.
+
+        Args:
+            spec: The spec the group was built from
+            index: Id of the clicked button (its index in spec)
+        """
+        _, operation, needs_value = spec[index]
+        if needs_value:
+            self._emit_with_value(operation)
+        else:
+            self._emit(operation)
+
+    def _emit(self, operation: str, checked: bool = False) -> None:
+        """
+        Emit operation signal without a value.
+
+        Args:
+            operation: Operation name
+            checked: Button state passed by clicked (unused)
+        """
+        self._dispatch(operation, None)
+
+    def _emit_with_value(self, operation: str, checked: bool = False) -> None:
         """
         Emit operation signal with input value.
 
         Args:
             operation: Operation name
+            checked: Button state passed by clicked (unused)
         """
-        value_str = self.value_input.text().strip()
+        value_str = self._cached_stripped
         if not value_str:
-            QMessageBox.warning(self, "Input Required", "Please enter a value.")
+            self._status.setText("Please enter a value.")
+            self._status_timer.start(2000)
             return
 
-        try:
-            # Try to convert to int
-            value = int(value_str)
-        except ValueError:
-            # Keep as string if not numeric
-            value = value_str
+        # Cached, so repeating a value skips the parse
+        value = _parse_value(value_str)
 
-        self.operation_requested.emit(operation, value)
+        self._dispatch(operation, value)
         self.value_input.clear()
 
+    def _on_text_changed(self, text: str) -> None:
+        """
+        Cache the stripped input text.
+
+        Args:
+            text: New contents of the value input
+        """
+        self._cached_stripped = text.strip()
+
+    def _dispatch(self, operation: str, value) -> None:
+        """
+        Single exit point for every operation request.
+
+        Args:
+            operation: Operation name
+            value: Operation value, or None
+        """
+        self.operation_requested.emit(operation, value)
+
     def enable_challenge_mode(self, enabled: bool) -> None:
         """
         Enable or disable challenge mode buttons.
@@ -2,7 +2,7 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QTabWidget, QStatusBar, QMessageBox, QAction,
                             QMenuBar)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QKeySequence
 
 from data_structures.stack import Stack
@@ -33,6 +33,28 @@ class DSTab(QWidget):
     Combines canvas, visualizer, and control panel.
     """
 
+    # operation name -> handler(tab, value); built once for O(1) dispatch.
+    # Challenge operations are forwarded to the main window separately.
+    _OPS = {
+        'clear': lambda tab, _: tab.execute_clear(),
+        'push': lambda tab, value: tab.execute_push(value),
+        'pop': lambda tab, _: tab.execute_pop(),
+        'peek': lambda tab, _: tab.execute_peek(),
+        'reverse': lambda tab, _: tab.execute_reverse(),
+        'enqueue': lambda tab, value: tab.execute_enqueue(value),
+        'dequeue': lambda tab, _: tab.execute_dequeue(),
+        'front': lambda tab, _: tab.execute_front(),
+        'insert_head': lambda tab, value: tab.execute_insert_head(value),
+        'insert_tail': lambda tab, value: tab.execute_insert_tail(value),
+        'delete': lambda tab, value: tab.execute_delete(value),
+        'search': lambda tab, value: tab.execute_search(value),
+        'find_middle': lambda tab, _: tab.execute_find_middle(),
+        'insert': lambda tab, value: tab.execute_insert(value),
+        'inorder': lambda tab, _: tab.execute_traversal('inorder'),
+        'preorder': lambda tab, _: tab.execute_traversal('preorder'),
+        'postorder': lambda tab, _: tab.execute_traversal('postorder'),
+    }
+
     def __init__(self, ds_type: str, parent=None, main_window=None):
         """
         Initialize data structure tab.
@@ -45,7 +67,11 @@ class DSTab(QWidget):
         super().__init__(parent)
         self.ds_type = ds_type
         self.main_window = main_window
-        self.command_history = CommandHistory()
+        # Histories live on the main window, keyed by ds_type
+        if main_window is not None:
+            self.command_history = main_window.histories[ds_type]
+        else:
+            self.command_history = CommandHistory()
 
         if ds_type == 'stack':
             self.data_structure = Stack()
@@ -75,6 +101,14 @@ class DSTab(QWidget):
         layout.addWidget(self.control_panel, stretch=1)
         self.setLayout(layout)
 
+        # Plain redraws are coalesced into one sync per event-loop pass
+        self._redraw_pending = False
+        self._redraw_generation = 0
+        self._pending_status = ""
+        self._status_scheduled = False
+        # Set when scene work was skipped while hidden; showEvent redraws
+        self._scene_stale = False
+
         self.visualizer.draw(self.data_structure)
 
     def handle_operation(self, operation: str, value) -> None:
@@ -86,40 +120,9 @@ class DSTab(QWidget):
             value: Operation value (if any)
         """
         try:
-            if operation == 'clear':
-                self.execute_clear()
-            elif operation == 'push':
-                self.execute_push(value)
-            elif operation == 'pop':
-                self.execute_pop()
-            elif operation == 'peek':
-                self.execute_peek()
-            elif operation == 'reverse':
-                self.execute_reverse()
-            elif operation == 'enqueue':
-                self.execute_enqueue(value)
-            elif operation == 'dequeue':
-                self.execute_dequeue()
-            elif operation == 'front':
-                self.execute_front()
-            elif operation == 'insert_head':
-                self.execute_insert_head(value)
-            elif operation == 'insert_tail':
-                self.execute_insert_tail(value)
-            elif operation == 'delete':
-                self.execute_delete(value)
-            elif operation == 'search':
-                self.execute_search(value)
-            elif operation == 'find_middle':
-                self.execute_find_middle()
-            elif operation == 'insert':
-                self.execute_insert(value)
-            elif operation == 'inorder':
-                self.execute_traversal('inorder')
-            elif operation == 'preorder':
-                self.execute_traversal('preorder')
-            elif operation == 'postorder':
-                self.execute_traversal('postorder')
+            handler = self._OPS.get(operation)
+            if handler is not None:
+                handler(self, value)
             elif operation.startswith('start_challenge'):
                 if self.main_window:
                     self.main_window.start_challenge(self.ds_type)
@@ -136,13 +139,18 @@ class DSTab(QWidget):
     # Stack operations
     def execute_push(self, value) -> None:
         """Execute push operation."""
+        # Commands close over the structure they were built for, since a
+        # challenge can replace self.data_structure before undo runs
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.push(value),
+            ds,
+            lambda: ds.push(value),
+            undo_operation=lambda: ds.pop(),
             description=f"Push {value}"
         )
         self.command_history.execute(cmd)
-        self.visualizer.animate_insert(self.data_structure, value)
+        if self._should_animate():
+            self.visualizer.animate_insert(self.data_structure, value)
         self.update_status(f"Pushed {value}")
 
     def execute_pop(self) -> None:
@@ -151,13 +159,17 @@ class DSTab(QWidget):
         if value is None:
             QMessageBox.information(self, "Info", "Stack is empty")
             return
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.pop(),
+            ds,
+            lambda: ds.pop(),
+            # cmd.result holds the popped value by the time undo runs
+            undo_operation=lambda: ds.push(cmd.result),
             description="Pop"
         )
         result = self.command_history.execute(cmd)
-        self.visualizer.animate_delete(self.data_structure, result)
+        if self._should_animate():
+            self.visualizer.animate_delete(self.data_structure, result)
         self.update_status(f"Popped {result}")
 
     def execute_peek(self) -> None:
@@ -170,25 +182,35 @@ class DSTab(QWidget):
 
     def execute_reverse(self) -> None:
         """Execute reverse stack operation."""
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.reverse_recursive(),
+            ds,
+            lambda: ds.reverse_recursive(),
+            undo_operation=lambda: ds.reverse_recursive(),
             description="Reverse stack"
         )
         self.command_history.execute(cmd)
-        self.visualizer.draw(self.data_structure)
+        self._request_redraw()
         self.update_status("Stack reversed")
 
     # Queue operations
     def execute_enqueue(self, value) -> None:
         """Execute enqueue operation."""
+        ds = self.data_structure
+        # The challenge's QueueFromStacks has no inverse ops, so it falls
+        # back to its get_state/set_state snapshot
+        undo_operation = None
+        if isinstance(ds, Queue):
+            undo_operation = lambda: ds.remove_rear()
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.enqueue(value),
+            ds,
+            lambda: ds.enqueue(value),
+            undo_operation=undo_operation,
             description=f"Enqueue {value}"
         )
         self.command_history.execute(cmd)
-        self.visualizer.animate_insert(self.data_structure, value)
+        if self._should_animate():
+            self.visualizer.animate_insert(self.data_structure, value)
         self.update_status(f"Enqueued {value}")
 
     def execute_dequeue(self) -> None:
@@ -197,13 +219,20 @@ class DSTab(QWidget):
         if value is None:
             QMessageBox.information(self, "Info", "Queue is empty")
             return
+        ds = self.data_structure
+        undo_operation = None
+        if isinstance(ds, Queue):
+            # cmd.result holds the dequeued value by the time undo runs
+            undo_operation = lambda: ds.push_front(cmd.result)
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.dequeue(),
+            ds,
+            lambda: ds.dequeue(),
+            undo_operation=undo_operation,
             description="Dequeue"
         )
         result = self.command_history.execute(cmd)
-        self.visualizer.animate_delete(self.data_structure, result)
+        if self._should_animate():
+            self.visualizer.animate_delete(self.data_structure, result)
         self.update_status(f"Dequeued {result}")
 
     def execute_front(self) -> None:
@@ -217,44 +246,65 @@ class DSTab(QWidget):
     # Linked List operations
     def execute_insert_head(self, value) -> None:
         """Execute insert at head operation."""
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.insert_at_head(value),
+            ds,
+            lambda: ds.insert_at_head(value),
+            undo_operation=lambda: ds.delete_at_position(0),
             description=f"Insert {value} at head"
         )
         self.command_history.execute(cmd)
-        self.visualizer.animate_insert(self.data_structure, value, position=0)
+        if self._should_animate():
+            self.visualizer.animate_insert(self.data_structure, value, position=0)
         self.update_status(f"Inserted {value} at head")
 
     def execute_insert_tail(self, value) -> None:
         """Execute insert at tail operation."""
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.insert_at_tail(value),
+            ds,
+            lambda: ds.insert_at_tail(value),
+            undo_operation=lambda: ds.delete_at_position(ds.size() - 1),
             description=f"Insert {value} at tail"
         )
         self.command_history.execute(cmd)
-        self.visualizer.draw(self.data_structure)
+        self._request_redraw()
         self.update_status(f"Inserted {value} at tail")
 
     def execute_delete(self, value) -> None:
         """Execute delete operation."""
+        # LinkedList.search returns an index or None, BST.search a bool;
+        # a missing value records no command and leaves the scene alone
+        ds = self.data_structure
+        position = ds.search(value)
+        if position is None or position is False:
+            QMessageBox.information(self, "Info", f"Value {value} not found")
+            return
+
+        undo_operation = None
+        if self.ds_type == 'linked_list':
+            # Re-inserting at the old position undoes a list delete. The BST
+            # keeps its snapshot: re-inserting would rebalance, while
+            # set_state rebuilds the saved preorder without rotations
+            undo_operation = lambda: ds.insert_at_position(value, position)
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.delete(value),
+            ds,
+            lambda: ds.delete(value),
+            undo_operation=undo_operation,
             description=f"Delete {value}"
         )
-        result = self.command_history.execute(cmd)
-        if result:
+        self.command_history.execute(cmd)
+        if self._should_animate():
             self.visualizer.animate_delete(self.data_structure, value)
-            self.update_status(f"Deleted {value}")
-        else:
-            QMessageBox.information(self, "Info", f"Value {value} not found")
+        self.update_status(f"Deleted {value}")
 
     def execute_search(self, value) -> None:
         """Execute search operation."""
-        self.visualizer.animate_search(self.data_structure, value)
+        # Search once and hand the result over, so the visualizer does not
+        # walk the structure a second time to find the hit
         result = self.data_structure.search(value)
+        if self._should_animate():
+            self.visualizer.animate_search(self.data_structure, value, result=result)
         if result is not None:
             self.update_status(f"Found {value} at position {result}")
         else:
@@ -272,36 +322,45 @@ class DSTab(QWidget):
     # BST operations
     def execute_insert(self, value) -> None:
         """Execute BST insert operation."""
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.insert(value),
+            ds,
+            lambda: ds.insert(value),
             description=f"Insert {value}"
         )
         self.command_history.execute(cmd)
-        self.visualizer.animate_insert(self.data_structure, value)
+        if self._should_animate():
+            self.visualizer.animate_insert(self.data_structure, value)
         self.update_status(f"Inserted {value}")
 
     def execute_traversal(self, traversal_type: str) -> None:
         """Execute tree traversal."""
+        if self.data_structure.is_empty():
+            self.update_status("Tree is empty")
+            return
         self.visualizer.draw_traversal(self.data_structure, traversal_type)
         self.update_status(f"{traversal_type.capitalize()} traversal displayed")
 
     # Common operations
     def execute_clear(self) -> None:
         """Execute clear operation."""
+        if self.data_structure.is_empty():
+            self.update_status("Nothing to clear")
+            return
+        ds = self.data_structure
         cmd = DataStructureCommand(
-            self.data_structure,
-            lambda: self.data_structure.clear(),
+            ds,
+            lambda: ds.clear(),
             description="Clear all"
         )
         self.command_history.execute(cmd)
-        self.visualizer.draw(self.data_structure)
+        self._request_redraw()
         self.update_status("Cleared all elements")
 
     def undo(self) -> None:
         """Undo last operation."""
         if self.command_history.undo():
-            self.visualizer.draw(self.data_structure)
+            self._request_redraw()
             self.update_status("Undo successful")
         else:
             QMessageBox.information(self, "Info", "Nothing to undo")
@@ -309,21 +368,73 @@ class DSTab(QWidget):
     def redo(self) -> None:
         """Redo last undone operation."""
         if self.command_history.redo():
-            self.visualizer.draw(self.data_structure)
+            self._request_redraw()
             self.update_status("Redo successful")
         else:
             QMessageBox.information(self, "Info", "Nothing to redo")
 
+    def _should_animate(self) -> bool:
+        """
+        Check whether the tab is on screen and worth animating.
+
+        When it isn't, the scene is marked stale and redrawn on show.
+        """
+        if self.isVisible():
+            return True
+        self._scene_stale = True
+        return False
+
+    def showEvent(self, event) -> None:
+        """Catch the scene up on work skipped while the tab was hidden."""
+        super().showEvent(event)
+        if self._scene_stale:
+            self._scene_stale = False
+            self.visualizer.draw(self.data_structure)
+
+    def _request_redraw(self) -> None:
+        """Schedule a single scene sync for the next event-loop pass."""
+        self._redraw_generation = self.visualizer.generation
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            QTimer.singleShot(0, self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        """Run the pending scene sync, if one is still needed."""
+        if not self._redraw_pending:
+            return
+        self._redraw_pending = False
+        # An animation that redrew the scene since the request already
+        # shows the current state (and its highlight must survive)
+        if self.visualizer.generation == self._redraw_generation:
+            if self._should_animate():
+                self.visualizer.sync(self.data_structure)
+
     def update_status(self, message: str) -> None:
-        """Update status bar message."""
-        main_window = self.parent().parent()
-        if hasattr(main_window, 'statusBar'):
-            main_window.statusBar().showMessage(message, 3000)
+        """Update status bar message (bursts collapse to the latest one)."""
+        if self.main_window is None:
+            return
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            QTimer.singleShot(30, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Show the most recent pending status message."""
+        self._status_scheduled = False
+        self.main_window.statusBar().showMessage(self._pending_status, 3000)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # (ds_type, tab label) in display order
+    TABS = (
+        ('stack', "Stack"),
+        ('queue', "Queue"),
+        ('linked_list', "Linked List"),
+        ('bst', "Binary Search Tree"),
+    )
+
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -333,22 +444,52 @@ class MainWindow(QMainWindow):
         self.challenge_manager = ChallengeManager()
         self._register_challenges()
 
-        self.tabs = QTabWidget()
-        self.stack_tab = DSTab('stack', main_window=self)
-        self.queue_tab = DSTab('queue', main_window=self)
-        self.linked_list_tab = DSTab('linked_list', main_window=self)
-        self.bst_tab = DSTab('bst', main_window=self)
+        # One undo/redo history per ds_type, owned by the window
+        self.histories = {ds_type: CommandHistory() for ds_type, _ in self.TABS}
 
-        self.tabs.addTab(self.stack_tab, "Stack")
-        self.tabs.addTab(self.queue_tab, "Queue")
-        self.tabs.addTab(self.linked_list_tab, "Linked List")
-        self.tabs.addTab(self.bst_tab, "Binary Search Tree")
+        # Tabs start as empty placeholders; each DSTab (scene, canvas,
+        # visualizer, controls) is built the first time its tab is shown
+        self.tabs = QTabWidget()
+        self.stack_tab = None
+        self.queue_tab = None
+        self.linked_list_tab = None
+        self.bst_tab = None
+        self._pending_tabs = {}
+        for ds_type, label in self.TABS:
+            index = self.tabs.addTab(QWidget(), label)
+            self._pending_tabs[index] = ds_type
+        self.tabs.currentChanged.connect(self._materialize_tab)
+        self._materialize_tab(self.tabs.currentIndex())
 
         self.setCentralWidget(self.tabs)
 
         self._create_menu_bar()
         self.statusBar().showMessage("Ready")
 
+    def _materialize_tab(self, index: int) -> None:
+        """
+        Replace a placeholder tab with its real DSTab on first activation.
+
+        Args:
+            index: Index of the tab being shown
+        """
+        ds_type = self._pending_tabs.pop(index, None)
+        if ds_type is None:
+            return
+
+        tab = DSTab(ds_type, main_window=self)
+        setattr(self, f"{ds_type}_tab", tab)
+
+        placeholder = self.tabs.widget(index)
+        label = self.tabs.tabText(index)
+        # Removing the current tab would switch tabs and build a neighbour
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
     def _register_challenges(self) -> None:
         """Register all challenges."""
         self.challenge_manager.register_challenge('stack', ReverseStackChallenge())
@@ -414,6 +555,8 @@ class MainWindow(QMainWindow):
         current_tab = self.tabs.currentWidget()
         if isinstance(current_tab, DSTab):
             current_tab.data_structure = ds
+            # Earlier commands belong to the replaced structure
+            current_tab.command_history.clear()
             current_tab.visualizer.draw(ds)
             current_tab.control_panel.enable_challenge_mode(True)
 
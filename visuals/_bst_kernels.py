@@ -0,0 +1,84 @@
+"""Numba-compiled layout kernel for BSTVisualizer.
+
+Optional: requires numba and numpy (pip install numba). BSTVisualizer uses
+it for large trees when it imports cleanly and keeps its pure-Python
+layout otherwise.
+"""
+import numpy as np
+from numba import njit
+
+
+def tree_to_arrays(root):
+    """
+    Flatten a tree into parallel child-index arrays.
+
+    Args:
+        root: Root TreeNode (not None)
+
+    Returns:
+        (nodes, left, right): nodes in preorder with the root at index 0,
+        and int32 arrays holding each node's child indices (-1 for none)
+    """
+    nodes = [root]
+    left = [-1]
+    right = [-1]
+    pending = [0]
+    while pending:
+        i = pending.pop()
+        node = nodes[i]
+        if node.left is not None:
+            left[i] = len(nodes)
+            pending.append(len(nodes))
+            nodes.append(node.left)
+            left.append(-1)
+            right.append(-1)
+        if node.right is not None:
+            right[i] = len(nodes)
+            pending.append(len(nodes))
+            nodes.append(node.right)
+            left.append(-1)
+            right.append(-1)
+    return nodes, np.array(left, dtype=np.int32), np.array(right, dtype=np.int32)
+
+
+@njit(cache=True)
+def layout_bst(left, right, root, start_x, start_y, spacing, level_height):
+    """
+    Lay out a tree given as child-index arrays, in in-order x order.
+
+    Matches BSTVisualizer._calculate_positions: the i-th node in in-order
+    sits i * spacing right of a left edge that centers the tree on start_x.
+
+    Returns:
+        (xs, ys, depths) arrays indexed like left/right
+    """
+    n = left.shape[0]
+    xs = np.empty(n, dtype=np.float64)
+    ys = np.empty(n, dtype=np.float64)
+    depths = np.empty(n, dtype=np.int32)
+    # A path never holds more than n nodes, so the stacks never grow
+    stack = np.empty(n, dtype=np.int32)
+    depth_stack = np.empty(n, dtype=np.int32)
+    left_edge = start_x - n * spacing / 2
+
+    top = 0
+    node = root
+    depth = 0
+    index = 0
+    while top > 0 or node >= 0:
+        while node >= 0:
+            stack[top] = node
+            depth_stack[top] = depth
+            top += 1
+            node = left[node]
+            depth += 1
+        top -= 1
+        node = stack[top]
+        depth = depth_stack[top]
+        xs[node] = left_edge + index * spacing
+        ys[node] = start_y + depth * level_height
+        depths[node] = depth
+        index += 1
+        node = right[node]
+        depth += 1
+    return xs, ys, depths
@@ -0,0 +1,26 @@
+"""Shared QFont instances for the visualizers."""
+from PyQt5.QtGui import QFont
+
+_FONTS = {}
+
+
+def font(family: str, size: int, bold: bool = False) -> QFont:
+    """
+    Return the shared font for (family, size, bold), creating it on first use.
+
+    Fonts are built lazily so nothing is created before the QApplication.
+
+    Args:
+        family: Font family name
+        size: Point size
+        bold: Whether the font is bold
+
+    Returns:
+        QFont shared by every caller asking for the same font
+    """
+    key = (family, size, bold)
+    cached = _FONTS.get(key)
+    if cached is None:
+        cached = QFont(family, size, QFont.Bold if bold else QFont.Normal)
+        _FONTS[key] = cached
+    return cached
@@ -1,9 +1,12 @@
 """Base visualizer class for all data structure visualizations."""
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import partial
 from typing import Any, Optional
 from PyQt5.QtWidgets import QGraphicsScene, QGraphicsItem
-from PyQt5.QtCore import QPropertyAnimation, QEasingCurve, QObject, pyqtProperty, QPointF
-from PyQt5.QtGui import QColor, QPen, QBrush
+from PyQt5.QtCore import QVariantAnimation, QEasingCurve, QPointF
+from PyQt5.QtGui import QColor, QPen, QBrush, QFontMetricsF
+from ._fonts import font
 
 
 # Color scheme: Academic blue/white/black
@@ -17,32 +20,20 @@ COLORS = {
     "border": QColor(44, 62, 80)          # Dark gray
 }
 
-
-class AnimatedItem(QObject):
-    """
-    Wrapper for QGraphicsItem to enable property animations.
-
-    Attributes:
-        item: The QGraphicsItem being animated
-        _pos: Current position of the item
-    """
-
-    def __init__(self, item: QGraphicsItem):
-        """Initialize animated item wrapper."""
-        super().__init__()
-        self.item = item
-        self._pos = item.pos()
-
-    def get_pos(self) -> QPointF:
-        """Get current position."""
-        return self._pos
-
-    def set_pos(self, pos: QPointF) -> None:
-        """Set position and update item."""
-        self._pos = pos
-        self.item.setPos(pos)
-
-    pos = pyqtProperty(QPointF, get_pos, set_pos)
+# Pens and brushes are value types and never modified after creation, so
+# every node shares these instead of allocating new ones per draw
+_NODE_PENS = {
+    False: QPen(COLORS["border"], 2),
+    True: QPen(COLORS["highlight"], 2),
+}
+_NODE_BRUSHES = {
+    (False, False): QBrush(COLORS["primary"]),
+    (True, False): QBrush(COLORS["secondary"]),
+    (False, True): QBrush(COLORS["success"]),
+    (True, True): QBrush(COLORS["success"]),
+}
+_ARROW_PEN = QPen(COLORS["border"], 2)
+_TEXT_BRUSH = QBrush(COLORS["background"])
 
 
 class BaseVisualizer(ABC):
@@ -52,6 +43,11 @@ class BaseVisualizer(ABC):
     Provides common animation infrastructure and rendering utilities.
     """
 
+    # Most animations kept alive at once; the oldest is stopped beyond this
+    MAX_ANIMATIONS = 128
+    # Idle animations kept for reuse by create_animation
+    ANIMATION_POOL_SIZE = 8
+
     def __init__(self, scene: QGraphicsScene):
         """
         Initialize the base visualizer.
@@ -61,8 +57,18 @@ class BaseVisualizer(ABC):
         """
         self.scene = scene
         self.animations = []
+        self._animation_pool = []
         self.node_size = 50
         self.spacing = 80
+        # Fonts are shared by every node and label instead of rebuilt per item
+        self._node_font = font("Arial", 12, bold=True)
+        self._label_font = font("Arial", 10, bold=True)
+        self._node_metrics = QFontMetricsF(self._node_font)
+        # Labels and overlays that sync() or the next search removes
+        self._decor = []
+        # Bumped on every clear_scene so callers can tell a full redraw happened
+        self.generation = 0
+        self._bulk_depth = 0
 
     @abstractmethod
     def draw(self, data_structure: Any) -> None:
@@ -110,13 +116,76 @@ class BaseVisualizer(ABC):
         """
         pass
 
+    @contextmanager
+    def bulk_update(self):
+        """
+        Batch scene changes into one repaint.
+
+        View updates and scene signals are suspended inside the block and
+        a single viewport update is issued on exit. Nested blocks are fine.
+        """
+        self._bulk_depth += 1
+        if self._bulk_depth > 1:
+            try:
+                yield
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        views = self.scene.views()
+        for view in views:
+            view.setUpdatesEnabled(False)
+        prev_blocked = self.scene.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.scene.blockSignals(prev_blocked)
+            for view in views:
+                view.setUpdatesEnabled(True)
+                view.viewport().update()
+            self._bulk_depth -= 1
+
     def clear_scene(self) -> None:
         """Clear all items from the scene."""
+        # Stop running animations first; scene.clear() deletes their items
+        for animation, _ in list(self.animations):
+            animation.stop()
+            self._retire(animation)
         self.scene.clear()
-        self.animations.clear()
+        self.generation += 1
+        self._decor = []
+
+    def sync(self, data_structure: Any) -> None:
+        """
+        Update the scene to match the data structure, e.g. after undo/redo.
+
+        Redraws everything; TrackedVisualizer patches its nodes instead.
+
+        Args:
+            data_structure: The data structure to visualize
+        """
+        self.draw(data_structure)
+
+    def _add_decor(self, item: QGraphicsItem) -> None:
+        """Add an item that sync() removes and redraws, such as a label."""
+        self.scene.addItem(item)
+        self._decor.append(item)
+
+    def _text_size(self, label: str):
+        """
+        Return the (width, height) of a node text item showing label.
+
+        Measured with font metrics rather than a boundingRect() call per
+        node.
+
+        Args:
+            label: Text drawn in the node font
+        """
+        metrics = self._node_metrics
+        return metrics.horizontalAdvance(label), metrics.height()
 
     def create_animation(self, item: QGraphicsItem, start_pos: QPointF,
-                        end_pos: QPointF, duration: int = 500) -> QPropertyAnimation:
+                        end_pos: QPointF, duration: int = 500) -> QVariantAnimation:
         """
         Create a position animation for a graphics item.
 
@@ -127,18 +196,62 @@ class BaseVisualizer(ABC):
             duration: Animation duration in milliseconds
 
         Returns:
-            Configured QPropertyAnimation
+            Configured QVariantAnimation (call start() to run it)
         """
-        animated_item = AnimatedItem(item)
-        animation = QPropertyAnimation(animated_item, b"pos")
+        # Reuse an idle animation; its value drives item.setPos directly,
+        # so no QObject wrapper is needed per animated item
+        if self._animation_pool:
+            animation = self._animation_pool.pop()
+        else:
+            animation = QVariantAnimation(self.scene)
+            animation.setEasingCurve(QEasingCurve.InOutQuad)
+            animation.finished.connect(partial(self._retire, animation))
         animation.setDuration(duration)
         animation.setStartValue(start_pos)
         animation.setEndValue(end_pos)
-        animation.setEasingCurve(QEasingCurve.InOutQuad)
+        animation.valueChanged.connect(item.setPos)
 
-        self.animations.append((animation, animated_item))
+        self.animations.append((animation, item))
+        if len(self.animations) > self.MAX_ANIMATIONS:
+            oldest = self.animations[0][0]
+            oldest.stop()
+            self._retire(oldest)
         return animation
 
+    def _retire(self, animation: QVariantAnimation) -> None:
+        """
+        Detach a finished or stopped animation and return it to the pool.
+
+        Args:
+            animation: The animation to retire
+        """
+        for i, (entry, _) in enumerate(self.animations):
+            if entry is animation:
+                del self.animations[i]
+                break
+        else:
+            return
+
+        animation.valueChanged.disconnect()
+        if len(self._animation_pool) < self.ANIMATION_POOL_SIZE:
+            self._animation_pool.append(animation)
+        else:
+            animation.deleteLater()
+
+    @staticmethod
+    def _cache_node(*items: QGraphicsItem) -> None:
+        """
+        Render node items once into device-space pixmaps.
+
+        Panning, animating and repainting around a node then blit the
+        cached pixmap instead of re-rasterizing the fill and glyphs.
+
+        Args:
+            *items: The node's shape and text items
+        """
+        for item in items:
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
     def get_node_pen(self, highlighted: bool = False) -> QPen:
         """
         Get pen for drawing node borders.
@@ -149,9 +262,7 @@ class BaseVisualizer(ABC):
         Returns:
             QPen object with appropriate color
         """
-        color = COLORS["highlight"] if highlighted else COLORS["border"]
-        pen = QPen(color, 2)
-        return pen
+        return _NODE_PENS[bool(highlighted)]
 
     def get_node_brush(self, highlighted: bool = False, success: bool = False) -> QBrush:
         """
@@ -164,18 +275,156 @@ class BaseVisualizer(ABC):
         Returns:
             QBrush object with appropriate color
         """
-        if success:
-            color = COLORS["success"]
-        elif highlighted:
-            color = COLORS["secondary"]
-        else:
-            color = COLORS["primary"]
-        return QBrush(color)
+        return _NODE_BRUSHES[bool(highlighted), bool(success)]
 
     def get_text_color(self) -> QColor:
         """Get color for text."""
         return COLORS["background"]  # White text on colored nodes
 
+    def get_text_brush(self) -> QBrush:
+        """Get brush for node text (simple text items are filled, not colored)."""
+        return _TEXT_BRUSH
+
     def get_arrow_pen(self) -> QPen:
         """Get pen for drawing arrows/connections."""
-        return QPen(COLORS["border"], 2)
+        return _ARROW_PEN
+
+
+class TrackedVisualizer(BaseVisualizer):
+    """
+    Base for visualizers that lay nodes out by index (stack, queue, list).
+
+    draw() records its node items with _track_node, so sync() can patch
+    them in place instead of rebuilding the scene.
+    """
+
+    # Detached node items kept for reuse by the next draw()/sync()
+    NODE_POOL_SIZE = 256
+
+    def __init__(self, scene: QGraphicsScene):
+        """
+        Initialize the tracked visualizer.
+
+        Args:
+            scene: QGraphicsScene for rendering
+        """
+        super().__init__(scene)
+        self._node_pool = []
+        # Node items from the last plain draw(), so sync() can patch them
+        # in place; None when the scene holds no tracked nodes
+        self._nodes = None
+        self._shown = []
+
+    def clear_scene(self) -> None:
+        """Clear all items from the scene, keeping tracked nodes for reuse."""
+        # Detach tracked nodes into the pool instead of letting clear()
+        # destroy them; the next draw() reuses them
+        if self._nodes:
+            self._pool_nodes(self._nodes)
+        super().clear_scene()
+        self._nodes = None
+        self._shown = []
+
+    def sync(self, data_structure: Any) -> None:
+        """
+        Update the scene to match the data structure, e.g. after undo/redo.
+
+        Relabels, adds and removes only the nodes that changed since the
+        last draw(); falls back to draw() when no nodes are tracked.
+
+        Args:
+            data_structure: The data structure to visualize
+        """
+        items = data_structure.to_list() if self._nodes is not None else None
+        if not items:
+            self.draw(data_structure)
+            return
+
+        with self.bulk_update():
+            nodes, shown = self._nodes, self._shown
+            count = len(items)
+            for i in range(min(len(nodes), count)):
+                label = str(items[i])
+                if shown[i] != label:
+                    self._set_node_text(nodes[i], label)
+                    shown[i] = label
+
+            self._pool_nodes(nodes[count:])
+            del nodes[count:]
+            del shown[count:]
+            for i in range(len(nodes), count):
+                self._track_node(items[i], i)
+
+            for item in self._decor:
+                self.scene.removeItem(item)
+            self._decor = []
+            self._draw_labels(count)
+
+    def _track_node(self, value: Any, index: int) -> QGraphicsItem:
+        """
+        Draw the node at index and remember it for sync().
+
+        Args:
+            value: Value to display
+            index: Position of the value in the structure
+
+        Returns:
+            The node's shape item (its text is the first child)
+        """
+        x, y = self._node_pos(index)
+        if self._node_pool:
+            # Move a pooled node (children and all) onto the new spot
+            node = self._node_pool.pop()
+            rect = node.rect()
+            node.setPos(x - rect.x(), y - rect.y())
+            self._set_node_text(node, str(value))
+            self.scene.addItem(node)
+        else:
+            node = self._draw_node(value, x, y)
+        self._nodes.append(node)
+        self._shown.append(str(value))
+        return node
+
+    def _pool_nodes(self, nodes) -> None:
+        """
+        Take tracked nodes off the scene and keep them for reuse.
+
+        Args:
+            nodes: Tracked node items to detach
+        """
+        pool = self._node_pool
+        for node in nodes:
+            self.scene.removeItem(node)
+            if len(pool) < self.NODE_POOL_SIZE:
+                pool.append(node)
+
+    @abstractmethod
+    def _node_pos(self, index: int):
+        """Return the (x, y) of the node at index."""
+        pass
+
+    @abstractmethod
+    def _draw_labels(self, count: int) -> None:
+        """Draw the labels for a structure of count items (via _add_decor)."""
+        pass
+
+    @abstractmethod
+    def _draw_node(self, value: Any, x: float, y: float,
+                   highlighted: bool = False, success: bool = False) -> QGraphicsItem:
+        """Draw a node whose first child is its text, and return its shape item."""
+        pass
+
+    def _set_node_text(self, node: QGraphicsItem, label: str) -> None:
+        """
+        Replace the text of a tracked node and re-center it.
+
+        Args:
+            node: Shape item whose first child is its text
+            label: New text
+        """
+        text = node.childItems()[0]
+        text.setText(label)
+        rect = node.rect()
+        text_w, text_h = self._text_size(label)
+        text.setPos(rect.x() + (rect.width() - text_w) / 2,
+                    rect.y() + (rect.height() - text_h) / 2)
@@ -1,9 +1,28 @@
 """BST visualizer - displays tree structure with proper layout."""
 from typing import Any, Optional, Dict
-from PyQt5.QtWidgets import QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsLineItem
-from PyQt5.QtCore import Qt, QLineF
-from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (QGraphicsScene, QGraphicsEllipseItem, QGraphicsSimpleTextItem,
+                             QGraphicsPathItem)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QPainterPath
 from .base_visualizer import BaseVisualizer
+from ._fonts import font
+
+# The Numba kernels module once imported, False if unavailable, None if
+# not tried yet; importing numba is slow, so only large trees pay for it
+_kernels = None
+
+
+def _load_kernels():
+    """Import the optional layout kernels on first use (None if unavailable)."""
+    global _kernels
+    if _kernels is None:
+        try:
+            from . import _bst_kernels
+        except ImportError:  # numba/numpy are optional
+            _kernels = False
+        else:
+            _kernels = _bst_kernels
+    return _kernels or None
 
 
 class BSTVisualizer(BaseVisualizer):
@@ -12,6 +31,12 @@ class BSTVisualizer(BaseVisualizer):
     Displays tree with proper hierarchical layout.
     """
 
+    # Traversal captions kept for recent (tree version, order) pairs
+    TRAVERSAL_CACHE_SIZE = 8
+    # Trees at least this big are laid out by the compiled kernel, if present;
+    # below it the first-call JIT cost outweighs the saving
+    JIT_LAYOUT_MIN_NODES = 2000
+
     def __init__(self, scene: QGraphicsScene):
         """Initialize BST visualizer."""
         super().__init__(scene)
@@ -19,6 +44,14 @@ class BSTVisualizer(BaseVisualizer):
         self.start_y = 50
         self.level_height = 80
         self.horizontal_spacing = 60
+        self._traversal_cache = {}
+        self._edges_item = None
+        # Layout of the tree at _positions_version, reused until it mutates
+        self._positions_cache = None
+        self._positions_version = None
+        # (tree version, scene generation) of the last plain draw(), so a
+        # search on the same tree can reuse the nodes already on screen
+        self._drawn_at = None
 
     def draw(self, bst: Any) -> None:
         """
@@ -31,21 +64,34 @@ class BSTVisualizer(BaseVisualizer):
 
         if bst.is_empty():
             # Display "Empty Tree" message
-            text = QGraphicsTextItem("Binary Search Tree is Empty")
-            text.setDefaultTextColor(self.get_text_color())
-            text.setFont(QFont("Arial", 14))
+            text = QGraphicsSimpleTextItem("Binary Search Tree is Empty")
+            text.setBrush(self.get_text_brush())
+            text.setFont(font("Arial", 14))
             text.setPos(self.start_x - 100, self.start_y + 200)
             self.scene.addItem(text)
             return
 
         # Calculate positions for all nodes
-        positions = self._calculate_positions(bst.root)
+        positions = self._get_positions(bst)
 
-        # Draw edges first (so they appear behind nodes)
-        self._draw_edges(bst.root, positions)
+        with self.bulk_update():
+            self._draw_tree(bst.root, positions)
+        self._drawn_at = (bst.version, self.generation)
 
-        # Draw nodes
-        self._draw_nodes(bst.root, positions)
+    def _get_positions(self, bst: Any) -> Dict:
+        """
+        Return node positions for bst, reusing the last layout if unchanged.
+
+        Args:
+            bst: BinarySearchTree instance
+
+        Returns:
+            Dictionary mapping node id to (x, y, depth)
+        """
+        if self._positions_cache is None or self._positions_version != bst.version:
+            self._positions_cache = self._calculate_positions(bst.root)
+            self._positions_version = bst.version
+        return self._positions_cache
 
     def _calculate_positions(self, root: Optional[Any]) -> Dict:
         """
@@ -60,24 +106,55 @@ class BSTVisualizer(BaseVisualizer):
         # TODO: improve layout algorithm for large trees
         # gets cramped after 20+ nodes, maybe look into Reingold-Tilford algorithm
         positions = {}
-        self._inorder_position = 0
-
-        def calculate_inorder_index(node: Optional[Any], depth: int = 0) -> None:
-            if node is None:
-                return
-
-            calculate_inorder_index(node.left, depth + 1)
+        if root is None:
+            return positions
+
+        count = self._count_nodes(root)
+        if count >= self.JIT_LAYOUT_MIN_NODES:
+            kernels = _load_kernels()
+            if kernels is not None:
+                return self._calculate_positions_jit(root, kernels)
+
+        # The tree size was recounted for every node; it only shifts x once
+        spacing = self.horizontal_spacing
+        left = self.start_x - count * spacing / 2
+        start_y, level_height = self.start_y, self.level_height
+
+        # Iterative in-order walk: no recursion limit on deep trees
+        stack = []
+        push, pop = stack.append, stack.pop
+        node, depth, index = root, 0, 0
+        while stack or node is not None:
+            while node is not None:
+                push((node, depth))
+                node = node.left
+                depth += 1
+            node, depth = pop()
+            positions[id(node)] = (left + index * spacing,
+                                   start_y + depth * level_height, depth)
+            index += 1
+            node = node.right
+            depth += 1
+        return positions
 
-            x = self.start_x + (self._inorder_position * self.horizontal_spacing) - \
-                (self._count_nodes(root) * self.horizontal_spacing / 2)
-            y = self.start_y + (depth * self.level_height)
-            positions[id(node)] = (x, y, depth)
-            self._inorder_position += 1
+    def _calculate_positions_jit(self, root: Any, kernels: Any) -> Dict:
+        """
+        Same layout as _calculate_positions, computed by the Numba kernel.
 
-            calculate_inorder_index(node.right, depth + 1)
+        Args:
+            root: Root TreeNode (not None)
+            kernels: The loaded visuals._bst_kernels module
 
-        calculate_inorder_index(root)
-        return positions
+        Returns:
+            Dictionary mapping node id to (x, y, depth)
+        """
+        nodes, left, right = kernels.tree_to_arrays(root)
+        xs, ys, depths = kernels.layout_bst(left, right, 0, float(self.start_x),
+                                            float(self.start_y),
+                                            float(self.horizontal_spacing),
+                                            float(self.level_height))
+        return {id(node): position for node, position in
+                zip(nodes, zip(xs.tolist(), ys.tolist(), depths.tolist()))}
 
     def _count_nodes(self, node: Optional[Any]) -> int:
         """
@@ -89,97 +166,111 @@ class BSTVisualizer(BaseVisualizer):
         Returns:
             Number of nodes
         """
-        if node is None:
-            return 0
-        return 1 + self._count_nodes(node.left) + self._count_nodes(node.right)
-
-    def _draw_edges(self, node: Optional[Any], positions: Dict) -> None:
-        """
-        Recursively draw edges between nodes.
-
-        Args:
-            node: Current TreeNode
-            positions: Position dictionary
-        """
-        if node is None:
-            return
-
-        node_id = id(node)
-        if node_id not in positions:
-            return
-
-        x, y, depth = positions[node_id]
-        center_x = x + self.node_size / 2
-        center_y = y + self.node_size / 2
-
-        # Draw edge to left child
-        if node.left is not None:
-            left_id = id(node.left)
-            if left_id in positions:
-                left_x, left_y, _ = positions[left_id]
-                left_center_x = left_x + self.node_size / 2
-                left_center_y = left_y + self.node_size / 2
-                line = QGraphicsLineItem(QLineF(center_x, center_y, left_center_x, left_center_y))
-                line.setPen(self.get_arrow_pen())
-                self.scene.addItem(line)
-                self._draw_edges(node.left, positions)
-
-        # Draw edge to right child
-        if node.right is not None:
-            right_id = id(node.right)
-            if right_id in positions:
-                right_x, right_y, _ = positions[right_id]
-                right_center_x = right_x + self.node_size / 2
-                right_center_y = right_y + self.node_size / 2
-                line = QGraphicsLineItem(QLineF(center_x, center_y, right_center_x, right_center_y))
-                line.setPen(self.get_arrow_pen())
-                self.scene.addItem(line)
-                self._draw_edges(node.right, positions)
-
-    def _draw_nodes(self, node: Optional[Any], positions: Dict,
+        count = 0
+        pending = [node] if node is not None else []
+        push, pop = pending.append, pending.pop
+        while pending:
+            current = pop()
+            count += 1
+            if current.left is not None:
+                push(current.left)
+            if current.right is not None:
+                push(current.right)
+        return count
+
+    def _draw_tree(self, root: Optional[Any], positions: Dict,
                    highlight_value: Any = None, success_value: Any = None) -> None:
         """
-        Recursively draw all nodes.
+        Draw every edge and node in a single walk of the tree.
 
         Args:
-            node: Current TreeNode
+            root: Root TreeNode
             positions: Position dictionary
             highlight_value: Value to highlight
             success_value: Value to show as success
         """
-        if node is None:
-            return
-
-        node_id = id(node)
-        if node_id not in positions:
-            return
+        # The edge item is added first so edges stay behind the nodes; its
+        # path is filled in during the same walk that draws the nodes
+        path = QPainterPath()
+        self._edges_item = QGraphicsPathItem()
+        self._edges_item.setPen(self.get_arrow_pen())
+        self.scene.addItem(self._edges_item)
+
+        half = self.node_size / 2
+        draw_node = self._draw_node
+        # A plain draw highlights nothing, so skip the per-node comparisons
+        check_highlight = highlight_value is not None
+        check_success = success_value is not None
+
+        # Each pending entry carries its node's position, so every node is
+        # looked up once (as a child) instead of once per pass over it
+        root_pos = positions.get(id(root)) if root is not None else None
+        pending = [(root, root_pos[0], root_pos[1])] if root_pos else []
+        get_pos = positions.get
+        push, pop = pending.append, pending.pop
+        while pending:
+            node, x, y = pop()
+            data = node.data
+
+            # Right pushed first so the left subtree is drawn first (preorder)
+            for child in (node.right, node.left):
+                if child is not None:
+                    child_pos = get_pos(id(child))
+                    if child_pos is None:
+                        continue
+                    child_x, child_y = child_pos[0], child_pos[1]
+                    path.moveTo(x + half, y + half)
+                    path.lineTo(child_x + half, child_y + half)
+                    push((child, child_x, child_y))
+
+            draw_node(data, x, y,
+                      check_highlight and data == highlight_value,
+                      check_success and data == success_value)
+
+        self._edges_item.setPath(path)
+
+    def _draw_node(self, value: Any, x: float, y: float,
+                   highlighted: bool = False, success: bool = False) -> QGraphicsEllipseItem:
+        """
+        Draw a single tree node.
 
-        x, y, depth = positions[node_id]
+        Args:
+            value: Value to display
+            x: X coordinate
+            y: Y coordinate
+            highlighted: Whether to highlight the node
+            success: Whether to show success state
 
-        highlighted = (node.data == highlight_value)
-        success = (node.data == success_value)
+        Returns:
+            The created ellipse item
+        """
+        size = self.node_size
 
         # Draw circle
-        circle = QGraphicsEllipseItem(x, y, self.node_size, self.node_size)
+        circle = QGraphicsEllipseItem(x, y, size, size)
         circle.setPen(self.get_node_pen(highlighted))
         circle.setBrush(self.get_node_brush(highlighted, success))
         self.scene.addItem(circle)
 
-        # Draw text
-        text = QGraphicsTextItem(str(node.data))
-        text.setDefaultTextColor(self.get_text_color())
-        text.setFont(QFont("Arial", 12, QFont.Bold))
+        # Draw text (a child, so it is removed with the circle)
+        label = str(value)
+        text = QGraphicsSimpleTextItem(label, circle)
+        text.setBrush(self.get_text_brush())
+        text.setFont(self._node_font)
 
         # Center text in circle
-        text_rect = text.boundingRect()
-        text_x = x + (self.node_size - text_rect.width()) / 2
-        text_y = y + (self.node_size - text_rect.height()) / 2
-        text.setPos(text_x, text_y)
-        self.scene.addItem(text)
+        text_w, text_h = self._text_size(label)
+        text.setPos(x + (size - text_w) / 2, y + (size - text_h) / 2)
+        self._cache_node(circle, text)
 
-        # Recursively draw children
-        self._draw_nodes(node.left, positions, highlight_value, success_value)
-        self._draw_nodes(node.right, positions, highlight_value, success_value)
+        return circle
+
+    def _find_node(self, root: Optional[Any], value: Any) -> Optional[Any]:
+        """Return the node holding value, or None if it is not in the tree."""
+        node = root
+        while node is not None and node.data != value:
+            node = node.right if value > node.data else node.left
+        return node
 
     def animate_insert(self, bst: Any, value: Any, **kwargs) -> None:
         """
@@ -196,13 +287,10 @@ class BSTVisualizer(BaseVisualizer):
             return
 
         # Calculate positions
-        positions = self._calculate_positions(bst.root)
-
-        # Draw edges
-        self._draw_edges(bst.root, positions)
+        positions = self._get_positions(bst)
 
-        # Draw nodes with highlighting
-        self._draw_nodes(bst.root, positions, highlight_value=value)
+        # Draw edges and nodes with highlighting
+        self._draw_tree(bst.root, positions, highlight_value=value)
 
     def animate_delete(self, bst: Any, value: Any, **kwargs) -> None:
         """
@@ -221,35 +309,37 @@ class BSTVisualizer(BaseVisualizer):
         Args:
             bst: BinarySearchTree instance
             value: Value being searched for
+            result: Result already returned by bst.search (optional)
         """
-        self.clear_scene()
-
         if bst.is_empty():
             self.draw(bst)
             return
 
-        # Calculate positions
-        positions = self._calculate_positions(bst.root)
-
-        # Draw edges
-        self._draw_edges(bst.root, positions)
+        if self._drawn_at == (bst.version, self.generation):
+            # Same tree still on screen: only the overlay and message change
+            for item in self._decor:
+                self.scene.removeItem(item)
+            self._decor = []
+        else:
+            self.draw(bst)
 
-        # Check if value exists
-        found = bst.search(value)
+        # Check if value exists (unless the caller already searched)
+        found = kwargs['result'] if 'result' in kwargs else bst.search(value)
 
-        # Draw nodes with highlighting
-        if found:
-            self._draw_nodes(bst.root, positions, success_value=value)
-            msg = QGraphicsTextItem(f"Value {value} found in tree")
-            msg.setDefaultTextColor(Qt.darkGreen)
+        # Draw the hit on top of its node
+        node = self._find_node(bst.root, value) if found else None
+        if node is not None:
+            x, y, _ = self._get_positions(bst)[id(node)]
+            self._decor.append(self._draw_node(value, x, y, success=True))
+            msg = QGraphicsSimpleTextItem(f"Value {value} found in tree")
+            msg.setBrush(QBrush(Qt.darkGreen))
         else:
-            self._draw_nodes(bst.root, positions)
-            msg = QGraphicsTextItem(f"Value {value} not found")
-            msg.setDefaultTextColor(Qt.darkRed)
+            msg = QGraphicsSimpleTextItem(f"Value {value} not found")
+            msg.setBrush(QBrush(Qt.darkRed))
 
-        msg.setFont(QFont("Arial", 12, QFont.Bold))
+        msg.setFont(self._node_font)
         msg.setPos(self.start_x - 100, self.start_y + 400)
-        self.scene.addItem(msg)
+        self._add_decor(msg)
 
     def draw_traversal(self, bst: Any, traversal_type: str) -> None:
         """
@@ -264,20 +354,29 @@ class BSTVisualizer(BaseVisualizer):
         if bst.is_empty():
             return
 
-        # Get traversal result
-        if traversal_type == 'inorder':
-            result = bst.inorder_traversal()
-        elif traversal_type == 'preorder':
-            result = bst.preorder_traversal()
-        elif traversal_type == 'postorder':
-            result = bst.postorder_traversal()
-        else:
-            return
+        # bst.version changes on every mutation, so a hit is always current
+        key = (bst.version, traversal_type)
+        result_text = self._traversal_cache.get(key)
+        if result_text is None:
+            # Get traversal result
+            if traversal_type == 'inorder':
+                result = bst.inorder_traversal()
+            elif traversal_type == 'preorder':
+                result = bst.preorder_traversal()
+            elif traversal_type == 'postorder':
+                result = bst.postorder_traversal()
+            else:
+                return
+
+            result_text = f"{traversal_type.capitalize()}: {' → '.join(map(str, result))}"
+            self._traversal_cache[key] = result_text
+            if len(self._traversal_cache) > self.TRAVERSAL_CACHE_SIZE:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del self._traversal_cache[next(iter(self._traversal_cache))]
 
         # Display traversal result
-        result_text = f"{traversal_type.capitalize()}: {' → '.join(str(x) for x in result)}"
-        msg = QGraphicsTextItem(result_text)
-        msg.setDefaultTextColor(Qt.black)
-        msg.setFont(QFont("Arial", 11, QFont.Bold))
+        msg = QGraphicsSimpleTextItem(result_text)
+        msg.setBrush(QBrush(Qt.black))
+        msg.setFont(font("Arial", 11, bold=True))
         msg.setPos(50, self.start_y + 400)
-        self.scene.addItem(msg)
+        self._add_decor(msg)
@@ -1,12 +1,14 @@
 """Linked List visualizer - displays nodes horizontally with arrows."""
-from typing import Any
-from PyQt5.QtWidgets import QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsLineItem
-from PyQt5.QtCore import Qt, QLineF
-from PyQt5.QtGui import QFont, QPen
-from .base_visualizer import BaseVisualizer
+from typing import Any, Optional
+from PyQt5.QtWidgets import (QGraphicsScene, QGraphicsEllipseItem, QGraphicsSimpleTextItem,
+                             QGraphicsPathItem, QGraphicsItem)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QPainterPath
+from .base_visualizer import TrackedVisualizer
+from ._fonts import font
 
 
-class LinkedListVisualizer(BaseVisualizer):
+class LinkedListVisualizer(TrackedVisualizer):
     """
     Visualizer for Singly Linked List data structure.
     Displays nodes horizontally with arrows showing connections.
@@ -30,39 +32,52 @@ class LinkedListVisualizer(BaseVisualizer):
 
         if linked_list.is_empty():
             # Display "Empty List" message
-            text = QGraphicsTextItem("Linked List is Empty")
-            text.setDefaultTextColor(self.get_text_color())
-            text.setFont(QFont("Arial", 14))
+            text = QGraphicsSimpleTextItem("Linked List is Empty")
+            text.setBrush(self.get_text_brush())
+            text.setFont(font("Arial", 14))
             text.setPos(self.start_x + 200, self.start_y)
             self.scene.addItem(text)
             return
 
-        items = linked_list.to_list()
-        for i, value in enumerate(items):
-            x_pos = self.start_x + (i * self.spacing)
-            self._draw_node(value, x_pos, self.start_y)
-
-            # Draw arrow to next node (except for last node)
-            if i < len(items) - 1:
-                self._draw_arrow(x_pos + self.node_size, self.start_y + self.node_size / 2,
-                               x_pos + self.spacing, self.start_y + self.node_size / 2)
-
-        # Draw "HEAD" label
-        if items:
-            head_label = QGraphicsTextItem("HEAD")
-            head_label.setDefaultTextColor(Qt.black)
-            head_label.setFont(QFont("Arial", 10, QFont.Bold))
-            head_label.setPos(self.start_x, self.start_y - 40)
-            self.scene.addItem(head_label)
-
-        # Draw "NULL" at the end
-        if items:
-            null_label = QGraphicsTextItem("NULL")
-            null_label.setDefaultTextColor(Qt.darkRed)
-            null_label.setFont(QFont("Arial", 10, QFont.Bold))
-            null_x = self.start_x + (len(items) * self.spacing)
-            null_label.setPos(null_x, self.start_y + 10)
-            self.scene.addItem(null_label)
+        with self.bulk_update():
+            self._nodes = []
+            track = self._track_node
+            for i, value in enumerate(linked_list):
+                track(value, i)
+            self._draw_labels(linked_list.size())
+
+    def _node_pos(self, index: int):
+        """Return the (x, y) of the node at index (0 is the head)."""
+        return self.start_x + (index * self.spacing), self.start_y
+
+    def _track_node(self, value: Any, index: int) -> QGraphicsEllipseItem:
+        """Draw a tracked node together with its arrow to the next node."""
+        node = super()._track_node(value, index)
+        # Pooled nodes come back with their arrow already attached
+        if len(node.childItems()) < 2:
+            rect = node.rect()
+            x, y = rect.x(), rect.y()
+            self._draw_arrow(x + self.node_size, y + self.node_size / 2,
+                             x + self.spacing, y + self.node_size / 2, parent=node)
+        return node
+
+    def _draw_labels(self, count: int) -> None:
+        """Draw the "HEAD" and "NULL" labels and hide the last node's arrow."""
+        for i, node in enumerate(self._nodes):
+            node.childItems()[1].setVisible(i < count - 1)
+
+        head_label = QGraphicsSimpleTextItem("HEAD")
+        head_label.setBrush(QBrush(Qt.black))
+        head_label.setFont(self._label_font)
+        head_label.setPos(self.start_x, self.start_y - 40)
+        self._add_decor(head_label)
+
+        null_label = QGraphicsSimpleTextItem("NULL")
+        null_label.setBrush(QBrush(Qt.darkRed))
+        null_label.setFont(self._label_font)
+        null_x = self.start_x + (count * self.spacing)
+        null_label.setPos(null_x, self.start_y + 10)
+        self._add_decor(null_label)
 
     def _draw_node(self, value: Any, x: float, y: float,
                    highlighted: bool = False, success: bool = False) -> QGraphicsEllipseItem:
@@ -85,21 +100,23 @@ class LinkedListVisualizer(BaseVisualizer):
         circle.setBrush(self.get_node_brush(highlighted, success))
         self.scene.addItem(circle)
 
-        # Draw text
-        text = QGraphicsTextItem(str(value))
-        text.setDefaultTextColor(self.get_text_color())
-        text.setFont(QFont("Arial", 12, QFont.Bold))
+        # Draw text (a child, so it moves and is removed with the circle)
+        label = str(value)
+        text = QGraphicsSimpleTextItem(label, circle)
+        text.setBrush(self.get_text_brush())
+        text.setFont(self._node_font)
 
         # Center text in circle
-        text_rect = text.boundingRect()
-        text_x = x + (self.node_size - text_rect.width()) / 2
-        text_y = y + (self.node_size - text_rect.height()) / 2
+        text_w, text_h = self._text_size(label)
+        text_x = x + (self.node_size - text_w) / 2
+        text_y = y + (self.node_size - text_h) / 2
         text.setPos(text_x, text_y)
-        self.scene.addItem(text)
+        self._cache_node(circle, text)
 
         return circle
 
-    def _draw_arrow(self, x1: float, y1: float, x2: float, y2: float) -> None:
+    def _draw_arrow(self, x1: float, y1: float, x2: float, y2: float,
+                    parent: Optional[QGraphicsItem] = None) -> QGraphicsPathItem:
         """
         Draw an arrow between two points.
 
@@ -108,19 +125,27 @@ class LinkedListVisualizer(BaseVisualizer):
             y1: Start Y coordinate
             x2: End X coordinate
             y2: End Y coordinate
-        """
-        line = QGraphicsLineItem(QLineF(x1, y1, x2 - 10, y2))
-        line.setPen(self.get_arrow_pen())
-        self.scene.addItem(line)
+            parent: Item to attach the arrow to instead of the scene
 
-        # Draw arrowhead
+        Returns:
+            The arrow's path item (shaft and head in one path)
+        """
+        # Shaft and both head strokes share one path item instead of three
+        # separate line items
         arrow_size = 10
-        arrow_line1 = QGraphicsLineItem(QLineF(x2 - 10, y2, x2 - 10 - arrow_size, y2 - arrow_size / 2))
-        arrow_line2 = QGraphicsLineItem(QLineF(x2 - 10, y2, x2 - 10 - arrow_size, y2 + arrow_size / 2))
-        arrow_line1.setPen(self.get_arrow_pen())
-        arrow_line2.setPen(self.get_arrow_pen())
-        self.scene.addItem(arrow_line1)
-        self.scene.addItem(arrow_line2)
+        tip_x = x2 - 10
+        path = QPainterPath()
+        path.moveTo(x1, y1)
+        path.lineTo(tip_x, y2)
+        path.lineTo(tip_x - arrow_size, y2 - arrow_size / 2)
+        path.moveTo(tip_x, y2)
+        path.lineTo(tip_x - arrow_size, y2 + arrow_size / 2)
+
+        arrow = QGraphicsPathItem(path, parent)
+        arrow.setPen(self.get_arrow_pen())
+        if parent is None:
+            self.scene.addItem(arrow)
+        return arrow
 
     def animate_insert(self, linked_list: Any, value: Any, **kwargs) -> None:
         """
@@ -130,7 +155,8 @@ class LinkedListVisualizer(BaseVisualizer):
             linked_list: LinkedList instance
             value: Value being inserted
         """
-        self.draw(linked_list)
+        # Patch the nodes already on screen instead of redrawing them all
+        self.sync(linked_list)
 
         # Highlight the newly inserted node
         position = kwargs.get('position', -1)
@@ -138,7 +164,8 @@ class LinkedListVisualizer(BaseVisualizer):
             items = linked_list.to_list()
             if position < len(items):
                 x_pos = self.start_x + (position * self.spacing)
-                self._draw_node(items[position], x_pos, self.start_y, highlighted=True)
+                overlay = self._draw_node(items[position], x_pos, self.start_y, highlighted=True)
+                self._decor.append(overlay)
 
     def animate_delete(self, linked_list: Any, value: Any, **kwargs) -> None:
         """
@@ -157,42 +184,42 @@ class LinkedListVisualizer(BaseVisualizer):
         Args:
             linked_list: LinkedList instance
             value: Value being searched for
+            result: Position already returned by linked_list.search (optional)
         """
-        self.clear_scene()
-
         if linked_list.is_empty():
             self.draw(linked_list)
             return
 
-        items = linked_list.to_list()
-        found_index = -1
-
-        # Find the value
-        for i, item in enumerate(items):
-            if item == value:
-                found_index = i
-                break
+        # Patch the nodes already on screen; only the highlight and the
+        # message are drawn fresh
+        self.sync(linked_list)
 
-        # Draw all nodes
-        for i, item in enumerate(items):
-            x_pos = self.start_x + (i * self.spacing)
-            highlighted = (i == found_index)
-            success = (i == found_index)
-            self._draw_node(item, x_pos, self.start_y, highlighted, success)
-
-            # Draw arrows
-            if i < len(items) - 1:
-                self._draw_arrow(x_pos + self.node_size, self.start_y + self.node_size / 2,
-                               x_pos + self.spacing, self.start_y + self.node_size / 2)
+        # Find the value (unless the caller already searched)
+        if 'result' in kwargs:
+            position = kwargs['result']
+            found_index = -1 if position is None else position
+        else:
+            found_index = -1
+            for i, item in enumerate(linked_list):
+                if item == value:
+                    found_index = i
+                    break
+
+        # Highlight the hit
+        if 0 <= found_index < len(self._shown):
+            x_pos = self.start_x + (found_index * self.spacing)
+            overlay = self._draw_node(self._shown[found_index], x_pos, self.start_y,
+                                      highlighted=True, success=True)
+            self._decor.append(overlay)
 
         # Add result message
         if found_index >= 0:
-            msg = QGraphicsTextItem(f"Found at position {found_index}")
-            msg.setDefaultTextColor(Qt.darkGreen)
+            msg = QGraphicsSimpleTextItem(f"Found at position {found_index}")
+            msg.setBrush(QBrush(Qt.darkGreen))
         else:
-            msg = QGraphicsTextItem("Value not found")
-            msg.setDefaultTextColor(Qt.darkRed)
+            msg = QGraphicsSimpleTextItem("Value not found")
+            msg.setBrush(QBrush(Qt.darkRed))
 
-        msg.setFont(QFont("Arial", 12, QFont.Bold))
+        msg.setFont(self._node_font)
         msg.setPos(self.start_x + 200, self.start_y - 100)
-        self.scene.addItem(msg)
+        self._add_decor(msg)
@@ -1,12 +1,13 @@
 """Queue visualizer - displays queue horizontally (front to rear)."""
 from typing import Any
-from PyQt5.QtWidgets import QGraphicsScene, QGraphicsRectItem, QGraphicsTextItem
+from PyQt5.QtWidgets import QGraphicsScene, QGraphicsRectItem, QGraphicsSimpleTextItem
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
-from .base_visualizer import BaseVisualizer
+from PyQt5.QtGui import QBrush
+from .base_visualizer import TrackedVisualizer
+from ._fonts import font
 
 
-class QueueVisualizer(BaseVisualizer):
+class QueueVisualizer(TrackedVisualizer):
     """
     Visualizer for Queue data structure.
     Displays items horizontally with front on the left.
@@ -29,32 +30,38 @@ class QueueVisualizer(BaseVisualizer):
 
         if queue.is_empty():
             # Display "Empty Queue" message
-            text = QGraphicsTextItem("Queue is Empty")
-            text.setDefaultTextColor(self.get_text_color())
-            text.setFont(QFont("Arial", 14))
+            text = QGraphicsSimpleTextItem("Queue is Empty")
+            text.setBrush(self.get_text_brush())
+            text.setFont(font("Arial", 14))
             text.setPos(self.start_x + 200, self.start_y)
             self.scene.addItem(text)
             return
 
-        items = queue.to_list()
-        for i, value in enumerate(items):
-            x_pos = self.start_x + (i * self.spacing)
-            self._draw_node(value, x_pos, self.start_y)
-
-        # Draw "FRONT" and "REAR" labels
-        if items:
-            front_label = QGraphicsTextItem("FRONT")
-            front_label.setDefaultTextColor(Qt.black)
-            front_label.setFont(QFont("Arial", 10, QFont.Bold))
-            front_label.setPos(self.start_x, self.start_y - 40)
-            self.scene.addItem(front_label)
-
-            rear_label = QGraphicsTextItem("REAR")
-            rear_label.setDefaultTextColor(Qt.black)
-            rear_label.setFont(QFont("Arial", 10, QFont.Bold))
-            rear_x = self.start_x + ((len(items) - 1) * self.spacing)
-            rear_label.setPos(rear_x + 10, self.start_y + self.node_size + 10)
-            self.scene.addItem(rear_label)
+        with self.bulk_update():
+            self._nodes = []
+            track = self._track_node
+            for i, value in enumerate(queue):
+                track(value, i)
+            self._draw_labels(queue.size())
+
+    def _node_pos(self, index: int):
+        """Return the (x, y) of the node at index (0 is the front)."""
+        return self.start_x + (index * self.spacing), self.start_y
+
+    def _draw_labels(self, count: int) -> None:
+        """Draw the "FRONT" and "REAR" labels."""
+        front_label = QGraphicsSimpleTextItem("FRONT")
+        front_label.setBrush(QBrush(Qt.black))
+        front_label.setFont(self._label_font)
+        front_label.setPos(self.start_x, self.start_y - 40)
+        self._add_decor(front_label)
+
+        rear_label = QGraphicsSimpleTextItem("REAR")
+        rear_label.setBrush(QBrush(Qt.black))
+        rear_label.setFont(self._label_font)
+        rear_x = self.start_x + ((count - 1) * self.spacing)
+        rear_label.setPos(rear_x + 10, self.start_y + self.node_size + 10)
+        self._add_decor(rear_label)
 
     def _draw_node(self, value: Any, x: float, y: float,
                    highlighted: bool = False, success: bool = False) -> QGraphicsRectItem:
@@ -77,17 +84,18 @@ class QueueVisualizer(BaseVisualizer):
         rect.setBrush(self.get_node_brush(highlighted, success))
         self.scene.addItem(rect)
 
-        # Draw text
-        text = QGraphicsTextItem(str(value))
-        text.setDefaultTextColor(self.get_text_color())
-        text.setFont(QFont("Arial", 12, QFont.Bold))
+        # Draw text (a child, so it moves and is removed with the rectangle)
+        label = str(value)
+        text = QGraphicsSimpleTextItem(label, rect)
+        text.setBrush(self.get_text_brush())
+        text.setFont(self._node_font)
 
         # Center text in rectangle
-        text_rect = text.boundingRect()
-        text_x = x + (self.node_size - text_rect.width()) / 2
-        text_y = y + (self.node_size - text_rect.height()) / 2
+        text_w, text_h = self._text_size(label)
+        text_x = x + (self.node_size - text_w) / 2
+        text_y = y + (self.node_size - text_h) / 2
         text.setPos(text_x, text_y)
-        self.scene.addItem(text)
+        self._cache_node(rect, text)
 
         return rect
 
@@ -99,14 +107,15 @@ class QueueVisualizer(BaseVisualizer):
             queue: Queue instance
             value: Value being enqueued
         """
-        self.draw(queue)
+        # Patch the nodes already on screen; only the enqueued node is added
+        self.sync(queue)
 
         # Highlight the newly added rear element
         if not queue.is_empty():
-            items = queue.to_list()
-            rear_index = len(items) - 1
+            rear_index = queue.size() - 1
             x_pos = self.start_x + (rear_index * self.spacing)
-            self._draw_node(value, x_pos, self.start_y, highlighted=True)
+            overlay = self._draw_node(value, x_pos, self.start_y, highlighted=True)
+            self._decor.append(overlay)
 
     def animate_delete(self, queue: Any, value: Any, **kwargs) -> None:
         """
@@ -126,36 +135,33 @@ class QueueVisualizer(BaseVisualizer):
             queue: Queue instance
             value: Value being searched for
         """
-        self.clear_scene()
-
         if queue.is_empty():
             self.draw(queue)
             return
 
-        items = queue.to_list()
-        found_index = -1
+        # Patch the nodes already on screen; only the highlight and the
+        # message are drawn fresh
+        self.sync(queue)
 
         # Find the value
-        for i, item in enumerate(items):
+        found_index = -1
+        for i, item in enumerate(queue):
             if item == value:
                 found_index = i
                 break
 
-        # Draw all nodes
-        for i, item in enumerate(items):
-            x_pos = self.start_x + (i * self.spacing)
-            highlighted = (i == found_index)
-            success = (i == found_index)
-            self._draw_node(item, x_pos, self.start_y, highlighted, success)
-
-        # Add result message
+        # Highlight the hit and add result message
         if found_index >= 0:
-            msg = QGraphicsTextItem(f"Found at position {found_index}")
-            msg.setDefaultTextColor(Qt.darkGreen)
+            x_pos = self.start_x + (found_index * self.spacing)
+            overlay = self._draw_node(self._shown[found_index], x_pos, self.start_y,
+                                      highlighted=True, success=True)
+            self._decor.append(overlay)
+            msg = QGraphicsSimpleTextItem(f"Found at position {found_index}")
+            msg.setBrush(QBrush(Qt.darkGreen))
         else:
-            msg = QGraphicsTextItem("Value not found")
-            msg.setDefaultTextColor(Qt.darkRed)
+            msg = QGraphicsSimpleTextItem("Value not found")
+            msg.setBrush(QBrush(Qt.darkRed))
 
-        msg.setFont(QFont("Arial", 12, QFont.Bold))
+        msg.setFont(self._node_font)
         msg.setPos(self.start_x + 200, self.start_y - 100)
-        self.scene.addItem(msg)
+        self._add_decor(msg)
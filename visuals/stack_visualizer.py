@@ -1,12 +1,14 @@
 """Stack visualizer - displays stack vertically (bottom to top)."""
 from typing import Any
-from PyQt5.QtWidgets import QGraphicsScene, QGraphicsRectItem, QGraphicsTextItem, QGraphicsItem
+from PyQt5.QtWidgets import (QGraphicsScene, QGraphicsRectItem, QGraphicsSimpleTextItem,
+                             QGraphicsItem)
 from PyQt5.QtCore import QPointF, QRectF, Qt
-from PyQt5.QtGui import QFont
-from .base_visualizer import BaseVisualizer
+from PyQt5.QtGui import QBrush
+from .base_visualizer import TrackedVisualizer
+from ._fonts import font
 
 
-class StackVisualizer(BaseVisualizer):
+class StackVisualizer(TrackedVisualizer):
     """
     Visualizer for Stack data structure.
     Displays items vertically with top of stack at the top.
@@ -29,26 +31,32 @@ class StackVisualizer(BaseVisualizer):
 
         if stack.is_empty():
             # Display "Empty Stack" message
-            text = QGraphicsTextItem("Stack is Empty")
-            text.setDefaultTextColor(self.get_text_color())
-            text.setFont(QFont("Arial", 14))
+            text = QGraphicsSimpleTextItem("Stack is Empty")
+            text.setBrush(self.get_text_brush())
+            text.setFont(font("Arial", 14))
             text.setPos(self.start_x - 50, self.start_y - 250)
             self.scene.addItem(text)
             return
 
-        items = stack.to_list()
-        for i, value in enumerate(items):
-            y_pos = self.start_y - (i * self.spacing)
-            self._draw_node(value, self.start_x, y_pos)
-
-        # Draw "TOP" label
-        if items:
-            top_label = QGraphicsTextItem("TOP →")
-            top_label.setDefaultTextColor(Qt.black)
-            top_label.setFont(QFont("Arial", 12, QFont.Bold))
-            top_y = self.start_y - ((len(items) - 1) * self.spacing)
-            top_label.setPos(self.start_x - 80, top_y + 10)
-            self.scene.addItem(top_label)
+        with self.bulk_update():
+            self._nodes = []
+            track = self._track_node
+            for i, value in enumerate(stack):
+                track(value, i)
+            self._draw_labels(stack.size())
+
+    def _node_pos(self, index: int):
+        """Return the (x, y) of the node at index (0 is the bottom)."""
+        return self.start_x, self.start_y - (index * self.spacing)
+
+    def _draw_labels(self, count: int) -> None:
+        """Draw the "TOP" label beside the top node."""
+        top_label = QGraphicsSimpleTextItem("TOP →")
+        top_label.setBrush(QBrush(Qt.black))
+        top_label.setFont(self._node_font)
+        top_y = self.start_y - ((count - 1) * self.spacing)
+        top_label.setPos(self.start_x - 80, top_y + 10)
+        self._add_decor(top_label)
 
     def _draw_node(self, value: Any, x: float, y: float,
                    highlighted: bool = False, success: bool = False) -> QGraphicsRectItem:
@@ -71,17 +79,18 @@ class StackVisualizer(BaseVisualizer):
         rect.setBrush(self.get_node_brush(highlighted, success))
         self.scene.addItem(rect)
 
-        # Draw text
-        text = QGraphicsTextItem(str(value))
-        text.setDefaultTextColor(self.get_text_color())
-        text.setFont(QFont("Arial", 12, QFont.Bold))
+        # Draw text (a child, so it moves and is removed with the rectangle)
+        label = str(value)
+        text = QGraphicsSimpleTextItem(label, rect)
+        text.setBrush(self.get_text_brush())
+        text.setFont(self._node_font)
 
         # Center text in rectangle
-        text_rect = text.boundingRect()
-        text_x = x + (self.node_size * 2 - text_rect.width()) / 2
-        text_y = y + (self.node_size - text_rect.height()) / 2
+        text_w, text_h = self._text_size(label)
+        text_x = x + (self.node_size * 2 - text_w) / 2
+        text_y = y + (self.node_size - text_h) / 2
         text.setPos(text_x, text_y)
-        self.scene.addItem(text)
+        self._cache_node(rect, text)
 
         return rect
 
@@ -93,14 +102,15 @@ class StackVisualizer(BaseVisualizer):
             stack: Stack instance
             value: Value being pushed
         """
-        self.draw(stack)
+        # Patch the nodes already on screen; only the pushed node is added
+        self.sync(stack)
 
         # Highlight the newly added top element
         if not stack.is_empty():
-            items = stack.to_list()
-            top_index = len(items) - 1
+            top_index = stack.size() - 1
             y_pos = self.start_y - (top_index * self.spacing)
-            self._draw_node(value, self.start_x, y_pos, highlighted=True)
+            overlay = self._draw_node(value, self.start_x, y_pos, highlighted=True)
+            self._decor.append(overlay)
 
     def animate_delete(self, stack: Any, value: Any, **kwargs) -> None:
         """
@@ -120,36 +130,33 @@ class StackVisualizer(BaseVisualizer):
             stack: Stack instance
             value: Value being searched for
         """
-        self.clear_scene()
-
         if stack.is_empty():
             self.draw(stack)
             return
 
-        items = stack.to_list()
-        found_index = -1
+        # Patch the nodes already on screen; only the highlight and the
+        # message are drawn fresh
+        self.sync(stack)
 
         # Find the value
-        for i, item in enumerate(items):
+        found_index = -1
+        for i, item in enumerate(stack):
             if item == value:
                 found_index = i
                 break
 
-        # Draw all nodes
-        for i, item in enumerate(items):
-            y_pos = self.start_y - (i * self.spacing)
-            highlighted = (i == found_index)
-            success = (i == found_index)
-            self._draw_node(item, self.start_x, y_pos, highlighted, success)
-
-        # Add result message
+        # Highlight the hit and add result message
         if found_index >= 0:
-            msg = QGraphicsTextItem(f"Found at position {found_index}")
-            msg.setDefaultTextColor(Qt.darkGreen)
+            y_pos = self.start_y - (found_index * self.spacing)
+            overlay = self._draw_node(self._shown[found_index], self.start_x, y_pos,
+                                      highlighted=True, success=True)
+            self._decor.append(overlay)
+            msg = QGraphicsSimpleTextItem(f"Found at position {found_index}")
+            msg.setBrush(QBrush(Qt.darkGreen))
         else:
-            msg = QGraphicsTextItem("Value not found")
-            msg.setDefaultTextColor(Qt.darkRed)
+            msg = QGraphicsSimpleTextItem("Value not found")
+            msg.setBrush(QBrush(Qt.darkRed))
 
-        msg.setFont(QFont("Arial", 12, QFont.Bold))
+        msg.setFont(self._node_font)
         msg.setPos(self.start_x + 150, self.start_y - 250)
-        self.scene.addItem(msg)
+        self._add_decor(msg)